@@ -1,5 +1,6 @@
-from fastapi import FastAPI, APIRouter, Request, HTTPException
+from fastapi import FastAPI, APIRouter, Request, HTTPException, Query
 from fastapi.responses import PlainTextResponse
+from pydantic import ValidationError
 
 from services.backend_validators_registry import discover_validators_with_metadata
 from services.frontend_validators_registry import fetch_frontend_validators, fetch_frontend_validator_source, fetch_frontend_base_validators_source
@@ -7,10 +8,13 @@ from services.frontend_validators_registry import fetch_frontend_validators, fet
 from schemas.validators import DatasetGroupValidationRequest, ValidatorDetail, ValidatorType, DataItem, DatasetValidationRequest
 from core.config import settings
 from middlewares.metrics_middleware import VALIDATION_RESULTS, VALIDATION_ITEMS, VALIDATION_ERRORS, VALIDATION_DURATION
-from typing import Any
+from typing import Any, AsyncIterator
+from utils.ndjson import iter_ndjson_lines
 from validators.base_geval_validator import DynamicGEvalValidator, request_headers_vars
+from validators.base_validator import MessagesItem, ParsedDataset
 from validators.gate7_automatic_quality_grading.geval_rubric_validator import GEvalRubricValidator as DynamicRubricEvalValidator
 import asyncio
+import json
 import time
 import structlog
 
@@ -62,8 +66,7 @@ async def get_validator_source(source: str, request_: Request):
                 return await fetch_frontend_validator_source(source, "backend")
     raise HTTPException(status_code=404, detail="Validator not found")
 
-async def _validate(gates: list[str], dataset: list[DataItem], options: dict[str, Any], request_: Request):
-    proxy_request_headers(request_)
+def _check_gates(gates: list[str], request_: Request):
     unknown = [g for g in gates if g not in request_.app.state.backend_validators_dict]
     if unknown:
         raise HTTPException(
@@ -71,14 +74,13 @@ async def _validate(gates: list[str], dataset: list[DataItem], options: dict[str
             detail=f"Unknown gates requested: {', '.join(unknown)}"
         )
 
-    raw_dataset = [item.model_dump() if hasattr(item, "model_dump") else item.dict() for item in dataset]
-
+async def _run_gates(gates: list[str], dataset: ParsedDataset, options: dict[str, Any], request_: Request) -> list[dict]:
     async def _run_gate(gate: str):
         start = time.time()
         validator = request_.app.state.backend_validators_dict[gate](options)
-        result = await validator.validate(raw_dataset)
+        result = await validator.validate(dataset)
         VALIDATION_DURATION.labels(gate=gate).observe(time.time() - start)
-        VALIDATION_ITEMS.labels(gate=gate).inc(len(raw_dataset))
+        VALIDATION_ITEMS.labels(gate=gate).inc(len(dataset))
         status = result.get("status", "failed")
         VALIDATION_RESULTS.labels(gate=gate, status=status).inc()
         if status == "failed" and isinstance(result.get("errors"), list):
@@ -87,8 +89,9 @@ async def _validate(gates: list[str], dataset: list[DataItem], options: dict[str
                 VALIDATION_ERRORS.labels(gate=gate, code=code).inc()
         return result
 
-    results = await asyncio.gather(*(_run_gate(g) for g in gates))
+    return await asyncio.gather(*(_run_gate(g) for g in gates))
 
+def _merge_results(gates: list[str], results: list[dict]) -> dict:
     all_errors = []
     all_info = []
     for result in results:
@@ -107,6 +110,117 @@ async def _validate(gates: list[str], dataset: list[DataItem], options: dict[str
         response["info"] = all_info
     return response
 
+async def _validate(gates: list[str], dataset: list[DataItem], options: dict[str, Any], request_: Request):
+    proxy_request_headers(request_)
+    _check_gates(gates, request_)
+
+    # Parse once, share the immutable view across all gates
+    parsed_dataset = ParsedDataset.from_models(dataset)
+
+    results = await _run_gates(gates, parsed_dataset, options, request_)
+    return _merge_results(gates, results)
+
+def _remap_indexes(result: dict, line_indexes: list[int]) -> dict:
+    """Translate chunk-local ValidationDetail.index values to global line numbers."""
+    for key in ("errors", "info"):
+        entries = result.get(key)
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            if isinstance(entry, dict) and isinstance(entry.get("index"), int):
+                entry["index"] = line_indexes[entry["index"]]
+    return result
+
+async def _validate_stream(
+    gates: list[str],
+    lines: AsyncIterator[tuple[int, bytes]],
+    options: dict[str, Any],
+    chunk_size: int,
+    request_: Request,
+    max_errors: int = 1000,
+) -> dict:
+    """Feed NDJSON lines to the gates in bounded chunks.
+
+    Only one chunk of parsed items is alive at a time; lines that are not
+    valid JSON or not a valid item are reported against their line number
+    and never reach the gates. Memory stays bounded in the number of errors
+    too: the first `max_errors` errors (and info entries) are returned in
+    full, the rest only in `error_counts` (per code) and `error_count`.
+    Dataset-level info entries (index None) repeat on every chunk and are kept
+    once per gate and code. A gate that crashes returns its error as a string;
+    it is reported as one gate_exception entry per chunk.
+    """
+    kept: dict[str, list[dict]] = {"errors": [], "info": []}
+    error_counts: dict[str, int] = {}
+    items: list[MessagesItem] = []
+    line_indexes: list[int] = []
+    total = 0
+    truncated = False
+    seen_dataset_info: set[tuple[str, str]] = set()
+
+    def _collect(key: str, entries: list) -> None:
+        nonlocal truncated
+        if key == "errors":
+            for entry in entries:
+                code = entry.get("code", "unspecified") if isinstance(entry, dict) else "unspecified"
+                error_counts[code] = error_counts.get(code, 0) + 1
+        room = max_errors - len(kept[key])
+        if len(entries) > room:
+            truncated = True
+        kept[key].extend(entries[:max(room, 0)])
+
+    async def _flush():
+        chunk_results = await _run_gates(gates, ParsedDataset(items), options, request_)
+        for gate, result in zip(gates, chunk_results):
+            logger.debug(result)
+            _remap_indexes(result, line_indexes)
+            if result["status"] == "failed":
+                errors = result["errors"]
+                if not isinstance(errors, list):
+                    errors = [{"index": None, "error": str(errors), "code": "gate_exception"}]
+                _collect("errors", errors)
+            if "info" in result:
+                info = []
+                for entry in result["info"]:
+                    if isinstance(entry, dict) and entry.get("index") is None:
+                        key = (gate, entry.get("code", "unspecified"))
+                        if key in seen_dataset_info:
+                            continue
+                        seen_dataset_info.add(key)
+                    info.append(entry)
+                _collect("info", info)
+        items.clear()
+        line_indexes.clear()
+
+    async for line_no, line in lines:
+        total += 1
+        try:
+            items.append(MessagesItem.model_validate(json.loads(line)))
+        except json.JSONDecodeError as e:
+            _collect("errors", [{"index": line_no, "error": f"Invalid JSON: {e}", "code": "invalid_json"}])
+            continue
+        except ValidationError as e:
+            _collect("errors", [{"index": line_no, "error": str(e), "code": "schema_validation"}])
+            continue
+        line_indexes.append(line_no)
+        if len(items) >= chunk_size:
+            await _flush()
+    if items:
+        await _flush()
+
+    response = {
+        "status": "ok" if not error_counts else "failed",
+        "validated_gates": gates,
+        "errors": kept["errors"],
+        "items": total,
+        "error_count": sum(error_counts.values()),
+        "error_counts": error_counts,
+        "truncated": truncated,
+    }
+    if kept["info"]:
+        response["info"] = kept["info"]
+    return response
+
 def proxy_request_headers(request: Request):
     headers = {"X-Group-ID": request.headers.get("X-Group-ID", "checkr/validators")}
     request_id = request.headers.get("X-Request-ID")
@@ -122,6 +236,39 @@ async def validate_dataset(source: str, request: DatasetValidationRequest, reque
 async def validate_dataset_on_several_gates(request: DatasetGroupValidationRequest, request_: Request):
     return await _validate(request.gates, request.dataset, request.options, request_)
 
+@router.post("/stream/validate")
+async def validate_dataset_stream(
+    request_: Request,
+    gates: list[str] = Query(...),
+    options: str | None = Query(None, description="JSON-encoded options dict"),
+    chunk_size: int = Query(1000, ge=1, le=100_000),
+    max_errors: int = Query(1000, ge=0, le=100_000, description="Errors / info entries returned in full"),
+):
+    """Validate an application/x-ndjson body (optionally gzip) without loading it whole.
+
+    One item per line. ValidationDetail.index is the 0-based line number.
+    Beyond max_errors, errors are only counted (error_counts, truncated=true).
+    """
+    proxy_request_headers(request_)
+    _check_gates(gates, request_)
+    validators_dict = request_.app.state.backend_validators_dict
+    scoped = [g for g in gates if getattr(validators_dict[g], "dataset_scoped", False)]
+    if scoped:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Gates need the whole dataset and cannot be streamed: {', '.join(scoped)}"
+        )
+    try:
+        parsed_options = json.loads(options) if options else {}
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid options JSON: {e}")
+    if not isinstance(parsed_options, dict):
+        raise HTTPException(status_code=400, detail="options must be a JSON object")
+
+    gzip = True if request_.headers.get("content-encoding", "").lower() == "gzip" else None
+    lines = iter_ndjson_lines(request_.stream(), gzip=gzip)
+    return await _validate_stream(gates, lines, parsed_options, chunk_size, request_, max_errors)
+
 @router.post("/submit")
 async def submit(request: Request):
     body = await request.json()
@@ -132,7 +279,16 @@ async def submit(request: Request):
 async def g_eval_handler(req: DatasetValidationRequest, request_: Request):
     proxy_request_headers(request_)
     validator = DynamicGEvalValidator(options=req.options)
-    return {"status": "passed" if not (errors := await validator._validate(req.dataset)) else "failed", "errors": [e.model_dump() for e in errors]}
+    errors = await validator._validate(req.dataset)
+    failures = [e for e in errors if e.severity == "error"]
+    info = [e for e in errors if e.severity == "info"]
+    response: dict = {
+        "status": "passed" if not failures else "failed",
+        "errors": [e.model_dump() for e in failures],
+    }
+    if info:
+        response["info"] = [e.model_dump() for e in info]
+    return response
 
 @router.post("/rubric-eval")
 async def rubric_eval_handler(req: DatasetValidationRequest, request_: Request):
@@ -1,8 +1,9 @@
 
 # core/app.py
 import asyncio
+import hmac
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Header, HTTPException
 from fastapi.responses import FileResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
@@ -23,6 +24,18 @@ async def lifespan(app: FastAPI):
     logger.info("Application startup...")
     await init_validators(app)
 
+    # Pooled LLM client shared by all G-Eval validators (keep-alive across requests)
+    from services.llm_client import open_llm_clients
+    from utils.yaml import load_and_expand_yaml
+    try:
+        open_llm_clients(load_and_expand_yaml(settings.llm_config_path).get("geval", {}))
+    except Exception as exc:
+        logger.warning("LLM client warm-up skipped", error=str(exc))
+
+    # Health snapshot refreshed in the background; /health and /ready answer from memory
+    from services.health import get_health_monitor
+    app.state.health_task = asyncio.create_task(get_health_monitor().run())
+
     # Async job queue — only when Redis is configured
     if settings.redis_url:
         import redis.asyncio as aioredis
@@ -42,6 +55,19 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Application shutdown...")
+    from services.process_pool import shutdown as shutdown_process_pool
+    from services.llm_client import close_llm_clients
+    from services.llm_cache import close_llm_cache
+    health_task: asyncio.Task = getattr(app.state, "health_task", None)
+    if health_task and not health_task.done():
+        health_task.cancel()
+        try:
+            await health_task
+        except asyncio.CancelledError:
+            pass
+    shutdown_process_pool()
+    await close_llm_clients()
+    await close_llm_cache()
     if settings.redis_url:
         task: asyncio.Task = getattr(app.state, "worker_task", None)
         if task and not task.done():
@@ -55,6 +81,13 @@ async def lifespan(app: FastAPI):
             await redis.aclose()
         logger.info("Redis connection closed")
 
+def require_admin_token(x_admin_token: str | None = Header(None)) -> None:
+    """Guard for mutating admin endpoints: X-Admin-Token must match CHECKR_ADMIN_TOKEN."""
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (CHECKR_ADMIN_TOKEN is not set)")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     app = FastAPI(title=settings.app_name, root_path=settings.root_path, debug=settings.debug, lifespan=lifespan)
@@ -86,6 +119,39 @@ def create_app() -> FastAPI:
     async def get_metrics():
         return await metrics()
 
+    @app.post("/config/reload", dependencies=[Depends(require_admin_token)])
+    async def reload_config():
+        """Re-read the YAML configs (llm.yaml, provider.yaml) and rebuild what was built from them.
+
+        Edits are also picked up on their own when the file's mtime changes; this
+        endpoint additionally applies changed ${VAR} environment values and
+        rebuilds the YAML-derived singletons: LLM rate limiter (rate_limit), circuit
+        breaker (circuit_breaker, which also closes it), validator providers, and
+        the pooled client for the new geval api_base / api_key. The health monitor
+        and G-Eval / GABRIEL validators read llm.yaml on every use and need nothing.
+
+        CHECKR_* settings are read once at startup and need a restart, including
+        client pool limits and timeouts, cache backends, health intervals and
+        worker concurrency.
+        """
+        from services.frontend_validators_registry import clear_provider_cache
+        from services.llm_breaker import reset_llm_breaker
+        from services.llm_client import open_llm_clients
+        from services.llm_limiter import reset_llm_limiter
+        from utils.yaml import load_and_expand_yaml, reload_yaml_cache
+
+        dropped = reload_yaml_cache()
+        reset_llm_limiter()
+        reset_llm_breaker()
+        clear_provider_cache()
+        try:
+            # clients are keyed by (api_base, api_key); old ones stay for in-flight calls
+            open_llm_clients(load_and_expand_yaml(settings.llm_config_path).get("geval", {}))
+        except Exception as exc:
+            logger.warning("LLM client warm-up skipped", error=str(exc))
+        logger.info("Config cache reloaded", files=dropped)
+        return {"status": "ok", "reloaded": dropped}
+
     @app.get("/livez")
     async def livez():
         """Liveness probe — process is alive, no dependency checks."""
@@ -93,70 +159,29 @@ def create_app() -> FastAPI:
 
     @app.get("/ready")
     async def ready():
-        """Readiness probe — returns 200 if LLM backend is reachable, 503 otherwise."""
-        import asyncio
-        import httpx
+        """Readiness probe — 503 while the LLM circuit is open or the last probe failed, 200 otherwise.
+
+        Answered from the cached snapshot (services/health.py); never calls the backend.
+        """
         from starlette.responses import Response as StarletteResponse
 
-        from utils.yaml import load_and_expand_yaml
+        from services.health import get_health_monitor
 
-        try:
-            llm_cfg = load_and_expand_yaml(settings.llm_config_path)
-            api_base = llm_cfg.get("geval", {}).get("api_base", "")
-            if api_base:
-                models_url = f"{api_base}/models"
-                async with httpx.AsyncClient(timeout=3, verify=settings.http_verify_ssl) as client:
-                    resp = await asyncio.wait_for(
-                        client.get(models_url),
-                        timeout=5,
-                    )
-                    resp.raise_for_status()
-        except Exception:
-            return StarletteResponse(status_code=503)
-
-        return StarletteResponse(status_code=200)
+        monitor = get_health_monitor()
+        age = monitor.age
+        return StarletteResponse(
+            status_code=200 if monitor.ready() else 503,
+            headers={"X-Health-Age": f"{age:.3f}"} if age is not None else None,
+        )
 
     @app.get("/health")
     async def health_check():
-        """Full health status with component details — for dashboards and monitoring."""
-        import asyncio
-        import httpx
+        """Full health status with component details — for dashboards and monitoring.
 
-        from utils.yaml import load_and_expand_yaml
+        Served from the background-refreshed snapshot; `age_seconds` is how old it is.
+        """
+        from services.health import get_health_monitor
 
-        components: dict[str, str] = {}
-        details: dict[str, str] = {}
-
-        # Probe the LLM backend (yallmp) used by G-Eval / GABRIEL validators
-        try:
-            llm_cfg = load_and_expand_yaml(settings.llm_config_path)
-            api_base = llm_cfg.get("geval", {}).get("api_base", "")
-            if api_base:
-                # Hit yallmp's models endpoint as a lightweight probe
-                models_url = f"{api_base}/models"
-                async with httpx.AsyncClient(timeout=3, verify=settings.http_verify_ssl) as client:
-                    resp = await asyncio.wait_for(
-                        client.get(models_url),
-                        timeout=5,
-                    )
-                    resp.raise_for_status()
-                components["llm_backend"] = "ok"
-            else:
-                components["llm_backend"] = "disabled"
-        except Exception as exc:
-            components["llm_backend"] = "degraded"
-            details["llm_backend"] = str(exc)
-
-        enabled = {k: v for k, v in components.items() if v != "disabled"}
-        status = "ok" if all(v == "ok" for v in enabled.values()) else "degraded"
-
-        result: dict = {
-            "status": status,
-            "version": settings.version,
-            "components": components,
-        }
-        if details:
-            result["details"] = details
-        return result
+        return get_health_monitor().snapshot()
 
     return app
@@ -17,6 +17,9 @@ class AppSettings(BaseSettings):
 
     version: str = "0.1.0"
 
+    # admin endpoints (POST /config/reload)
+    admin_token: str | None = None  # CHECKR_ADMIN_TOKEN (sent as X-Admin-Token; unset = admin endpoints disabled)
+
     # validators provider
     provider_name: str = "mock"
     provider_config_path: str = "config/provider.yaml"
@@ -24,6 +27,34 @@ class AppSettings(BaseSettings):
 
     # llm
     llm_config_path: str = "config/llm.yaml"
+    # pooled LLM HTTP client, shared process-wide (services/llm_client.py)
+    llm_max_connections: int = 100             # CHECKR_LLM_MAX_CONNECTIONS
+    llm_max_keepalive_connections: int = 20    # CHECKR_LLM_MAX_KEEPALIVE_CONNECTIONS
+    llm_keepalive_expiry: float = 30.0         # CHECKR_LLM_KEEPALIVE_EXPIRY (seconds)
+    llm_timeout: float = 600.0                 # CHECKR_LLM_TIMEOUT (seconds, per HTTP request)
+    # LLM response cache for temperature-0 judge calls (services/llm_cache.py)
+    llm_cache_backend: str = "off"             # CHECKR_LLM_CACHE_BACKEND (off | memory | sqlite | redis; opt-in)
+    llm_cache_size: int = 100_000              # CHECKR_LLM_CACHE_SIZE (entries, memory/sqlite)
+    llm_cache_ttl: int = 30 * 86400            # CHECKR_LLM_CACHE_TTL (seconds)
+    llm_cache_path: str = "llm_cache.sqlite3"  # CHECKR_LLM_CACHE_PATH (sqlite backend)
+    llm_cache_redis_url: str | None = None     # CHECKR_LLM_CACHE_REDIS_URL (redis backend)
+
+    # cached /health and /ready snapshot (services/health.py)
+    health_refresh_interval: float = 15.0  # CHECKR_HEALTH_REFRESH_INTERVAL (seconds between background probes)
+    health_probe_timeout: float = 3.0      # CHECKR_HEALTH_PROBE_TIMEOUT (seconds, per probe)
+
+    # persistent, resumable GABRIEL save_dir (services/gabriel_workdir.py)
+    gabriel_work_dir: str | None = None    # CHECKR_GABRIEL_WORK_DIR (unset = temp dir per run, nothing resumable)
+    gabriel_work_dir_max_mb: int = 2048    # CHECKR_GABRIEL_WORK_DIR_MAX_MB (LRU eviction above this size)
+
+    # process pool for validators declaring `execution: process`
+    process_pool_workers: int = 0         # CHECKR_PROCESS_POOL_WORKERS (0 = os.cpu_count())
+    process_pool_min_chunk: int = 500     # CHECKR_PROCESS_POOL_MIN_CHUNK (items per worker task)
+
+    # per-item result cache for deterministic gates
+    result_cache_size: int = 0                 # CHECKR_RESULT_CACHE_SIZE (in-process LRU entries, 0 = off; opt-in)
+    result_cache_redis_url: str | None = None  # CHECKR_RESULT_CACHE_REDIS_URL (optional shared tier)
+    result_cache_ttl: int = 7 * 86400          # CHECKR_RESULT_CACHE_TTL (seconds, Redis tier)
 
     # async job queue (Redis)
     # When unset checkr operates in sync mode and /jobs/validate behaves
@@ -32,6 +63,7 @@ class AppSettings(BaseSettings):
     job_ttl: int = 86400                  # CHECKR_JOB_TTL  (seconds, default 24 h)
     job_queue_key: str = "checkr:queue"   # CHECKR_JOB_QUEUE_KEY
     job_key_prefix: str = "checkr:jobs:"  # CHECKR_JOB_KEY_PREFIX
+    worker_concurrency: int = 4           # CHECKR_WORKER_CONCURRENCY (jobs one worker runs at once)
 
     model_config = SettingsConfigDict(env_prefix="CHECKR_", env_file=".env", env_file_encoding="utf-8", extra='allow')
 
@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
@@ -41,6 +41,78 @@ VALIDATION_DURATION = Histogram(
     ["gate"]
 )
 
+# Per-item result cache (services/result_cache.py)
+RESULT_CACHE_HITS = Counter(
+    "checkr_result_cache_hits_total",
+    "Per-item validation results served from cache",
+    ["gate", "tier"]
+)
+
+RESULT_CACHE_MISSES = Counter(
+    "checkr_result_cache_misses_total",
+    "Per-item validation results that had to be computed",
+    ["gate"]
+)
+
+# LLM judge response cache (services/llm_cache.py)
+LLM_CACHE_HITS = Counter(
+    "checkr_llm_cache_hits_total",
+    "LLM judge calls answered from the response cache",
+    ["backend", "model"]
+)
+
+LLM_CACHE_MISSES = Counter(
+    "checkr_llm_cache_misses_total",
+    "Cacheable LLM judge calls that went to the LLM backend",
+    ["backend", "model"]
+)
+
+# LLM judge calls per cascade tier ("fast" cheap model, "judge" primary model)
+LLM_JUDGE_CALLS = Counter(
+    "checkr_llm_judge_calls_total",
+    "LLM judge calls by gate, cascade tier and model",
+    ["gate", "tier", "model"]
+)
+
+LLM_JUDGE_DURATION = Histogram(
+    "checkr_llm_judge_duration_seconds",
+    "LLM judge call latency by gate and cascade tier",
+    ["gate", "tier"]
+)
+
+# Process-wide LLM rate limiter (services/llm_limiter.py)
+LLM_QUEUE_WAIT = Histogram(
+    "checkr_llm_queue_wait_seconds",
+    "Time an LLM call waited for the global rate limiter",
+    ["source"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+
+LLM_IN_FLIGHT = Gauge(
+    "checkr_llm_in_flight",
+    "LLM calls currently holding a rate limiter slot",
+    ["source"]
+)
+
+# LLM call retries and hedged duplicates (services/llm_retry.py)
+LLM_RETRIES = Counter(
+    "checkr_llm_retries_total",
+    "LLM calls retried after a timeout or transient error",
+    ["source", "reason"]
+)
+
+LLM_HEDGES = Counter(
+    "checkr_llm_hedges_total",
+    "Hedged duplicate LLM requests: sent, and won (answered before the original)",
+    ["source", "outcome"]
+)
+
+# LLM backend circuit breaker (services/llm_breaker.py)
+LLM_CIRCUIT_STATE = Gauge(
+    "checkr_llm_circuit_state",
+    "LLM backend circuit breaker state: 0 closed, 1 half-open, 2 open",
+)
+
 # Middleware for collecting metrics
 class PrometheusMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
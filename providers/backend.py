@@ -1,4 +1,3 @@
-import yaml
 from pathlib import Path
 from core.config import settings
 from providers.base import BaseValidatorProvider
@@ -10,6 +9,7 @@ import warnings
 
 import importlib
 from utils.frontmatter import extract_frontmatter_from_file, render_frontmatter
+from utils.yaml import load_and_expand_yaml
 from validators.base_validator import BaseValidator
 
 logger = structlog.get_logger()
@@ -18,8 +18,7 @@ class BackendValidatorProvider(BaseValidatorProvider):
 
     def __init__(self, config_path: str = settings.provider_config_path):
         self.source_prefix = "backend"
-        with open(config_path, "r") as f:
-            self.config = yaml.safe_load(f)[self.source_prefix]
+        self.config = load_and_expand_yaml(config_path)[self.source_prefix]
 
         self.base_path = self.config.get("path", "")
 
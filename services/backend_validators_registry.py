@@ -5,6 +5,7 @@ from typing import Type, List, Tuple
 from validators.base_validator import BaseValidator
 from schemas.validators import ValidatorDetail, ValidatorType
 from utils.frontmatter import extract_frontmatter_from_file
+from services.process_pool import register_preload
 import structlog
 
 logger = structlog.get_logger()
@@ -49,6 +50,11 @@ def discover_validators_with_metadata() -> List[Tuple[Type[BaseValidator], Valid
                 # Skip abstract/base validators
                 if validator_type == "base":
                     continue
+                execution = front.get("execution")
+                if execution:
+                    obj.execution = execution
+                    if execution == "process":
+                        register_preload(obj.__module__)
                 results.append((
                     obj,
                     ValidatorDetail(
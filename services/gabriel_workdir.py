@@ -0,0 +1,164 @@
+# gabriel_workdir.py
+"""Persistent, content-keyed work directories for resumable GABRIEL runs.
+
+By default every GABRIEL gate runs in a fresh temp dir with
+`reset_files=True`, so an interrupted run loses every finished LLM call.
+When CHECKR_GABRIEL_WORK_DIR is set, gates run in
+`{root}/{gate}-{key}` instead, where key hashes (gate source fingerprint,
+options + model, input DataFrame). GABRIEL is then called with
+`reset_files=False` and picks up the responses it already saved there, so a
+rerun of the same job continues where it stopped (and a rerun of a finished
+job is served from disk).
+
+Runs with the same key in this process are serialized on a per-directory
+lock: GABRIEL's resume files are not safe for two concurrent writers, and the
+second run then simply resumes from the first one's output.
+
+Directories are kept after the run and evicted least-recently-used first
+once the root exceeds CHECKR_GABRIEL_WORK_DIR_MAX_MB. Directories of runs
+in progress (or waiting for their lock) in this process are never evicted.
+Eviction walks and deletes directories in a worker thread.
+"""
+
+import asyncio
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+from typing import Any
+
+import pandas as pd
+import structlog
+
+from core.config import settings
+from services.result_cache import gate_fingerprint, options_hash
+
+logger = structlog.get_logger().bind(module=__name__)
+
+
+def dataset_hash(df: pd.DataFrame) -> str:
+    """Hash of the DataFrame content (column names, index and values)."""
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+class GabrielWorkDir:
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._active: dict[str, int] = {}  # path → runs using or waiting for it
+        self._locks: dict[str, asyncio.Lock] = {}  # path → serializes runs on it
+        # guards _active against evict(), which runs in a worker thread
+        self._guard = threading.Lock()
+
+    def path_for(self, validator, options: dict[str, Any], df: pd.DataFrame) -> str:
+        key = hashlib.sha256("|".join((
+            gate_fingerprint(type(validator)),
+            options_hash(options),
+            dataset_hash(df),
+        )).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.root, f"{validator.validator_name}-{key}")
+
+    async def acquire(self, validator, options: dict[str, Any], df: pd.DataFrame) -> tuple[str, bool]:
+        """Work directory for this run and whether it holds files from an earlier one.
+
+        Waits while another run in this process uses the same directory.
+        """
+        path = self.path_for(validator, options, df)
+        with self._guard:
+            self._active[path] = self._active.get(path, 0) + 1
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        if lock.locked():
+            logger.info("Waiting for concurrent GABRIEL run", path=path)
+        try:
+            await lock.acquire()
+        except BaseException:
+            self._drop(path)
+            raise
+        resumed = os.path.isdir(path) and any(os.scandir(path))
+        os.makedirs(path, exist_ok=True)
+        os.utime(path)
+        if resumed:
+            logger.info("Resuming GABRIEL run", path=path)
+        return path, resumed
+
+    async def release(self, path: str) -> None:
+        """Mark the run finished (recently used) and enforce the size cap."""
+        self._locks[path].release()
+        self._drop(path)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        await asyncio.to_thread(self.evict)
+
+    def _drop(self, path: str) -> None:
+        with self._guard:
+            remaining = self._active.get(path, 1) - 1
+            if remaining > 0:
+                self._active[path] = remaining
+            else:
+                self._active.pop(path, None)
+                self._locks.pop(path, None)
+
+    def evict(self) -> list[str]:
+        """Delete least-recently-used idle directories until the root fits max_bytes.
+
+        Blocking; release() runs it in a worker thread.
+        """
+        try:
+            entries = [e for e in os.scandir(self.root) if e.is_dir()]
+        except FileNotFoundError:
+            return []
+        dirs = sorted(
+            ((e.stat().st_mtime, e.path, _dir_size(e.path)) for e in entries),
+        )
+        total = sum(size for _, _, size in dirs)
+        evicted = []
+        for _, path, size in dirs:
+            if total <= self.max_bytes:
+                break
+            # move it out of the way atomically, so a run acquiring it meanwhile starts fresh
+            with self._guard:
+                if path in self._active:
+                    continue
+                doomed = os.path.join(self.root, f".evicting-{uuid.uuid4().hex}")
+                try:
+                    os.rename(path, doomed)
+                except OSError:
+                    continue
+            shutil.rmtree(doomed, ignore_errors=True)
+            total -= size
+            evicted.append(path)
+        if evicted:
+            logger.info("Evicted GABRIEL work dirs", count=len(evicted), remaining_bytes=total)
+        return evicted
+
+
+_work_dir: GabrielWorkDir | None = None
+
+
+def get_gabriel_work_dir() -> GabrielWorkDir | None:
+    """Process-wide work dir manager, None when CHECKR_GABRIEL_WORK_DIR is unset."""
+    global _work_dir
+    if _work_dir is None and settings.gabriel_work_dir:
+        _work_dir = GabrielWorkDir(settings.gabriel_work_dir, settings.gabriel_work_dir_max_mb * 1024 * 1024)
+    return _work_dir
+
+
+def reset_gabriel_work_dir() -> None:
+    global _work_dir
+    _work_dir = None
@@ -0,0 +1,118 @@
+# health.py
+"""Cached health snapshot behind /health and /ready.
+
+A background task started from the app lifespan (core/app.py) probes the LLM
+backend's `{api_base}/models` every CHECKR_HEALTH_REFRESH_INTERVAL seconds
+with one reused HTTP client and stores the result. The probe handlers answer
+from that snapshot plus the in-memory circuit breaker state
+(services/llm_breaker.py), so Kubernetes probes never touch the LLM proxy or
+the config file and cannot time out on a slow backend. `age_seconds` tells
+how old the probed part of the snapshot is.
+"""
+
+import asyncio
+import time
+
+import httpx
+import structlog
+
+from core.config import settings
+from services.llm_breaker import get_llm_breaker
+from utils.yaml import load_and_expand_yaml
+
+logger = structlog.get_logger().bind(module=__name__)
+
+
+class HealthMonitor:
+    def __init__(self, interval: float | None = None, probe_timeout: float | None = None):
+        self.interval = interval if interval is not None else settings.health_refresh_interval
+        self.probe_timeout = probe_timeout if probe_timeout is not None else settings.health_probe_timeout
+        self._components: dict[str, str] = {}
+        self._details: dict[str, str] = {}
+        self._checked_at: float | None = None  # time.monotonic() of the last refresh
+
+    async def refresh(self, client: httpx.AsyncClient | None = None) -> None:
+        """Probe every component once and replace the cached snapshot."""
+        components: dict[str, str] = {}
+        details: dict[str, str] = {}
+
+        # LLM backend (yallmp) used by G-Eval / GABRIEL validators
+        try:
+            llm_cfg = load_and_expand_yaml(settings.llm_config_path)
+            api_base = llm_cfg.get("geval", {}).get("api_base", "")
+            if api_base:
+                # yallmp's models endpoint as a lightweight probe
+                if client is None:
+                    async with httpx.AsyncClient(verify=settings.http_verify_ssl) as own_client:
+                        await self._probe(own_client, f"{api_base}/models")
+                else:
+                    await self._probe(client, f"{api_base}/models")
+                components["llm_backend"] = "ok"
+            else:
+                components["llm_backend"] = "disabled"
+        except Exception as exc:
+            components["llm_backend"] = "degraded"
+            details["llm_backend"] = str(exc) or type(exc).__name__
+
+        self._components, self._details = components, details
+        self._checked_at = time.monotonic()
+
+    async def _probe(self, client: httpx.AsyncClient, url: str) -> None:
+        resp = await asyncio.wait_for(client.get(url, timeout=self.probe_timeout), timeout=self.probe_timeout + 2)
+        resp.raise_for_status()
+
+    async def run(self) -> None:
+        """Refresh forever; one HTTP client (and its keep-alive connection) for all probes."""
+        async with httpx.AsyncClient(verify=settings.http_verify_ssl) as client:
+            while True:
+                try:
+                    await self.refresh(client)
+                except Exception as exc:
+                    logger.warning("Health refresh failed", error=str(exc))
+                await asyncio.sleep(self.interval)
+
+    @property
+    def age(self) -> float | None:
+        """Seconds since the last refresh, None before the first one."""
+        return None if self._checked_at is None else time.monotonic() - self._checked_at
+
+    def snapshot(self) -> dict:
+        """Current health from memory: last probe results merged with the circuit breaker."""
+        components = dict(self._components)
+        details = dict(self._details)
+        circuit = get_llm_breaker().snapshot()
+        if components.get("llm_backend") != "disabled" and circuit["state"] != "closed":
+            components["llm_backend"] = "degraded"
+            details["llm_backend"] = f"circuit {circuit['state']}: {circuit['last_error']}"
+
+        enabled = {k: v for k, v in components.items() if v != "disabled"}
+        age = self.age
+        result: dict = {
+            "status": "ok" if all(v == "ok" for v in enabled.values()) else "degraded",
+            "version": settings.version,
+            "components": components,
+            "llm_circuit": circuit,
+            "age_seconds": None if age is None else round(age, 3),
+        }
+        if details:
+            result["details"] = details
+        return result
+
+    def ready(self) -> bool:
+        """Not ready while the circuit is open or the last probe found the backend down."""
+        return get_llm_breaker().state != "open" and self._components.get("llm_backend") != "degraded"
+
+
+_monitor: HealthMonitor | None = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    global _monitor
+    if _monitor is None:
+        _monitor = HealthMonitor()
+    return _monitor
+
+
+def reset_health_monitor() -> None:
+    global _monitor
+    _monitor = None
@@ -47,7 +47,9 @@ async def _process_job(
 ) -> None:
     """Run all gates for a single job. Lives in its own Task so it can be
     cancelled independently from the worker loop."""
+    from pydantic import ValidationError
     from schemas.jobs import JobStatus
+    from validators.base_validator import ParsedDataset
 
     await service.update_job(
         job_id,
@@ -55,10 +57,17 @@ async def _process_job(
         started_at=datetime.now(timezone.utc),
     )
 
+    # Parse once for all gates; on invalid input fall back to the raw list
+    # so each gate reports the schema error as before.
+    try:
+        shared_dataset = ParsedDataset.parse(dataset)
+    except ValidationError:
+        shared_dataset = dataset
+
     async def _run_gate(gate: str):
         cb = _make_progress_callback(service, job_id, gate, loop)
         validator = validators_dict[gate](options, progress_callback=cb)
-        return gate, await validator.validate(dataset)
+        return gate, await validator.validate(shared_dataset)
 
     gate_results = await asyncio.gather(
         *(_run_gate(g) for g in gates),
@@ -95,11 +104,68 @@ async def _process_job(
     logger.info("Job completed", job_id=job_id, status=final_result["status"], errors=len(all_errors))
 
 
+async def _run_job(
+    app,
+    service,
+    validators_dict: dict,
+    loop: asyncio.AbstractEventLoop,
+    job_id: str,
+    dataset: list,
+    options: dict,
+    gates: list[str],
+) -> None:
+    """Run one job in its own Task (registered in running_jobs so
+    cancel_job() can interrupt it) and record how it ended."""
+    from schemas.jobs import JobStatus
+
+    task = asyncio.create_task(
+        _process_job(service, validators_dict, loop, job_id, dataset, options, gates)
+    )
+    app.state.running_jobs[job_id] = task
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        if task.cancelled():
+            # Job was cancelled via the cancel endpoint
+            logger.info("Job cancelled by user", job_id=job_id)
+            try:
+                await service.update_job(
+                    job_id,
+                    status=JobStatus.cancelled,
+                    completed_at=datetime.now(timezone.utc),
+                )
+            except Exception:
+                pass
+            # Don't re-raise — the worker keeps running other jobs
+        else:
+            # Worker itself is being shut down; propagate
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            raise
+    except Exception as exc:
+        logger.error("Job failed", error=str(exc), job_id=job_id)
+        try:
+            await service.update_job(
+                job_id,
+                status=JobStatus.failed,
+                completed_at=datetime.now(timezone.utc),
+                error=str(exc),
+            )
+        except Exception:
+            pass
+    finally:
+        app.state.running_jobs.pop(job_id, None)
+
+
 async def worker_loop(app) -> None:
     """
-    Pulls jobs from the Redis queue (BLPOP) and runs each one as an
-    independent asyncio.Task so individual jobs can be cancelled without
-    stopping the worker. Cancelled cleanly on app shutdown.
+    Pulls jobs from the Redis queue (BLPOP) and runs up to
+    CHECKR_WORKER_CONCURRENCY of them at once, each as an independent
+    asyncio.Task so individual jobs can be cancelled without stopping the
+    worker. A job is only popped once a slot is free, so jobs the worker
+    can't start yet stay in Redis for other workers. Cancelled cleanly
+    (with every in-flight job) on app shutdown.
     """
     from services.job_service import JobService
     from schemas.jobs import JobStatus
@@ -108,70 +174,61 @@ async def worker_loop(app) -> None:
     service = JobService(redis)
     validators_dict = app.state.backend_validators_dict
     loop = asyncio.get_event_loop()
+    slots = asyncio.Semaphore(max(1, settings.worker_concurrency))
+    in_flight: set[asyncio.Task] = set()
+
+    def _finished(runner: asyncio.Task) -> None:
+        in_flight.discard(runner)
+        slots.release()
 
-    logger.info("Job worker started")
+    logger.info("Job worker started", concurrency=settings.worker_concurrency)
 
     while True:
         job_id: str | None = None
-        task: asyncio.Task | None = None
         try:
-            # Block up to 5 s so CancelledError can surface between polls
-            result = await redis.blpop(settings.job_queue_key, timeout=5)
-            if result is None:
-                continue
-
-            _, payload_str = result
-            payload = json.loads(payload_str)
-            job_id = payload["job_id"]
-            dataset = payload["dataset"]
-            options = payload.get("options", {})
-
-            job = await service.get_job(job_id)
-            if job is None:
-                logger.warning("Job not found in store, skipping", job_id=job_id)
-                continue
-
-            # Skip jobs that were cancelled while still queued
-            if job.status == JobStatus.cancelled:
-                logger.info("Job was cancelled before processing, skipping", job_id=job_id)
-                continue
-
-            logger.info("Processing job", job_id=job_id, gates=job.gates)
-
-            # Each job runs in its own Task so cancel_job() can interrupt it
-            task = asyncio.create_task(
-                _process_job(service, validators_dict, loop, job_id, dataset, options, job.gates)
-            )
-            app.state.running_jobs[job_id] = task
-
+            # Backpressure: don't pop a job before there is a slot to run it
+            await slots.acquire()
+            started = False
             try:
-                await task
-            except asyncio.CancelledError:
-                if task.cancelled():
-                    # Job was cancelled via the cancel endpoint
-                    logger.info("Job cancelled by user", job_id=job_id)
-                    try:
-                        await service.update_job(
-                            job_id,
-                            status=JobStatus.cancelled,
-                            completed_at=datetime.now(timezone.utc),
-                        )
-                    except Exception:
-                        pass
-                    # Don't re-raise — keep the worker loop alive
-                else:
-                    # Worker itself is being shut down; propagate
-                    task.cancel()
-                    raise
+                # Block up to 5 s so CancelledError can surface between polls
+                result = await redis.blpop(settings.job_queue_key, timeout=5)
+                if result is None:
+                    continue
+
+                _, payload_str = result
+                payload = json.loads(payload_str)
+                job_id = payload["job_id"]
+                dataset = payload["dataset"]
+                options = payload.get("options", {})
+
+                job = await service.get_job(job_id)
+                if job is None:
+                    logger.warning("Job not found in store, skipping", job_id=job_id)
+                    continue
+
+                # Skip jobs that were cancelled while still queued
+                if job.status == JobStatus.cancelled:
+                    logger.info("Job was cancelled before processing, skipping", job_id=job_id)
+                    continue
+
+                logger.info("Processing job", job_id=job_id, gates=job.gates, running=len(in_flight) + 1)
+
+                runner = asyncio.create_task(
+                    _run_job(app, service, validators_dict, loop, job_id, dataset, options, job.gates)
+                )
+                started = True
+                in_flight.add(runner)
+                runner.add_done_callback(_finished)
             finally:
-                app.state.running_jobs.pop(job_id, None)
+                if not started:
+                    slots.release()
 
         except asyncio.CancelledError:
-            logger.info("Job worker shutting down")
-            # Cancel any in-flight job task
-            if task and not task.done():
-                task.cancel()
-                await asyncio.gather(task, return_exceptions=True)
+            logger.info("Job worker shutting down", in_flight=len(in_flight))
+            # Cancel every in-flight job
+            for runner in list(in_flight):
+                runner.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
             break
         except Exception as exc:
             logger.error("Worker unhandled error", error=str(exc), job_id=job_id)
@@ -185,5 +242,3 @@ async def worker_loop(app) -> None:
                     )
                 except Exception:
                     pass
-            if task:
-                app.state.running_jobs.pop(job_id, None)
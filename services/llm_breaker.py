@@ -0,0 +1,175 @@
+# llm_breaker.py
+"""Process-wide circuit breaker around the LLM backend.
+
+Shared by G-Eval / rubric (BaseGEvalValidator) and GABRIEL (its injected
+response_fn). After `failure_threshold` consecutive failed calls the circuit
+opens and LLM gates fail fast with code `llm_unavailable` instead of every
+queued item waiting out its own timeout. After `reset_timeout` seconds it
+half-opens and lets up to `half_open_probes` calls through: a success closes
+it again, a failure re-opens it. Other calls arriving while the probes are in
+flight wait for their outcome instead of failing, so a batch queued during
+recovery goes through once the probe succeeds. Only backend trouble (timeouts, connection
+errors, 429/5xx) counts as a failure; a 4xx is the caller's problem.
+
+Configured in the `circuit_breaker` section of config/llm.yaml:
+
+    circuit_breaker:
+      failure_threshold: 5   # consecutive failures that open the circuit (0 = disabled)
+      reset_timeout: 30      # seconds open before probing
+      half_open_probes: 1    # concurrent probe calls while half-open
+
+The breaker state also backs the /ready and /health endpoints (core/app.py).
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import structlog
+
+from core.config import settings
+from middlewares.metrics_middleware import LLM_CIRCUIT_STATE
+from services.llm_retry import is_transient_error
+from utils.yaml import load_and_expand_yaml
+
+logger = structlog.get_logger().bind(module=__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the LLM backend while the circuit is open."""
+
+
+def is_circuit_open_error(exc: BaseException | None) -> bool:
+    """True when exc, or anything in its cause chain, is a CircuitOpenError."""
+    seen = 0
+    while exc is not None and seen < 5:
+        if isinstance(exc, CircuitOpenError):
+            return True
+        exc, seen = exc.__cause__ or exc.__context__, seen + 1
+    return False
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_probes: int = 1):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = max(half_open_probes, 1)
+        self.consecutive_failures = 0
+        self.last_error: str | None = None
+        self._opened_at: float | None = None
+        self._probes = 0
+        self._probe_done: asyncio.Event | None = None  # set when the in-flight probes finish
+        LLM_CIRCUIT_STATE.set(_STATE_VALUES[CLOSED])
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def retry_in(self) -> float:
+        """Seconds until the open circuit starts probing (0 unless open)."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def check(self) -> None:
+        """Raise CircuitOpenError while open; cheap enough to call before queueing."""
+        if self.state == OPEN:
+            raise CircuitOpenError(f"LLM backend unavailable (circuit open, retrying in {self.retry_in():.0f}s)")
+
+    def _open(self) -> None:
+        if self._opened_at is None:
+            logger.warning("LLM circuit opened", failures=self.consecutive_failures, error=self.last_error)
+        self._opened_at = time.monotonic()
+        LLM_CIRCUIT_STATE.set(_STATE_VALUES[OPEN])
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("LLM circuit closed")
+        self.consecutive_failures = 0
+        self._opened_at = None
+        LLM_CIRCUIT_STATE.set(_STATE_VALUES[CLOSED])
+
+    def record_failure(self, exc: BaseException) -> None:
+        self.consecutive_failures += 1
+        self.last_error = str(exc) or type(exc).__name__
+        if self._opened_at is not None or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    @asynccontextmanager
+    async def guard(self):
+        """Wrap one LLM call: fail fast while open, admit limited probes while half-open.
+
+        Calls beyond half_open_probes wait for the probes, then go ahead if the
+        circuit closed, fail if it re-opened, or probe themselves.
+        """
+        if not self.failure_threshold:
+            yield
+            return
+        while True:
+            state = self.state
+            self.check()
+            if state != HALF_OPEN or self._probes < self.half_open_probes:
+                break
+            await self._probe_done.wait()
+        probing = state == HALF_OPEN
+        if probing:
+            if not self._probes:
+                self._probe_done = asyncio.Event()
+            self._probes += 1
+            LLM_CIRCUIT_STATE.set(_STATE_VALUES[HALF_OPEN])
+        try:
+            yield
+        except Exception as e:
+            if is_transient_error(e):
+                self.record_failure(e)
+            elif not is_circuit_open_error(e):
+                # the backend answered (e.g. 400): it is up
+                self.record_success()
+            raise
+        else:
+            self.record_success()
+        finally:
+            if probing:
+                self._probes -= 1
+                if not self._probes:
+                    self._probe_done.set()
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in": round(self.retry_in(), 1),
+            "last_error": self.last_error,
+        }
+
+
+_breaker: CircuitBreaker | None = None
+
+
+def get_llm_breaker() -> CircuitBreaker:
+    global _breaker
+    if _breaker is None:
+        try:
+            config = load_and_expand_yaml(settings.llm_config_path).get("circuit_breaker") or {}
+        except Exception as e:
+            logger.warning("Could not read LLM circuit_breaker config; using defaults", error=str(e))
+            config = {}
+        _breaker = CircuitBreaker(
+            failure_threshold=int(config.get("failure_threshold", 5)),
+            reset_timeout=float(config.get("reset_timeout", 30)),
+            half_open_probes=int(config.get("half_open_probes", 1)),
+        )
+    return _breaker
+
+
+def reset_llm_breaker() -> None:
+    """Drop the breaker so the next call re-reads config/llm.yaml (closed)."""
+    global _breaker
+    _breaker = None
@@ -0,0 +1,226 @@
+# llm_cache.py
+"""Response cache for LLM judge calls (BaseGEvalValidator.call_llm).
+
+Key: sha256 of (model, temperature, prompt). Value: the raw completion text.
+Only deterministic calls (temperature == 0) are cached — sampled answers
+must stay independent draws.
+
+Backends (CHECKR_LLM_CACHE_BACKEND):
+  off     no caching (default)
+  memory  in-process LRU
+  sqlite  local file shared by workers on one host (CHECKR_LLM_CACHE_PATH)
+  redis   shared across hosts (CHECKR_LLM_CACHE_REDIS_URL)
+
+All backends honour CHECKR_LLM_CACHE_TTL. memory and sqlite evict the least
+recently used entries beyond CHECKR_LLM_CACHE_SIZE; redis relies on the
+server's maxmemory policy for size. Backend errors degrade to misses.
+
+Opt-in, like the per-item result cache: a hit replays an earlier judgement
+instead of asking the current backend, which hides model or proxy changes
+behind the same model name until the TTL runs out.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+
+import structlog
+
+from core.config import settings
+from middlewares.metrics_middleware import LLM_CACHE_HITS, LLM_CACHE_MISSES
+
+logger = structlog.get_logger().bind(module=__name__)
+
+
+def llm_cache_key(model: str, temperature: float, prompt: str) -> str:
+    return hashlib.sha256(
+        json.dumps([model, float(temperature), prompt], ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+class MemoryLLMCache:
+    backend = "memory"
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key → (expires_at, value)
+        self._lru: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    async def get(self, key: str) -> str | None:
+        entry = self._lru.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            del self._lru[key]
+            return None
+        self._lru.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        self._lru[key] = (time.time() + self.ttl, value)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    async def close(self) -> None:
+        self._lru.clear()
+
+
+class SQLiteLLMCache:
+    backend = "sqlite"
+
+    def __init__(self, path: str, max_entries: int, ttl: int):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_used_at ON llm_cache (used_at)")
+        # sqlite3 connections are not safe for concurrent use from several threads
+        self._lock = asyncio.Lock()
+        self._writes = 0
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def _get(self, key: str) -> str | None:
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at < now:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            return None
+        self._conn.execute("UPDATE llm_cache SET used_at = ? WHERE key = ?", (now, key))
+        return value
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, used_at) VALUES (?, ?, ?, ?)",
+            (key, value, now + self.ttl, now),
+        )
+        self._writes += 1
+        # Evict in batches rather than on every insert
+        if self._writes % 100 == 0 or self._writes == 1:
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,))
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE key IN ("
+            " SELECT key FROM llm_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    async def get(self, key: str) -> str | None:
+        async with self._lock:
+            return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        async with self._lock:
+            await asyncio.to_thread(self._set, key, value)
+
+    async def close(self) -> None:
+        async with self._lock:
+            self._conn.close()
+
+
+class RedisLLMCache:
+    backend = "redis"
+
+    def __init__(self, redis_client, ttl: int, prefix: str = "checkr:llm:"):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> str | None:
+        return await self.redis.get(self.prefix + key)
+
+    async def set(self, key: str, value: str) -> None:
+        await self.redis.set(self.prefix + key, value, ex=self.ttl)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+LLMCache = MemoryLLMCache | SQLiteLLMCache | RedisLLMCache
+
+
+async def cached_completion(model: str, temperature: float, prompt: str, call) -> str:
+    """Return the cached answer for (model, temperature, prompt) or await call() and store it."""
+    cache = get_llm_cache()
+    if cache is None or temperature != 0:
+        return await call()
+
+    key = llm_cache_key(model, temperature, prompt)
+    try:
+        value = await cache.get(key)
+    except Exception as e:
+        logger.warning("LLM cache read failed", backend=cache.backend, error=str(e))
+        value = None
+    if value is not None:
+        LLM_CACHE_HITS.labels(backend=cache.backend, model=model).inc()
+        return value
+
+    LLM_CACHE_MISSES.labels(backend=cache.backend, model=model).inc()
+    value = await call()
+    try:
+        await cache.set(key, value)
+    except Exception as e:
+        logger.warning("LLM cache write failed", backend=cache.backend, error=str(e))
+    return value
+
+
+_cache: LLMCache | None = None
+_cache_built = False
+
+
+def get_llm_cache() -> LLMCache | None:
+    """Process-wide cache built from settings; None when disabled."""
+    global _cache, _cache_built
+    if not _cache_built:
+        _cache_built = True
+        backend = settings.llm_cache_backend
+        if backend == "memory" and settings.llm_cache_size > 0:
+            _cache = MemoryLLMCache(settings.llm_cache_size, settings.llm_cache_ttl)
+        elif backend == "sqlite":
+            _cache = SQLiteLLMCache(settings.llm_cache_path, settings.llm_cache_size, settings.llm_cache_ttl)
+        elif backend == "redis" and settings.llm_cache_redis_url:
+            import redis.asyncio as aioredis
+            _cache = RedisLLMCache(
+                aioredis.from_url(settings.llm_cache_redis_url, decode_responses=True),
+                settings.llm_cache_ttl,
+            )
+        elif backend not in ("off", "memory"):
+            logger.warning("LLM cache disabled: unknown or unconfigured backend", backend=backend)
+        if _cache is not None:
+            logger.info("LLM response cache enabled", backend=_cache.backend)
+    return _cache
+
+
+async def close_llm_cache() -> None:
+    """Close the backend and drop the process-wide cache. Called on app shutdown."""
+    global _cache, _cache_built
+    cache, _cache, _cache_built = _cache, None, False
+    if cache is not None:
+        try:
+            await cache.close()
+        except Exception as e:
+            logger.warning("Failed to close LLM cache", error=str(e))
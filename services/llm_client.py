@@ -0,0 +1,104 @@
+# llm_client.py
+"""Process-wide pooled OpenAI-compatible clients for LLM-backed validators.
+
+One AsyncOpenAI (and one keep-alive httpx connection pool) per
+(api_base, api_key), shared by every validator instance and request.
+Per-request headers (X-Request-ID, X-Group-ID) are still injected on each
+call through ContextHeaderTransport, which reads request_headers_vars.
+Clients are closed on app shutdown (see core/app.py lifespan).
+"""
+
+import asyncio
+import contextvars
+
+import httpx
+import structlog
+from openai import AsyncOpenAI
+
+from core.config import settings
+
+logger = structlog.get_logger().bind(module=__name__)
+
+# Shared context var (to pass headers into the transportlayer
+request_headers_vars = contextvars.ContextVar("request_headers", default={})
+
+
+class ContextHeaderTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner):
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        custom_headers = request_headers_vars.get()
+        for key, value in custom_headers.items():
+            request.headers[key] = value
+        return await self.inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+# (api_base, api_key) → (client, loop it was created on)
+_clients: dict[tuple[str | None, str | None], tuple[AsyncOpenAI, asyncio.AbstractEventLoop | None]] = {}
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _build_client(api_base: str | None, api_key: str | None) -> AsyncOpenAI:
+    limits = httpx.Limits(
+        max_connections=settings.llm_max_connections,
+        max_keepalive_connections=settings.llm_max_keepalive_connections,
+        keepalive_expiry=settings.llm_keepalive_expiry,
+    )
+    transport = ContextHeaderTransport(
+        httpx.AsyncHTTPTransport(limits=limits, verify=settings.http_verify_ssl)
+    )
+    http_client = httpx.AsyncClient(transport=transport, timeout=settings.llm_timeout)
+    return AsyncOpenAI(
+        # Local proxies (yallmp) need no key, but the SDK refuses an empty one
+        api_key=api_key or "not-needed",
+        base_url=api_base or None,
+        http_client=http_client,
+        # retries happen in services/llm_retry.py (resilient_call), not again inside the SDK
+        max_retries=0,
+    )
+
+
+def get_llm_client(api_base: str | None, api_key: str | None) -> AsyncOpenAI:
+    """Return the shared client for (api_base, api_key), creating it on first use.
+
+    A client created on an event loop that has since closed (e.g. a previous
+    asyncio.run) is replaced: its pooled connections are bound to that loop.
+    """
+    key = (api_base or None, api_key or None)
+    cached = _clients.get(key)
+    if cached is not None:
+        client, client_loop = cached
+        if client_loop is None or not client_loop.is_closed():
+            return client
+    client = _build_client(api_base, api_key)
+    _clients[key] = (client, _running_loop())
+    logger.info("Created pooled LLM client", api_base=api_base)
+    return client
+
+
+def open_llm_clients(*configs: dict) -> None:
+    """Create the pooled clients for the given llm.yaml sections at startup."""
+    for config in configs:
+        if config and config.get("api_base"):
+            get_llm_client(config.get("api_base"), config.get("api_key"))
+
+
+async def close_llm_clients() -> None:
+    """Close every pooled client. Called from the app lifespan on shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client, _ in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning("Failed to close LLM client", error=str(e))
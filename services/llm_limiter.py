@@ -0,0 +1,212 @@
+# llm_limiter.py
+"""Process-wide rate limiter for calls to the LLM backend.
+
+Every live LLM call (G-Eval / rubric via BaseGEvalValidator.call_llm, GABRIEL
+via its injected response_fn) passes through one limiter, so concurrent
+/validate requests and the job worker together stay within the backend's
+budget. Configured in the `rate_limit` section of config/llm.yaml:
+
+    rate_limit:
+      requests_per_second: 20      # token bucket on request starts (0 = unlimited)
+      tokens_per_minute: 200000    # token bucket on estimated prompt + output tokens (0 = unlimited)
+      max_in_flight: 64            # concurrent calls (0 = unlimited)
+      estimated_output_tokens: 100 # added to each prompt's estimate for tokens_per_minute
+
+Time spent waiting for a slot is published as checkr_llm_queue_wait_seconds{source}.
+
+The limits are per process, not per event loop: in-flight slots and buckets
+use thread locks and wake waiters on whichever loop they wait on, so several
+loops (threads) in one process share one max_in_flight. Rebuilding the
+limiter (reset_llm_limiter, POST /config/reload) keeps the in-flight count:
+calls still running under the old limiter hold slots of the new one's limit.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+import structlog
+
+from core.config import settings
+from middlewares.metrics_middleware import LLM_IN_FLIGHT, LLM_QUEUE_WAIT
+from utils.yaml import load_and_expand_yaml
+
+logger = structlog.get_logger().bind(module=__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), good enough for budgeting."""
+    return len(text) // 4 + 1
+
+
+class TokenBucket:
+    """Refills `rate` units per second up to `capacity`; take() waits until units are available."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._level = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` now and return how long the caller must wait before using it.
+
+        The level may go negative, so later callers queue behind earlier ones.
+        A single oversized request drains the bucket rather than waiting forever.
+        """
+        self._refill()
+        needed = min(amount, self.capacity) - self._level
+        self._level -= amount
+        return max(0.0, needed / self.rate)
+
+
+def _grant(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class InFlightSlots:
+    """Counting semaphore usable from any event loop or thread; `limit` may change while slots are held."""
+
+    def __init__(self, limit: int = 0):
+        self.limit = limit  # 0 = unlimited (still counted)
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._waiters: deque[asyncio.Future] = deque()
+
+    def _has_room(self) -> bool:
+        return not self.limit or self.in_flight < self.limit
+
+    async def acquire(self) -> None:
+        with self._lock:
+            if not self._waiters and self._has_room():
+                self.in_flight += 1
+                return
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(future)
+                    granted = False
+                except ValueError:
+                    granted = True
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._wake()
+
+    def resize(self, limit: int) -> None:
+        with self._lock:
+            self.limit = limit
+            self._wake()
+
+    def _wake(self) -> None:
+        # called with _lock held; hands free slots to waiters in arrival order
+        while self._waiters and self._has_room():
+            future = self._waiters.popleft()
+            try:
+                future.get_loop().call_soon_threadsafe(_grant, future)
+            except RuntimeError:  # its loop is closed
+                continue
+            self.in_flight += 1
+
+
+class LLMRateLimiter:
+    def __init__(
+        self,
+        requests_per_second: float = 0,
+        tokens_per_minute: float = 0,
+        max_in_flight: int = 0,
+        estimated_output_tokens: int = 100,
+        slots: InFlightSlots | None = None,
+    ):
+        self.requests = TokenBucket(requests_per_second, max(requests_per_second, 1.0)) if requests_per_second else None
+        self.tokens = TokenBucket(tokens_per_minute / 60.0, tokens_per_minute) if tokens_per_minute else None
+        self.max_in_flight = max_in_flight
+        self.estimated_output_tokens = estimated_output_tokens
+        self._slots = slots or InFlightSlots()
+        self._slots.resize(max_in_flight)
+        # reservations are taken in arrival order; the wait happens outside the lock
+        self._bucket_lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return self._slots.in_flight
+
+    async def _take_buckets(self, tokens: int) -> None:
+        if self.requests is None and self.tokens is None:
+            return
+        with self._bucket_lock:
+            delay = max(
+                self.requests.reserve(1) if self.requests else 0.0,
+                self.tokens.reserve(tokens) if self.tokens else 0.0,
+            )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def slot(self, prompt: str = "", source: str = "llm"):
+        """Hold one in-flight slot for the duration of an LLM call, after passing the buckets."""
+        start = time.monotonic()
+        await self._slots.acquire()
+        try:
+            await self._take_buckets(estimate_tokens(prompt) + self.estimated_output_tokens)
+            LLM_QUEUE_WAIT.labels(source=source).observe(time.monotonic() - start)
+            LLM_IN_FLIGHT.labels(source=source).inc()
+            try:
+                yield
+            finally:
+                LLM_IN_FLIGHT.labels(source=source).dec()
+        finally:
+            self._slots.release()
+
+
+_limiter: LLMRateLimiter | None = None
+# outlives rebuilt limiters, so calls in flight during a reload still count
+_slots = InFlightSlots()
+
+
+def _load_rate_limit_config() -> dict:
+    try:
+        return load_and_expand_yaml(settings.llm_config_path).get("rate_limit") or {}
+    except Exception as e:
+        logger.warning("Could not read LLM rate_limit config; calls are unlimited", error=str(e))
+        return {}
+
+
+def get_llm_limiter() -> LLMRateLimiter:
+    """The process-wide limiter, shared by every event loop in the process."""
+    global _limiter
+    if _limiter is None:
+        config = _load_rate_limit_config()
+        _limiter = LLMRateLimiter(
+            requests_per_second=float(config.get("requests_per_second") or 0),
+            tokens_per_minute=float(config.get("tokens_per_minute") or 0),
+            max_in_flight=int(config.get("max_in_flight") or 0),
+            estimated_output_tokens=int(config.get("estimated_output_tokens") or 100),
+            slots=_slots,
+        )
+    return _limiter
+
+
+def reset_llm_limiter() -> None:
+    """Drop the limiter so the next call re-reads config/llm.yaml.
+
+    The in-flight count carries over to the rebuilt limiter; the buckets start full.
+    """
+    global _limiter
+    _limiter = None
@@ -0,0 +1,185 @@
+# llm_retry.py
+"""Per-call timeout, bounded retries and request hedging for LLM calls.
+
+Configured in the `retry` subsection of the `geval` section of config/llm.yaml:
+
+    retry:
+      timeout: 60             # seconds per request once it holds its limiter slot (0 = none)
+      max_retries: 2          # extra attempts after a timeout or transient error
+      base_delay: 0.5         # backoff before retry n: uniform(0, base_delay * 2**n), capped at max_delay
+      max_delay: 10
+      hedge: false            # send a duplicate once an attempt outlives hedge_quantile of recent latencies
+      hedge_quantile: 0.95
+      hedge_min_samples: 20   # successful calls observed before hedging starts
+
+Each request, hedges included, takes its own slot from the process-wide
+limiter (services/llm_limiter.py, passed as `slot`): hedging never exceeds the
+global concurrency budget, and queueing for the slot is not part of the
+timeout or of the latencies hedging is based on. Retries and hedges are
+published as checkr_llm_retries_total{source,reason} and
+checkr_llm_hedges_total{source,outcome}.
+
+This is the only retry layer around a single request: the pooled OpenAI
+clients are built with max_retries=0 (services/llm_client.py). The one other
+layer is adaptive concurrency (`adaptive_concurrency` gate option,
+utils.async_utils.AdaptiveLimiter), which re-runs a whole call, this
+function's retries included, after a throttle error (429/408/5xx) — up to 4
+times. A call that keeps getting throttled therefore costs at most
+(1 + max_retries) × 5 requests, while timeouts and connection errors are only
+retried here, at most 1 + max_retries times.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any, Awaitable, Callable
+
+import httpx
+from openai import APIConnectionError
+
+from middlewares.metrics_middleware import LLM_HEDGES, LLM_RETRIES
+from utils.async_utils import is_throttle_error
+
+
+class LatencyTracker:
+    """Sliding window of recent successful call latencies."""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int = 20) -> float | None:
+        """q-quantile of the window, or None until min_samples latencies were seen."""
+        if len(self._samples) < max(min_samples, 1):
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# "<source>:<model>" → tracker; latencies differ per model, so hedge delays do too
+_trackers: dict[str, LatencyTracker] = {}
+
+
+def get_latency_tracker(key: str) -> LatencyTracker:
+    tracker = _trackers.get(key)
+    if tracker is None:
+        tracker = _trackers[key] = LatencyTracker()
+    return tracker
+
+
+def reset_latency_trackers() -> None:
+    _trackers.clear()
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Timeouts, connection errors and throttle/5xx responses are worth retrying; 4xx are not."""
+    return isinstance(exc, (TimeoutError, httpx.TransportError, APIConnectionError)) or is_throttle_error(exc)
+
+
+async def _timed(
+    factory: Callable[[], Awaitable[Any]],
+    tracker: LatencyTracker,
+    slot: Callable[[], AbstractAsyncContextManager] | None = None,
+    timeout: float = 0,
+    started: asyncio.Event | None = None,
+) -> Any:
+    """One request: wait for its slot, then time (and time-limit) only the request itself."""
+    async with slot() if slot is not None else nullcontext():
+        if started is not None:
+            started.set()
+        start = time.monotonic()
+        call = factory()
+        result = await (asyncio.wait_for(call, timeout) if timeout else call)
+        tracker.record(time.monotonic() - start)
+        return result
+
+
+async def _hedged(
+    factory: Callable[[], Awaitable[Any]],
+    tracker: LatencyTracker,
+    source: str,
+    hedge_quantile: float,
+    hedge_min_samples: int,
+    slot: Callable[[], AbstractAsyncContextManager] | None = None,
+    timeout: float = 0,
+) -> Any:
+    """Run factory(); if it outlives the latency quantile, race a duplicate and keep the first answer."""
+    delay = tracker.quantile(hedge_quantile, hedge_min_samples)
+    if delay is None:
+        return await _timed(factory, tracker, slot, timeout)
+
+    started = asyncio.Event()
+    original = asyncio.ensure_future(_timed(factory, tracker, slot, timeout, started))
+    pending = {original}
+    try:
+        # the hedge delay counts from when the original got its slot, not while it queued
+        waiter = asyncio.ensure_future(started.wait())
+        try:
+            await asyncio.wait({original, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        if not original.done():
+            await asyncio.wait(pending, timeout=delay)
+        if original.done():
+            return original.result()
+
+        hedge = asyncio.ensure_future(_timed(factory, tracker, slot, timeout))
+        pending.add(hedge)
+        LLM_HEDGES.labels(source=source, outcome="sent").inc()
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        LLM_HEDGES.labels(source=source, outcome="won").inc()
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def resilient_call(
+    factory: Callable[[], Awaitable[Any]],
+    *,
+    source: str = "llm",
+    key: str = "",
+    timeout: float = 0,
+    max_retries: int = 0,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+    hedge: bool = False,
+    hedge_quantile: float = 0.95,
+    hedge_min_samples: int = 20,
+    slot: Callable[[], AbstractAsyncContextManager] | None = None,
+) -> Any:
+    """Await factory() with a per-request timeout, optional hedging and bounded retries.
+
+    `factory` must start a fresh request on every call (it is invoked once per
+    attempt and once per hedge). `slot`, if given, returns the context manager
+    each request holds while it runs (the global limiter slot); the timeout,
+    the latency samples and the hedge delay only start once it is acquired, so
+    time spent queued never counts as a slow call. `key` (usually the model)
+    selects the latency window the hedge delay is taken from. With the
+    defaults this is a plain await.
+    """
+    tracker = get_latency_tracker(f"{source}:{key}")
+    attempt = 0
+    while True:
+        try:
+            if hedge:
+                return await _hedged(factory, tracker, source, hedge_quantile, hedge_min_samples, slot, timeout)
+            return await _timed(factory, tracker, slot, timeout)
+        except Exception as e:
+            if attempt >= max_retries or not is_transient_error(e):
+                raise
+            LLM_RETRIES.labels(source=source, reason="timeout" if isinstance(e, TimeoutError) else "error").inc()
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            attempt += 1
+        await asyncio.sleep(delay)
@@ -0,0 +1,113 @@
+# process_pool.py
+"""Process-pool execution for CPU-bound `_validate_sync` validators.
+
+Validators opt in with `execution: process` in their frontmatter. The
+dataset is split into chunks, each chunk runs `_validate_sync` in a worker
+process, and the ValidationDetail lists are merged back with item indexes
+shifted to their position in the full dataset.
+
+Validator classes are not pickled: workers import them by module name, so
+classes loaded by the registry (which are not in sys.modules) still work.
+"""
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import structlog
+
+from core.config import settings
+
+logger = structlog.get_logger().bind(module=__name__)
+
+_preload_modules: list[str] = ["validators.base_validator"]
+_executor: ProcessPoolExecutor | None = None
+_worker_classes: dict[tuple[str, str], type] = {}
+
+
+def register_preload(module_name: str) -> None:
+    """Import module_name in every worker at start-up (call before first use)."""
+    if module_name not in _preload_modules:
+        _preload_modules.append(module_name)
+
+
+def _init_worker(modules: list[str]) -> None:
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as e:  # a bad module must not kill the whole pool
+            print(f"Process pool preload failed for {name}: {e}")
+
+
+def _run_chunk(module_name: str, class_name: str, options: dict, items: list) -> list:
+    key = (module_name, class_name)
+    cls = _worker_classes.get(key)
+    if cls is None:
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _worker_classes[key] = cls
+    return cls(options)._validate_sync(items)
+
+
+def pool_size() -> int:
+    return settings.process_pool_workers or os.cpu_count() or 1
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        _executor = ProcessPoolExecutor(
+            max_workers=pool_size(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(list(_preload_modules),),
+        )
+        logger.info("Process pool started", workers=pool_size(), preload=_preload_modules)
+    return _executor
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def split_chunks(n_items: int, n_workers: int, min_chunk: int) -> list[tuple[int, int]]:
+    """Return (start, stop) ranges: ~4 chunks per worker, none smaller than min_chunk."""
+    if n_items == 0:
+        return []
+    chunk = max(min_chunk, -(-n_items // (n_workers * 4)))
+    return [(start, min(start + chunk, n_items)) for start in range(0, n_items, chunk)]
+
+
+async def run_in_process_pool(validator, data) -> list:
+    """Run validator._validate_sync over data in chunks across the process pool."""
+    cls = type(validator)
+    min_chunk = settings.process_pool_min_chunk
+    ranges = split_chunks(len(data), pool_size(), min_chunk)
+    if len(ranges) < 2:
+        # Not worth the IPC round-trip
+        return await asyncio.to_thread(validator._validate_sync, data)
+
+    loop = asyncio.get_running_loop()
+    executor = get_executor()
+    total = len(data)
+    done = 0
+
+    async def _submit(start: int, stop: int) -> list:
+        nonlocal done
+        details = await loop.run_in_executor(
+            executor, _run_chunk, cls.__module__, cls.__name__, validator.options, list(data[start:stop]),
+        )
+        for detail in details:
+            if detail.index is not None:
+                detail.index += start
+        done += stop - start
+        validator.report_progress(done, total)
+        return details
+
+    chunk_results = await asyncio.gather(*(_submit(start, stop) for start, stop in ranges))
+    return [detail for details in chunk_results for detail in details]
@@ -0,0 +1,215 @@
+# result_cache.py
+"""Content-addressed per-item cache of validator results.
+
+Key: (gate source fingerprint, normalized options hash, item content hash).
+Value: the ValidationDetail list the gate produced for that single item,
+stored without its index so it can be replayed at any dataset position.
+
+Opt-in: two tiers, an in-process LRU (on when CHECKR_RESULT_CACHE_SIZE > 0)
+and an optional shared Redis tier (CHECKR_RESULT_CACHE_REDIS_URL). Only
+validators with `cacheable = True` and `dataset_scoped = False` use it.
+
+Not stored: details reporting that an item could not be evaluated
+(exceptions, missing dependencies, unavailable backends, see
+is_transient_detail), so a one-off failure is retried next time instead of
+replayed. A gate that returns dataset-level details (index None) is run on
+the whole dataset and bypasses the cache from then on, since those details
+would be lost on a full hit and computed over the misses only on a partial one.
+"""
+
+import hashlib
+import importlib.util
+import json
+import sys
+from collections import OrderedDict
+from typing import Any
+
+import structlog
+
+from core.config import settings
+from middlewares.metrics_middleware import RESULT_CACHE_HITS, RESULT_CACHE_MISSES
+from validators.base_validator import BaseValidator, ParsedDataset, ValidationDetail
+
+logger = structlog.get_logger().bind(module=__name__)
+
+_fingerprints: dict[type, str] = {}
+
+
+def _sha(data: str | bytes) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def gate_fingerprint(cls: type) -> str:
+    """Hash of the source files of the validator class and its validator bases.
+
+    Editing a gate (or a base class it inherits from) changes its fingerprint,
+    so stale results are never replayed after a deploy.
+    """
+    if cls in _fingerprints:
+        return _fingerprints[cls]
+    parts = []
+    for klass in cls.__mro__:
+        if not (isinstance(klass, type) and issubclass(klass, BaseValidator)):
+            continue
+        module = sys.modules.get(klass.__module__)
+        path = getattr(module, "__file__", None)
+        if path is None:
+            spec = importlib.util.find_spec(klass.__module__)
+            path = spec.origin if spec else None
+        try:
+            with open(path, "rb") as f:
+                source_hash = _sha(f.read())
+        except (OSError, TypeError):
+            source_hash = "nosource"
+        parts.append(f"{klass.__module__}.{klass.__qualname__}:{source_hash}")
+    fingerprint = _sha("|".join(parts))
+    _fingerprints[cls] = fingerprint
+    return fingerprint
+
+
+def options_hash(options: dict[str, Any]) -> str:
+    return _sha(json.dumps(options, sort_keys=True, default=str))
+
+
+def item_hash(item) -> str:
+    return _sha(json.dumps(item.model_dump(), sort_keys=True, ensure_ascii=False))
+
+
+# Codes that mean "could not evaluate", not a verdict on the item
+_TRANSIENT_CODES = frozenset({"missing_dependency", "llm_unavailable"})
+
+
+def is_transient_detail(detail: ValidationDetail) -> bool:
+    code = detail.code or ""
+    return code in _TRANSIENT_CODES or code.endswith(("_error", "_exception"))
+
+
+class ResultCache:
+    def __init__(self, max_entries: int, redis_client=None, ttl: int = 86400, prefix: str = "checkr:rc:"):
+        self.max_entries = max_entries
+        self.redis = redis_client
+        self.ttl = ttl
+        self.prefix = prefix
+        self._lru: OrderedDict[str, list[dict]] = OrderedDict()
+        # gate fingerprint + options prefixes seen returning dataset-level details
+        self._dataset_level: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def _remember(self, key: str, value: list[dict]) -> None:
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    async def get_many(self, keys: list[str], gate: str) -> list[list[dict] | None]:
+        values: list[list[dict] | None] = []
+        remote_needed: list[int] = []
+        for i, key in enumerate(keys):
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                RESULT_CACHE_HITS.labels(gate=gate, tier="memory").inc()
+            else:
+                remote_needed.append(i)
+            values.append(value)
+
+        if self.redis is not None and remote_needed:
+            try:
+                raw = await self.redis.mget([self.prefix + keys[i] for i in remote_needed])
+            except Exception as e:
+                logger.warning("Result cache Redis read failed", error=str(e))
+                raw = [None] * len(remote_needed)
+            for i, payload in zip(remote_needed, raw):
+                if payload is None:
+                    continue
+                value = json.loads(payload)
+                values[i] = value
+                self._remember(keys[i], value)
+                RESULT_CACHE_HITS.labels(gate=gate, tier="redis").inc()
+
+        misses = sum(1 for v in values if v is None)
+        if misses:
+            RESULT_CACHE_MISSES.labels(gate=gate).inc(misses)
+        return values
+
+    async def set_many(self, entries: dict[str, list[dict]]) -> None:
+        for key, value in entries.items():
+            self._remember(key, value)
+        if self.redis is not None and entries:
+            try:
+                pipe = self.redis.pipeline()
+                for key, value in entries.items():
+                    pipe.set(self.prefix + key, json.dumps(value), ex=self.ttl)
+                await pipe.execute()
+            except Exception as e:
+                logger.warning("Result cache Redis write failed", error=str(e))
+
+    async def validate_with_cache(self, validator: BaseValidator, dataset: ParsedDataset) -> list[ValidationDetail]:
+        """Replay cached per-item results and run validator._validate on misses only."""
+        gate = validator.validator_name
+        prefix = f"{gate_fingerprint(type(validator))[:32]}:{options_hash(validator.options)[:32]}:"
+        if prefix in self._dataset_level:
+            return await validator._validate(dataset)
+        keys = [prefix + item_hash(item) for item in dataset]
+        cached = await self.get_many(keys, gate)
+
+        miss_positions = [i for i, value in enumerate(cached) if value is None]
+        results: list[ValidationDetail] = []
+        per_item: dict[int, list[dict]] = {i: [] for i in miss_positions}
+
+        if miss_positions:
+            miss_results = await validator._validate(ParsedDataset(dataset[i] for i in miss_positions))
+            if any(detail.index is None for detail in miss_results):
+                # Dataset-level entries (charts, summaries) need the whole dataset every time
+                self._dataset_level.add(prefix)
+                if len(miss_positions) < len(dataset):
+                    return await validator._validate(dataset)
+                return miss_results
+            transient: set[int] = set()
+            for detail in miss_results:
+                position = miss_positions[detail.index]
+                detail.index = position
+                if is_transient_detail(detail):
+                    transient.add(position)
+                per_item[position].append(detail.model_dump(exclude={"index"}))
+                results.append(detail)
+            await self.set_many({keys[i]: per_item[i] for i in miss_positions if i not in transient})
+
+        for i, value in enumerate(cached):
+            if value:
+                results.extend(ValidationDetail(index=i, **entry) for entry in value)
+        if len(miss_positions) < len(dataset):
+            validator.report_progress(len(dataset), len(dataset))
+
+        # Item order as an uncached run would produce
+        results.sort(key=lambda d: d.index)
+        return results
+
+
+_cache: ResultCache | None = None
+_cache_built = False
+
+
+def get_result_cache() -> ResultCache | None:
+    """Process-wide cache built from settings; None when disabled."""
+    global _cache, _cache_built
+    if not _cache_built:
+        _cache_built = True
+        if settings.result_cache_size > 0:
+            redis_client = None
+            if settings.result_cache_redis_url:
+                import redis.asyncio as aioredis
+                redis_client = aioredis.from_url(settings.result_cache_redis_url, decode_responses=True)
+            _cache = ResultCache(settings.result_cache_size, redis_client, ttl=settings.result_cache_ttl)
+    return _cache
+
+
+def reset_result_cache() -> None:
+    """Drop the process-wide cache so it is rebuilt from current settings."""
+    global _cache, _cache_built
+    _cache = None
+    _cache_built = False
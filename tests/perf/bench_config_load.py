@@ -0,0 +1,57 @@
+"""Benchmark per-request construction cost of LLM validators, uncached vs. cached config.
+
+Every G-Eval / GABRIEL validator instance loads config/llm.yaml in its
+constructor, and a request builds one instance per LLM gate. This constructs
+GEvalRelevanceValidator and GabrielRateValidator BENCH_ROUNDS times each,
+first with the legacy loader (read file, expand ${VAR}, parse YAML every
+time — utils.yaml.read_and_expand_yaml) and then with the cached, mtime-aware
+utils.yaml.load_and_expand_yaml, and prints µs per construction.
+
+Env vars:
+    BENCH_ROUNDS  – constructions per validator and mode (default: 2000)
+
+Usage:
+    python tests/perf/bench_config_load.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from utils.yaml import load_and_expand_yaml, read_and_expand_yaml, reload_yaml_cache  # noqa: E402
+from validators.gate7_automatic_quality_grading.gabriel_rate_validator import GabrielRateValidator  # noqa: E402
+from validators.gate7_automatic_quality_grading.geval_relevance_validator import GEvalRelevanceValidator  # noqa: E402
+
+ROUNDS = int(os.environ.get("BENCH_ROUNDS", "2000"))
+VALIDATORS = (
+    ("geval", GEvalRelevanceValidator, "validators.base_geval_validator.load_and_expand_yaml"),
+    ("gabriel", GabrielRateValidator, "validators.base_gabriel_validator.load_and_expand_yaml"),
+)
+
+
+def _construct(cls) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        cls()
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+def main() -> None:
+    print(f"{ROUNDS} constructions per validator and mode", file=sys.stderr)
+    print(f"{'validator':>10}  {'uncached µs':>12}  {'cached µs':>10}  {'speedup':>8}")
+    print("─" * 46)
+    for name, cls, target in VALIDATORS:
+        with patch(target, read_and_expand_yaml):
+            uncached = _construct(cls)
+        reload_yaml_cache()
+        with patch(target, load_and_expand_yaml):
+            cached = _construct(cls)
+        print(f"{name:>10}  {uncached:>12.1f}  {cached:>10.1f}  {uncached / cached:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
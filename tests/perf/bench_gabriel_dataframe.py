@@ -0,0 +1,98 @@
+"""Benchmark GABRIEL DataFrame construction for a request running several GABRIEL gates.
+
+Every GABRIEL gate turns the dataset into a text / user_text / full_dialog
+DataFrame before calling gabriel.*. This compares, for a request with
+BENCH_GATES such gates:
+
+  legacy    – each gate builds the frame from a list of row dicts
+  columnar  – each gate builds it column by column (messages_to_dataframe)
+  shared    – built once per request and memoized on the ParsedDataset,
+              each gate gets a deep copy (BaseGabrielValidator.shared_dataframe)
+
+Env vars:
+    BENCH_ITEMS   – number of dataset items (default: 50000)
+    BENCH_MSGS    – messages per item, must be even (default: 4)
+    BENCH_GATES   – GABRIEL gates per request (default: 4, i.e. rate + classify + rank + discover)
+
+Usage:
+    python tests/perf/bench_gabriel_dataframe.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from validators.base_gabriel_validator import BaseGabrielValidator  # noqa: E402
+from validators.base_validator import ParsedDataset  # noqa: E402
+
+NUM_ITEMS = int(os.environ.get("BENCH_ITEMS", "50000"))
+MSGS_PER_ITEM = int(os.environ.get("BENCH_MSGS", "4"))
+GATES = int(os.environ.get("BENCH_GATES", "4"))
+
+
+def _legacy_dataframe(data) -> pd.DataFrame:
+    rows = []
+    for idx, item in enumerate(data):
+        assistant_parts = []
+        user_parts = []
+        dialog_parts = []
+        for msg in item.messages:
+            dialog_parts.append(f"{msg.role}: {msg.content}")
+            if msg.role == "assistant":
+                assistant_parts.append(msg.content)
+            elif msg.role == "user":
+                user_parts.append(msg.content)
+        rows.append({
+            "item_index": idx,
+            "text": "\n\n".join(assistant_parts),
+            "user_text": "\n\n".join(user_parts),
+            "full_dialog": "\n".join(dialog_parts),
+        })
+    return pd.DataFrame(rows)
+
+
+def _make_dataset() -> ParsedDataset:
+    return ParsedDataset.parse(
+        {"messages": [
+            {"role": "user" if m % 2 == 0 else "assistant", "content": f"item {i} message {m}"}
+            for m in range(MSGS_PER_ITEM)
+        ]}
+        for i in range(NUM_ITEMS)
+    )
+
+
+def _request(build) -> float:
+    dataset = _make_dataset()
+    start = time.perf_counter()
+    for _ in range(GATES):
+        build(dataset)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{NUM_ITEMS} items × {MSGS_PER_ITEM} messages, {GATES} GABRIEL gates per request", file=sys.stderr)
+    assert _legacy_dataframe(_make_dataset()[:50]).equals(
+        BaseGabrielValidator.messages_to_dataframe(_make_dataset()[:50])
+    )
+
+    modes = (
+        ("legacy", _legacy_dataframe),
+        ("columnar", BaseGabrielValidator.messages_to_dataframe),
+        ("shared", BaseGabrielValidator.shared_dataframe),
+    )
+    print(f"{'mode':>10}  {'ms/request':>11}  {'speedup':>8}")
+    print("─" * 34)
+    baseline = None
+    for name, build in modes:
+        elapsed = _request(build)
+        baseline = baseline or elapsed
+        print(f"{name:>10}  {elapsed * 1e3:>11.1f}  {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
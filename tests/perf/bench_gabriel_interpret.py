@@ -0,0 +1,76 @@
+"""Benchmark GABRIEL result interpretation across result sizes and check it scales linearly.
+
+Builds synthetic GABRIEL output frames of 1k … 100k rows and times the
+post-LLM interpretation step: GabrielRankValidator._interpret_results (flat
+ranking report plus leave-one-out outlier detection) and
+GabrielRateValidator._interpret_results (threshold check plus histogram).
+Prints ms and µs/row per size and exits non-zero if the per-row cost at the
+largest size exceeds BENCH_MAX_GROWTH times the per-row cost at the
+smallest, i.e. if interpretation stops being O(n).
+
+Env vars:
+    BENCH_SIZES       – comma-separated row counts (default: 1000,10000,100000)
+    BENCH_MAX_GROWTH  – allowed per-row cost growth, largest vs. smallest size (default: 3)
+
+Usage:
+    python tests/perf/bench_gabriel_interpret.py
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from validators.gate7_automatic_quality_grading.gabriel_rank_validator import GabrielRankValidator  # noqa: E402
+from validators.gate7_automatic_quality_grading.gabriel_rate_validator import GabrielRateValidator  # noqa: E402
+
+SIZES = [int(s) for s in os.environ.get("BENCH_SIZES", "1000,10000,100000").split(",")]
+MAX_GROWTH = float(os.environ.get("BENCH_MAX_GROWTH", "3"))
+ATTRS = {"helpfulness": "", "clarity": "", "accuracy": ""}
+
+
+def _frame(n: int, loc: float, scale: float) -> pd.DataFrame:
+    rng = np.random.default_rng(n)
+    df = pd.DataFrame(rng.normal(loc, scale, size=(n, len(ATTRS))), columns=list(ATTRS))
+    df["item_index"] = np.arange(n)
+    return df
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rank = GabrielRankValidator(options={"attributes": ATTRS, "fail_on_outliers": True})
+    rate = GabrielRateValidator(options={"attributes": ATTRS, "score_threshold": 70})
+
+    print(f"{'rows':>8}  {'rank ms':>9}  {'rank µs/row':>12}  {'rate ms':>9}  {'rate µs/row':>12}")
+    print("─" * 58)
+    per_row: dict[str, list[float]] = {"rank": [], "rate": []}
+    for n in SIZES:
+        rank_df, rate_df = _frame(n, 0.0, 1.0), _frame(n, 80.0, 10.0)
+        rank_s = _time(lambda: rank._interpret_results(rank_df, rank_df, []))
+        rate_s = _time(lambda: rate._interpret_results(rate_df, rate_df, []))
+        per_row["rank"].append(rank_s / n)
+        per_row["rate"].append(rate_s / n)
+        print(f"{n:>8}  {rank_s * 1e3:>9.1f}  {rank_s / n * 1e6:>12.2f}  "
+              f"{rate_s * 1e3:>9.1f}  {rate_s / n * 1e6:>12.2f}")
+
+    failed = False
+    for name, costs in per_row.items():
+        growth = costs[-1] / costs[0]
+        verdict = "ok" if growth <= MAX_GROWTH else "NOT LINEAR"
+        failed |= growth > MAX_GROWTH
+        print(f"{name}: per-row cost x{growth:.2f} from {SIZES[0]} to {SIZES[-1]} rows — {verdict}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
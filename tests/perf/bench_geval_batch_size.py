@@ -0,0 +1,131 @@
+"""Benchmark G-Eval relevance scoring throughput across batch sizes against the mock LLM.
+
+Runs GEvalRelevanceValidator over a synthetic dataset of short dialogs once per
+`batch_size` K (pairs packed into one numbered, JSON-scored prompt) through the
+real pooled OpenAI client, and prints LLM call count, wall time and pairs/s.
+Since the mock answers every call after a fixed delay, calls should drop by
+about K and throughput rise accordingly until batch_token_budget caps K.
+
+Starts tests/perf/mock_llm_server.py on BENCH_LLM_PORT unless it is already
+listening there. The LLM response cache is disabled for the run.
+
+Env vars:
+    BENCH_ITEMS        – number of dataset items (default: 200)
+    BENCH_PAIRS        – user/assistant pairs per item (default: 3)
+    BENCH_BATCH_SIZES  – comma-separated K values (default: 1,2,4,8,16)
+    BENCH_CONCURRENCY  – validator max_concurrency (default: 20)
+    BENCH_LLM_PORT     – mock LLM server port (default: 1234)
+    MOCK_DELAY         – per-call latency of a spawned mock server (default: 0.05)
+
+Usage:
+    python tests/perf/bench_geval_batch_size.py
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from core.config import settings  # noqa: E402
+from services.llm_client import close_llm_clients  # noqa: E402
+from validators.base_validator import ParsedDataset  # noqa: E402
+from validators.gate7_automatic_quality_grading.geval_relevance_validator import GEvalRelevanceValidator  # noqa: E402
+
+NUM_ITEMS = int(os.environ.get("BENCH_ITEMS", "200"))
+NUM_PAIRS = int(os.environ.get("BENCH_PAIRS", "3"))
+BATCH_SIZES = [int(k) for k in os.environ.get("BENCH_BATCH_SIZES", "1,2,4,8,16").split(",")]
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", "20"))
+PORT = int(os.environ.get("BENCH_LLM_PORT", "1234"))
+BASE_URL = f"http://127.0.0.1:{PORT}"
+
+
+class _CountingRelevanceValidator(GEvalRelevanceValidator):
+    calls = 0
+
+    async def call_llm(self, prompt: str, model: str) -> str:
+        _CountingRelevanceValidator.calls += 1
+        return await super().call_llm(prompt, model)
+
+
+def _mock_is_up() -> bool:
+    try:
+        return httpx.get(f"{BASE_URL}/health", timeout=0.5).status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+def _start_mock() -> subprocess.Popen | None:
+    if _mock_is_up():
+        return None
+    env = {**os.environ, "MOCK_DELAY": os.environ.get("MOCK_DELAY", "0.05")}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "mock_llm_server:app", "--port", str(PORT), "--log-level", "warning"],
+        cwd=Path(__file__).parent, env=env,
+    )
+    for _ in range(100):
+        if _mock_is_up():
+            return proc
+        time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("mock LLM server did not start")
+
+
+def _make_dataset() -> ParsedDataset:
+    def _messages(i: int) -> list[dict]:
+        messages = []
+        for j in range(NUM_PAIRS):
+            messages.append({"role": "user", "content": f"What does len() return? ({i}.{j})"})
+            messages.append({"role": "assistant", "content": "The number of items in a container."})
+        return messages
+
+    return ParsedDataset.parse({"messages": _messages(i)} for i in range(NUM_ITEMS))
+
+
+async def _run(data: ParsedDataset, batch_size: int) -> tuple[int, float, str]:
+    _CountingRelevanceValidator.calls = 0
+    validator = _CountingRelevanceValidator({"max_concurrency": CONCURRENCY, "batch_size": batch_size})
+    start = time.perf_counter()
+    result = await validator.validate(data)
+    elapsed = time.perf_counter() - start
+    await close_llm_clients()
+    return _CountingRelevanceValidator.calls, elapsed, result["status"]
+
+
+def main() -> None:
+    proc = _start_mock()
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as f:
+        f.write(f"geval:\n  model: mock\n  api_base: {BASE_URL}/v1\n  temperature: 0.0\n")
+    settings.llm_config_path = f.name
+    settings.llm_cache_backend = "off"
+    settings.result_cache_size = 0
+
+    try:
+        data = _make_dataset()
+        pairs = NUM_ITEMS * NUM_PAIRS
+        print(f"{NUM_ITEMS} items × {NUM_PAIRS} pairs, max_concurrency={CONCURRENCY}", file=sys.stderr)
+        print(f"{'K':>4}  {'calls':>6}  {'seconds':>8}  {'pairs/s':>8}  {'status':>7}")
+        print("─" * 42)
+        baseline = None
+        for batch_size in BATCH_SIZES:
+            calls, elapsed, status = asyncio.run(_run(data, batch_size))
+            baseline = baseline or elapsed
+            print(
+                f"{batch_size:>4}  {calls:>6}  {elapsed:>8.2f}  {pairs / elapsed:>8.0f}  {status:>7}"
+                f"   ({baseline / elapsed:.1f}x)"
+            )
+    finally:
+        os.unlink(f.name)
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark per-request dataset parsing cost as the number of gates grows.
+
+Compares the legacy path (every gate receives raw dicts and re-parses them
+into MessagesItem) with the shared ParsedDataset path (parsed once at
+ingress, handed to every gate as-is). Gates are MockValidator subclasses
+that yield once, so — as with real IO-bound gates — every gate's copy of
+the dataset is alive at the same time. The measured cost is parsing and
+allocation only, not validation logic.
+
+Env vars:
+    BENCH_ITEMS   – number of dataset items (default: 50000)
+    BENCH_MSGS    – messages per item, must be even (default: 4)
+    BENCH_GATES   – comma-separated gate counts to sweep (default: 1,2,4,6)
+
+Usage:
+    python tests/perf/bench_parsed_dataset.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from schemas.validators import DataItem  # noqa: E402
+from validators.base_validator import MessagesItem, ParsedDataset, ValidationDetail  # noqa: E402
+from validators.mock.mock_validator import MockValidator  # noqa: E402
+
+NUM_ITEMS = int(os.environ.get("BENCH_ITEMS", "50000"))
+MSGS_PER_ITEM = int(os.environ.get("BENCH_MSGS", "4"))
+GATE_COUNTS = [int(g) for g in os.environ.get("BENCH_GATES", "1,2,4,6").split(",")]
+
+
+class _YieldingValidator(MockValidator):
+    async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
+        await asyncio.sleep(0.01)
+        return []
+
+
+def _make_dataset() -> list[DataItem]:
+    raw = [
+        {"messages": [
+            {"role": "user" if m % 2 == 0 else "assistant", "content": f"item {i} message {m}"}
+            for m in range(MSGS_PER_ITEM)
+        ]}
+        for i in range(NUM_ITEMS)
+    ]
+    return [DataItem.model_validate(item) for item in raw]
+
+
+async def _legacy(dataset: list[DataItem], n_gates: int) -> None:
+    raw_dataset = [item.model_dump() for item in dataset]
+    await asyncio.gather(*(_YieldingValidator().validate(raw_dataset) for _ in range(n_gates)))
+
+
+async def _shared(dataset: list[DataItem], n_gates: int) -> None:
+    parsed = ParsedDataset.from_models(dataset)
+    await asyncio.gather(*(_YieldingValidator().validate(parsed) for _ in range(n_gates)))
+
+
+def _measure(fn, dataset: list[DataItem], n_gates: int) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(fn(dataset, n_gates))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def main() -> None:
+    print(f"Building dataset: {NUM_ITEMS} items x {MSGS_PER_ITEM} messages", file=sys.stderr)
+    dataset = _make_dataset()
+
+    print(f"{'gates':>5}  {'legacy s':>9}  {'shared s':>9}  {'legacy MiB':>10}  {'shared MiB':>10}")
+    print("─" * 52)
+    for n_gates in GATE_COUNTS:
+        legacy_t, legacy_m = _measure(_legacy, dataset, n_gates)
+        shared_t, shared_m = _measure(_shared, dataset, n_gates)
+        print(f"{n_gates:>5}  {legacy_t:>9.2f}  {shared_t:>9.2f}  {legacy_m:>10.1f}  {shared_m:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark thread vs. process-pool execution of a CPU-bound validator.
+
+Runs LanguageConsistencyValidator (langdetect, pure Python, GIL-bound) over
+a synthetic dataset once in the default thread mode and then in process
+mode for each worker count, printing wall time and speedup. Expect close to
+linear speedup up to the number of physical cores.
+
+Env vars:
+    BENCH_ITEMS    – number of dataset items (default: 4000)
+    BENCH_WORKERS  – comma-separated worker counts (default: 1,2,4,8)
+
+Usage:
+    python tests/perf/bench_process_pool.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from core.config import settings  # noqa: E402
+from services import process_pool  # noqa: E402
+from validators.base_validator import ParsedDataset  # noqa: E402
+from validators.gate4_content_consistency.language_consistency_validator import (  # noqa: E402
+    LanguageConsistencyValidator,
+)
+
+NUM_ITEMS = int(os.environ.get("BENCH_ITEMS", "4000"))
+WORKER_COUNTS = [int(w) for w in os.environ.get("BENCH_WORKERS", "1,2,4,8").split(",")]
+
+
+def _make_dataset() -> ParsedDataset:
+    return ParsedDataset.parse(
+        {"messages": [
+            {"role": "user", "content": f"Could you please explain how photosynthesis works, item {i}?"},
+            {"role": "assistant", "content": "Plants convert sunlight, water and carbon dioxide into sugar."},
+        ]}
+        for i in range(NUM_ITEMS)
+    )
+
+
+def _timed(data: ParsedDataset) -> float:
+    start = time.perf_counter()
+    asyncio.run(LanguageConsistencyValidator().validate(data))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    data = _make_dataset()
+    print(f"{NUM_ITEMS} items, {os.cpu_count()} CPUs", file=sys.stderr)
+
+    LanguageConsistencyValidator.execution = "thread"
+    baseline = _timed(data)
+    print(f"{'mode':>10}  {'seconds':>8}  {'speedup':>8}")
+    print("─" * 32)
+    print(f"{'thread':>10}  {baseline:>8.2f}  {1.0:>8.2f}")
+
+    LanguageConsistencyValidator.execution = "process"
+    settings.process_pool_min_chunk = 1
+    for workers in WORKER_COUNTS:
+        settings.process_pool_workers = workers
+        process_pool.register_preload(LanguageConsistencyValidator.__module__)
+        # warm-up run spawns the workers and imports langdetect profiles
+        _timed(data[:workers * 4])
+        elapsed = _timed(data)
+        print(f"{f'process x{workers}':>10}  {elapsed:>8.2f}  {baseline / elapsed:>8.2f}")
+        process_pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark per-criterion vs. single-call rubric scoring against the mock LLM.
+
+Runs GEvalRubricValidator over a synthetic dialog dataset twice — default
+mode (one call per criterion × pair) and `single_call: true` (one JSON call
+per pair) — through the real pooled OpenAI client, and prints LLM call
+count and wall time for each. Expect calls and time to drop by roughly the
+number of rubric criteria.
+
+Starts tests/perf/mock_llm_server.py on BENCH_LLM_PORT unless it is already
+listening there. The LLM response cache is disabled for the run.
+
+Env vars:
+    BENCH_ITEMS        – number of dataset items (default: 200)
+    BENCH_CONCURRENCY  – validator max_concurrency (default: 20)
+    BENCH_LLM_PORT     – mock LLM server port (default: 1234)
+    MOCK_DELAY         – per-call latency of a spawned mock server (default: 0.05)
+
+Usage:
+    python tests/perf/bench_rubric_single_call.py
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from core.config import settings  # noqa: E402
+from services.llm_client import close_llm_clients  # noqa: E402
+from validators.base_validator import ParsedDataset  # noqa: E402
+from validators.gate7_automatic_quality_grading.geval_rubric_validator import GEvalRubricValidator  # noqa: E402
+
+NUM_ITEMS = int(os.environ.get("BENCH_ITEMS", "200"))
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", "20"))
+PORT = int(os.environ.get("BENCH_LLM_PORT", "1234"))
+BASE_URL = f"http://127.0.0.1:{PORT}"
+
+
+class _CountingRubricValidator(GEvalRubricValidator):
+    calls = 0
+
+    async def call_llm(self, prompt: str, model: str) -> str:
+        _CountingRubricValidator.calls += 1
+        return await super().call_llm(prompt, model)
+
+
+def _mock_is_up() -> bool:
+    try:
+        return httpx.get(f"{BASE_URL}/health", timeout=0.5).status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+def _start_mock() -> subprocess.Popen | None:
+    if _mock_is_up():
+        return None
+    env = {**os.environ, "MOCK_DELAY": os.environ.get("MOCK_DELAY", "0.05")}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "mock_llm_server:app", "--port", str(PORT), "--log-level", "warning"],
+        cwd=Path(__file__).parent, env=env,
+    )
+    for _ in range(100):
+        if _mock_is_up():
+            return proc
+        time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("mock LLM server did not start")
+
+
+def _make_dataset() -> ParsedDataset:
+    return ParsedDataset.parse(
+        {"messages": [
+            {"role": "user", "content": f"How do I reverse a list in Python? ({i})"},
+            {"role": "assistant", "content": "Use reversed(items) or items[::-1]."},
+        ]}
+        for i in range(NUM_ITEMS)
+    )
+
+
+async def _run(data: ParsedDataset, single_call: bool) -> tuple[int, float, str]:
+    _CountingRubricValidator.calls = 0
+    validator = _CountingRubricValidator({"max_concurrency": CONCURRENCY, "single_call": single_call})
+    start = time.perf_counter()
+    result = await validator.validate(data)
+    elapsed = time.perf_counter() - start
+    await close_llm_clients()
+    return _CountingRubricValidator.calls, elapsed, result["status"]
+
+
+def main() -> None:
+    proc = _start_mock()
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as f:
+        f.write(f"geval:\n  model: mock\n  api_base: {BASE_URL}/v1\n  temperature: 0.0\n")
+    settings.llm_config_path = f.name
+    settings.llm_cache_backend = "off"
+    settings.result_cache_size = 0
+
+    try:
+        data = _make_dataset()
+        print(f"{NUM_ITEMS} items, 3 criteria, max_concurrency={CONCURRENCY}", file=sys.stderr)
+        print(f"{'mode':>14}  {'calls':>6}  {'seconds':>8}  {'status':>7}")
+        print("─" * 42)
+        baseline = None
+        for label, single_call in (("per-criterion", False), ("single-call", True)):
+            calls, elapsed, status = asyncio.run(_run(data, single_call))
+            baseline = baseline or elapsed
+            print(f"{label:>14}  {calls:>6}  {elapsed:>8.2f}  {status:>7}   ({baseline / elapsed:.1f}x)")
+    finally:
+        os.unlink(f.name)
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
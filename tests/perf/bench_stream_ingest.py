@@ -0,0 +1,79 @@
+"""Benchmark peak memory of streaming NDJSON ingestion as the upload grows.
+
+Drives api.validators._validate_stream with a synthetic, lazily generated
+gzip NDJSON body and the structural gate, and reports tracemalloc peak
+per dataset size. Peak memory should stay flat: only one chunk of parsed
+items is alive at a time, regardless of how many lines are uploaded.
+
+Env vars:
+    BENCH_SIZES       – comma-separated item counts (default: 10000,50000,200000)
+    BENCH_CHUNK_SIZE  – items per gate chunk (default: 1000)
+
+Usage:
+    python tests/perf/bench_stream_ingest.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from api.validators import _validate_stream  # noqa: E402
+from utils.ndjson import iter_ndjson_lines  # noqa: E402
+from validators.gate1_structural_validation.chat_struct_validator import ChatStructureValidator  # noqa: E402
+
+SIZES = [int(n) for n in os.environ.get("BENCH_SIZES", "10000,50000,200000").split(",")]
+CHUNK_SIZE = int(os.environ.get("BENCH_CHUNK_SIZE", "1000"))
+GATE = "backend/gate1_structural_validation/chat_struct_validator.py"
+
+
+async def _gzip_body(n_items: int, net_chunk: int = 64 * 1024):
+    """Yield a gzip NDJSON body in network-sized chunks without materializing it."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    pending = b""
+    for i in range(n_items):
+        item = {"messages": [
+            {"role": "user", "content": f"question {i}"},
+            {"role": "assistant", "content": f"answer {i}"},
+        ]}
+        pending += compressor.compress(json.dumps(item).encode() + b"\n")
+        if len(pending) >= net_chunk:
+            yield pending
+            pending = b""
+    yield pending + compressor.flush()
+
+
+def _fake_request():
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(
+        backend_validators_dict={GATE: ChatStructureValidator},
+    )))
+
+
+async def _run(n_items: int) -> dict:
+    lines = iter_ndjson_lines(_gzip_body(n_items))
+    return await _validate_stream([GATE], lines, {}, CHUNK_SIZE, _fake_request())
+
+
+def main() -> None:
+    print(f"{'items':>8}  {'seconds':>8}  {'peak MiB':>9}")
+    print("─" * 30)
+    for n_items in SIZES:
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = asyncio.run(_run(n_items))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert result["items"] == n_items, result
+        print(f"{n_items:>8}  {elapsed:>8.2f}  {peak / (1024 * 1024):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 """Mock OpenAI-compatible LLM server for performance testing.
 
 Returns a fixed "Score: 85" response after a configurable delay
-to simulate real LLM latency.
+to simulate real LLM latency. Prompts asking for a JSON object of
+scores (multi-criterion rubric, shape `{"name": <1-100>, ...}`) get a
+JSON object with 85 for every requested key.
 """
 
 import asyncio
+import json
 import os
+import re
 import time
 
 from fastapi import FastAPI
@@ -15,6 +19,8 @@ app = FastAPI(title="Mock LLM Server")
 
 MOCK_DELAY = float(os.environ.get("MOCK_DELAY", "0.1"))
 
+_JSON_SCORE_KEY = re.compile(r'"([^"]+)": <1-100>')
+
 
 class ChatMessage(BaseModel):
     role: str
@@ -30,6 +36,9 @@ class ChatRequest(BaseModel):
 @app.post("/v1/chat/completions")
 async def chat_completions(request: ChatRequest):
     await asyncio.sleep(MOCK_DELAY)
+    prompt = request.messages[-1].content if request.messages else ""
+    keys = _JSON_SCORE_KEY.findall(prompt)
+    content = json.dumps({key: 85 for key in keys}) if keys else "Score: 85"
     return {
         "id": f"mock-{time.time_ns()}",
         "object": "chat.completion",
@@ -38,7 +47,7 @@ async def chat_completions(request: ChatRequest):
         "choices": [
             {
                 "index": 0,
-                "message": {"role": "assistant", "content": "Score: 85"},
+                "message": {"role": "assistant", "content": content},
                 "finish_reason": "stop",
             }
         ],
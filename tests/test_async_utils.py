@@ -1,7 +1,15 @@
 import asyncio
 import time
 import pytest
-from utils.async_utils import gather_with_semaphore
+from utils.async_utils import (
+    AdaptiveLimiter,
+    ThrottledError,
+    gather_calls,
+    gather_unique,
+    gather_with_limiter,
+    gather_with_semaphore,
+    is_throttle_error,
+)
 
 
 @pytest.mark.asyncio
@@ -87,3 +95,117 @@ async def test_actual_speedup():
     assert all(results)
     # 10 tasks * 0.1s sequentially = 1s; concurrently should be ~0.1s
     assert elapsed < 0.5
+
+
+# ── Adaptive (AIMD) limiter ───────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_adaptive_limit_grows_while_latency_is_stable():
+    # generous tolerance: scheduler jitter on a busy CI box must not count as a latency rise
+    limiter = AdaptiveLimiter(initial=2, max_limit=8, latency_tolerance=100)
+
+    async def steady():
+        await asyncio.sleep(0.005)
+        return True
+
+    results = await gather_with_limiter([steady for _ in range(100)], limiter)
+    assert all(results)
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_backs_off_and_retries_throttled_calls():
+    limiter = AdaptiveLimiter(initial=8, max_limit=8)
+    attempts = {}
+
+    def make(i):
+        async def call():
+            attempts[i] = attempts.get(i, 0) + 1
+            await asyncio.sleep(0.001)
+            if i % 2 == 0 and attempts[i] == 1:
+                raise ThrottledError(status=429, retry_after=0.01)
+            return i
+        return call
+
+    results = await gather_with_limiter([make(i) for i in range(8)], limiter)
+    assert results == list(range(8))
+    assert limiter.limit < 8
+    assert sum(attempts.values()) == 12
+
+
+@pytest.mark.asyncio
+async def test_adaptive_burst_of_throttles_backs_off_once_per_window():
+    """Before any latency is known, a window of throttled calls still halves the limit only once."""
+    limiter = AdaptiveLimiter(initial=8, max_limit=8)
+    first_attempt = asyncio.Event()
+    throttled = 0
+
+    async def call():
+        nonlocal throttled
+        if throttled < 8:
+            throttled += 1
+            if throttled == 8:
+                first_attempt.set()
+            await first_attempt.wait()  # all eight in flight together, then all fail
+            raise ThrottledError(status=429, retry_after=0.05)
+        return True
+
+    task = asyncio.ensure_future(gather_with_limiter([call for _ in range(8)], limiter))
+    await first_attempt.wait()
+    await asyncio.sleep(0.01)
+    # one cut for the whole window, not 8 → 4 → 2 → 1
+    assert limiter.limit == 4
+    assert await task == [True] * 8
+
+
+@pytest.mark.asyncio
+async def test_adaptive_gives_up_after_max_retries():
+    async def always_throttled():
+        raise ThrottledError(status=503, retry_after=0)
+
+    results = await gather_with_limiter([always_throttled], AdaptiveLimiter(), max_retries=2)
+    assert isinstance(results[0], ThrottledError)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_does_not_retry_other_errors():
+    calls = 0
+
+    async def boom():
+        nonlocal calls
+        calls += 1
+        raise ValueError("boom")
+
+    results = await gather_calls([boom], adaptive=True)
+    assert isinstance(results[0], ValueError)
+    assert calls == 1
+
+
+def test_is_throttle_error_follows_cause_chain():
+    class StatusError(Exception):
+        status_code = 429
+
+    try:
+        try:
+            raise StatusError()
+        except StatusError as e:
+            raise RuntimeError("LLM call failed") from e
+    except RuntimeError as wrapped:
+        assert is_throttle_error(wrapped)
+
+    assert not is_throttle_error(RuntimeError("plain"))
+
+
+@pytest.mark.asyncio
+async def test_gather_unique_fans_out_results():
+    seen = []
+
+    async def square(x):
+        seen.append(x)
+        return x * x
+
+    results, saved = await gather_unique([3, 1, 3, 2, 1], square)
+    assert results == [9, 1, 9, 4, 1]
+    assert saved == 2
+    assert sorted(seen) == [1, 2, 3]
@@ -368,6 +368,163 @@ class TestGabrielRankValidator:
         errors = result["errors"]
         assert any("at least" in e.get("error", "") for e in errors)
 
+    @pytest.mark.asyncio
+    async def test_rank_grouped_runs_groups_concurrently(self, tmp_path):
+        """Groups are ranked in parallel up to group_concurrency; columns map back correctly."""
+        import asyncio
+
+        from validators.base_validator import MessagesItem
+        from validators.gate7_automatic_quality_grading.gabriel_rank_validator import (
+            GabrielRankValidator,
+        )
+
+        running = 0
+        peak = 0
+
+        async def slow_rank(df, column_name, attributes, save_dir, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # the first group finishes last
+            await asyncio.sleep(0.05 if "photosynthesis" in df["user_text"].iloc[0] else 0.01)
+            running -= 1
+            return await _mock_rank(df, column_name, attributes, save_dir)
+
+        data = GROUPED_SAMPLE_DATA + [
+            {"messages": [
+                {"role": "user", "content": "Define entropy"},
+                {"role": "assistant", "content": f"Entropy answer {i}"},
+            ]}
+            for i in range(3)
+        ]
+        progress = []
+        validator = GabrielRankValidator(
+            options={"min_group_size": 3, "fail_on_outliers": False, "group_concurrency": 2},
+            progress_callback=progress.append,
+        )
+        df = validator.messages_to_dataframe([MessagesItem(**d) for d in data])
+        groups = list(df["user_text"].unique())
+
+        with patch.object(mock_gabriel, "rank", slow_rank):
+            result = await validator._run_grouped(
+                df, "text", str(tmp_path), groups, {"quality": "q"}, 3, "m", False, 3,
+            )
+
+        assert peak == 2
+        assert list(result["item_index"]) == list(range(9))
+        assert list(result["_rank_group"]) == [g for g in groups for _ in range(3)]
+        counts = [p["current"] for p in progress if "current" in p]
+        assert counts == [1, 2, 3]
+        assert all(p["total"] == 3 for p in progress if "total" in p)
+
+    @pytest.mark.asyncio
+    async def test_rank_adaptive_stops_when_order_settles(self):
+        """Adaptive mode adds rounds until consecutive rankings agree, then reports rounds and ±SE."""
+        from validators.gate7_automatic_quality_grading.gabriel_rank_validator import (
+            GabrielRankValidator,
+        )
+
+        calls = []
+        # round 1 and 2 disagree, round 3 reproduces round 2's order
+        orders = {1: [4, 3, 2, 1, 0], 2: [0, 1, 2, 3, 4], 3: [0, 1, 2, 3, 5]}
+
+        async def converging_rank(df, column_name, attributes, save_dir, **kwargs):
+            calls.append((kwargs["n_rounds"], kwargs["reset_files"], kwargs.get("return_raw_scores")))
+            result = df.copy()
+            for attr in attributes:
+                result[attr] = [float(v) for v in orders[kwargs["n_rounds"]]]
+                result[f"{attr}_raw"] = [2.0 * v for v in orders[kwargs["n_rounds"]]]
+                result[f"{attr}_se"] = 0.5 / kwargs["n_rounds"]
+            return result
+
+        with patch.object(mock_gabriel, "rank", converging_rank):
+            validator = GabrielRankValidator(options={
+                "min_items": 3, "n_rounds": 4, "fail_on_outliers": False,
+                "adaptive_rounds": True, "stability_threshold": 0.95,
+            })
+            result = await validator.validate(SAMPLE_DATA)
+
+        assert calls == [(1, True, True), (2, False, True), (3, False, True)]
+        report = result["info"][0]["error"]
+        assert "adaptive: 3/4 rounds, rank stability 1.000, ~29 LLM calls" in report
+        # raw SE 0.5 / 3 over the std of the raw scores (2 × [0, 1, 2, 3, 5] → 3.44)
+        assert "#1 item[4] score=5.00 ±0.05" in report
+
+    @pytest.mark.asyncio
+    async def test_rank_adaptive_respects_llm_call_budget(self):
+        from validators.gate7_automatic_quality_grading.gabriel_rank_validator import (
+            GabrielRankValidator,
+        )
+
+        rounds = []
+
+        async def shuffling_rank(df, column_name, attributes, save_dir, **kwargs):
+            rounds.append(kwargs["n_rounds"])
+            result = df.copy()
+            sign = 1 if kwargs["n_rounds"] % 2 else -1
+            for attr in attributes:
+                result[attr] = [sign * i for i in range(len(df))]
+            return result
+
+        with patch.object(mock_gabriel, "rank", shuffling_rank):
+            # 5 items: 5 calls for the rating pass + 8 per round → 2 rounds fit in 25
+            validator = GabrielRankValidator(options={
+                "min_items": 3, "n_rounds": 4, "fail_on_outliers": False,
+                "adaptive_rounds": True, "max_llm_calls": 25,
+            })
+            result = await validator.validate(SAMPLE_DATA)
+
+        assert rounds == [1, 2]
+        assert "adaptive: 2/4 rounds, rank stability -1.000, ~21 LLM calls" in result["info"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_rank_adaptive_budget_below_one_round_ranks_nothing(self):
+        from validators.gate7_automatic_quality_grading.gabriel_rank_validator import (
+            GabrielRankValidator,
+        )
+
+        rank = AsyncMock()
+        with patch.object(mock_gabriel, "rank", rank):
+            # 5 items: 5 calls for the rating pass + 8 for the first round > 10
+            validator = GabrielRankValidator(options={
+                "min_items": 3, "n_rounds": 4, "fail_on_outliers": False,
+                "adaptive_rounds": True, "max_llm_calls": 10,
+            })
+            result = await validator.validate(SAMPLE_DATA)
+
+        rank.assert_not_awaited()
+        assert result["status"] == "failed"
+        assert result["errors"][0]["code"] == "gabriel_error"
+        assert "max_llm_calls=10 is below the ~13 LLM calls" in result["errors"][0]["error"]
+
+    def test_find_outliers_matches_naive_leave_one_out(self):
+        """The running-sum leave-one-out stats agree with recomputing them per item."""
+        import numpy as np
+
+        from validators.gate7_automatic_quality_grading.gabriel_rank_validator import (
+            GabrielRankValidator,
+        )
+
+        rng = np.random.default_rng(7)
+        scores = rng.normal(size=(200, 2))
+        scores[[3, 50, 120]] -= 4.0
+        df = pd.DataFrame({"a": scores[:, 0], "b": scores[:, 1], "item_index": range(1000, 1200)})
+
+        outliers = GabrielRankValidator()._find_outliers(df, ["a", "b"], 1.5)
+
+        avg = scores.mean(axis=1)
+        expected = []
+        for i in range(len(avg)):
+            others = np.delete(avg, i)
+            if others.mean() - avg[i] > 0.1 and avg[i] < others.mean() - 1.5 * others.std():
+                expected.append((1000 + i, others.mean(), others.std()))
+        assert [o[0] for o in outliers] == [e[0] for e in expected]
+        assert {1003, 1050, 1120} <= {o[0] for o in outliers}
+        for (_, _, mean, std, detail), (_, exp_mean, exp_std) in zip(outliers, expected):
+            assert mean == pytest.approx(exp_mean)
+            assert std == pytest.approx(exp_std)
+            assert detail.startswith("a=")
+
     @pytest.mark.asyncio
     async def test_rank_equal_scores_passes_with_info(self):
         """When all scores are identical, no outliers — passes with ranking info."""
@@ -487,6 +644,49 @@ class TestBaseGabrielValidator:
         assert df.iloc[0]["user_text"] == "Hello"
         assert "item_index" in df.columns
 
+    @pytest.mark.asyncio
+    async def test_dataframe_built_once_per_request(self):
+        """GABRIEL gates of one request share a single read-only conversion."""
+        from validators.base_gabriel_validator import BaseGabrielValidator
+        from validators.base_validator import ParsedDataset
+        from validators.gate7_automatic_quality_grading.gabriel_classify_validator import (
+            GabrielClassifyValidator,
+        )
+        from validators.gate7_automatic_quality_grading.gabriel_rate_validator import (
+            GabrielRateValidator,
+        )
+
+        seen = []
+
+        async def mutating_rate(df, column_name, attributes, save_dir, **kwargs):
+            seen.append(df)
+            # in-place writes into existing column buffers, then a column replacement
+            df.loc[0, "user_text"] = "overwritten"
+            df.iloc[1, df.columns.get_loc("item_index")] = 99
+            df["text"] = "overwritten"
+            for attr in attributes:
+                df[attr] = 85.0
+            return df
+
+        async def recording_classify(df, column_name, labels, save_dir, **kwargs):
+            seen.append(df)
+            return await _mock_classify(df, column_name, labels, save_dir)
+
+        dataset = ParsedDataset.parse(SAMPLE_DATA)
+        with patch.object(BaseGabrielValidator, "messages_to_dataframe",
+                          wraps=BaseGabrielValidator.messages_to_dataframe) as build, \
+                patch.object(mock_gabriel, "rate", mutating_rate), \
+                patch.object(mock_gabriel, "classify", recording_classify):
+            assert (await GabrielRateValidator().validate(dataset))["status"] == "passed"
+            assert (await GabrielClassifyValidator().validate(dataset))["status"] == "passed"
+
+        assert build.call_count == 1
+        # the first gate's in-place edits don't leak into the second gate's frame
+        assert list(seen[1]["text"]) == [m["messages"][1]["content"] for m in SAMPLE_DATA]
+        assert list(seen[1]["item_index"]) == [0, 1, 2, 3, 4]
+        assert seen[1]["user_text"][0] == SAMPLE_DATA[0]["messages"][0]["content"]
+        assert "helpfulness" not in seen[1].columns
+
     @pytest.mark.asyncio
     async def test_missing_gabriel_returns_error(self):
         """Test graceful degradation when gabriel is not installed."""
@@ -508,3 +708,89 @@ class TestBaseGabrielValidator:
             assert any("not installed" in e.get("error", "") for e in errors)
         finally:
             bgv.gabriel = original_gabriel
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_use_their_own_client_config(self, monkeypatch):
+        """Each run binds its api_base/api_key to the response_fn; os.environ is never touched."""
+        import asyncio
+        import os
+        from types import SimpleNamespace
+
+        from validators.gate7_automatic_quality_grading.gabriel_rate_validator import (
+            GabrielRateValidator,
+        )
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+        calls = []
+
+        def fake_client(api_base, api_key):
+            async def create(**kwargs):
+                calls.append((api_base, api_key, kwargs["model"]))
+                await asyncio.sleep(0.01)
+                assert "OPENAI_BASE_URL" not in os.environ
+                return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))])
+            return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        async def rate_calling_llm(df, column_name, attributes, save_dir, response_fn=None, model=None, **kwargs):
+            responses, _duration = await response_fn("rate this", model=model, json_mode=True)
+            assert responses == ["{}"]
+            return await _mock_rate(df, column_name, attributes, save_dir)
+
+        validators = []
+        for name in ("a", "b"):
+            validator = GabrielRateValidator()
+            validator.config = {"api_base": f"http://{name}/v1", "api_key": f"key-{name}", "model": f"m-{name}"}
+            validators.append(validator)
+
+        with patch.object(mock_gabriel, "rate", rate_calling_llm), \
+             patch("validators.base_gabriel_validator.get_llm_client", side_effect=fake_client):
+            results = await asyncio.gather(*(v.validate(SAMPLE_DATA) for v in validators))
+
+        assert all(r["status"] == "passed" for r in results)
+        assert sorted(calls) == [("http://a/v1", "key-a", "m-a"), ("http://b/v1", "key-b", "m-b")]
+        assert "OPENAI_API_KEY" not in os.environ
+
+    @pytest.mark.asyncio
+    async def test_pooled_get_response_forwards_gabriel_arguments(self):
+        from types import SimpleNamespace
+
+        from validators.base_gabriel_validator import pooled_get_response
+
+        sent = {}
+
+        async def create(**kwargs):
+            sent.update(kwargs)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))])
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        schema = {"type": "object", "properties": {"score": {"type": "number"}}}
+        with patch("validators.base_gabriel_validator.get_llm_client", return_value=client), \
+             patch("validators.base_gabriel_validator.logger") as logger:
+            await pooled_get_response(
+                "rate this", model="m", json_mode=True, expected_schema=schema,
+                max_output_tokens=256, reasoning_effort="low", service_tier="flex",
+                verbose=False, web_search=False, tools=[{"type": "web_search"}],
+            )
+
+        assert sent["max_tokens"] == 256
+        assert sent["reasoning_effort"] == "low"
+        assert sent["service_tier"] == "flex"
+        assert sent["response_format"] == {
+            "type": "json_schema",
+            "json_schema": {"name": "gabriel_structured_response", "strict": True, "schema": schema},
+        }
+        # only request-changing arguments that are actually set are reported
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.kwargs["args"] == ["tools"]
+
+    @pytest.mark.asyncio
+    async def test_pooled_get_response_dummy_mode_makes_no_call(self):
+        from validators.base_gabriel_validator import pooled_get_response
+
+        with patch("validators.base_gabriel_validator.get_llm_client") as get_client:
+            responses, duration, raw = await pooled_get_response("hi", n=2, use_dummy=True, return_raw=True)
+
+        assert responses == ["DUMMY hi", "DUMMY hi"]
+        assert duration == 0.0 and raw == []
+        get_client.assert_not_called()
@@ -0,0 +1,176 @@
+"""Tests for persistent, resumable GABRIEL work directories."""
+
+import asyncio
+import os
+import threading
+import types
+
+import pandas as pd
+import pytest
+
+from core.config import settings
+from services.gabriel_workdir import GabrielWorkDir, get_gabriel_work_dir, reset_gabriel_work_dir
+from validators.gate7_automatic_quality_grading import gabriel_rate_validator
+from validators.gate7_automatic_quality_grading.gabriel_rate_validator import GabrielRateValidator
+
+DATA = [
+    {"messages": [{"role": "user", "content": f"q{i}"}, {"role": "assistant", "content": f"a{i}"}]}
+    for i in range(3)
+]
+
+
+@pytest.fixture
+def work_root(tmp_path, monkeypatch):
+    root = tmp_path / "gabriel"
+    monkeypatch.setattr(settings, "gabriel_work_dir", str(root))
+    reset_gabriel_work_dir()
+    yield root
+    reset_gabriel_work_dir()
+
+
+@pytest.fixture
+def rate_calls(monkeypatch):
+    calls = []
+
+    async def rate(df, column_name, attributes, save_dir, **kwargs):
+        calls.append({"save_dir": save_dir, **kwargs})
+        # what GABRIEL would leave behind for a resume
+        with open(os.path.join(save_dir, "responses.csv"), "a") as f:
+            f.write("done\n")
+        result = df.copy()
+        for attr in attributes:
+            result[attr] = 90.0
+        return result
+
+    monkeypatch.setattr(gabriel_rate_validator, "gabriel", types.SimpleNamespace(rate=rate))
+    return calls
+
+
+def _frame(texts: list[str]) -> pd.DataFrame:
+    return pd.DataFrame({"item_index": range(len(texts)), "text": texts})
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(settings, "gabriel_work_dir", None)
+    reset_gabriel_work_dir()
+    assert get_gabriel_work_dir() is None
+
+
+def test_key_covers_gate_options_and_dataset(tmp_path):
+    work_dir = GabrielWorkDir(str(tmp_path), 1 << 20)
+    validator = GabrielRateValidator()
+    base = work_dir.path_for(validator, {"n_runs": 1}, _frame(["a", "b"]))
+
+    assert base == work_dir.path_for(validator, {"n_runs": 1}, _frame(["a", "b"]))
+    assert os.path.basename(base).startswith("GabrielRateValidator-")
+    assert base != work_dir.path_for(validator, {"n_runs": 2}, _frame(["a", "b"]))
+    assert base != work_dir.path_for(validator, {"n_runs": 1}, _frame(["a", "c"]))
+
+
+async def test_rerun_resumes_in_the_same_directory(work_root, rate_calls):
+    stages = []
+    first = GabrielRateValidator(progress_callback=stages.append)
+    assert (await first.validate(DATA))["status"] == "passed"
+
+    second = GabrielRateValidator(progress_callback=stages.append)
+    assert (await second.validate(DATA))["status"] == "passed"
+
+    assert [c["reset_files"] for c in rate_calls] == [False, False]
+    assert rate_calls[0]["save_dir"] == rate_calls[1]["save_dir"]
+    assert os.path.dirname(rate_calls[0]["save_dir"]) == str(work_root)
+    # kept on disk with both runs' output
+    with open(os.path.join(rate_calls[0]["save_dir"], "responses.csv")) as f:
+        assert f.read() == "done\ndone\n"
+    gabriel_stages = [s["stage"] for s in stages if s.get("stage", "").endswith(" gabriel")]
+    assert gabriel_stages == ["running gabriel", "resuming gabriel"]
+
+
+async def test_temp_dir_without_work_dir(monkeypatch, rate_calls):
+    monkeypatch.setattr(settings, "gabriel_work_dir", None)
+    reset_gabriel_work_dir()
+
+    await GabrielRateValidator().validate(DATA)
+
+    assert rate_calls[0]["reset_files"] is True
+    assert not os.path.exists(rate_calls[0]["save_dir"])
+
+
+async def test_concurrent_runs_with_the_same_key_are_serialized(work_root, monkeypatch):
+    running = []
+    overlapped = []
+    calls = []
+
+    async def rate(df, column_name, attributes, save_dir, **kwargs):
+        overlapped.append(bool(running))
+        running.append(save_dir)
+        calls.append(save_dir)
+        await asyncio.sleep(0.02)
+        with open(os.path.join(save_dir, "responses.csv"), "a") as f:
+            f.write("done\n")
+        running.remove(save_dir)
+        result = df.copy()
+        for attr in attributes:
+            result[attr] = 90.0
+        return result
+
+    monkeypatch.setattr(gabriel_rate_validator, "gabriel", types.SimpleNamespace(rate=rate))
+    stages = []
+    results = await asyncio.gather(
+        GabrielRateValidator(progress_callback=stages.append).validate(DATA),
+        GabrielRateValidator(progress_callback=stages.append).validate(DATA),
+    )
+
+    assert [r["status"] for r in results] == ["passed", "passed"]
+    assert calls[0] == calls[1]
+    assert overlapped == [False, False]
+    # the second run waited and then resumed from the first one's files
+    gabriel_stages = [s["stage"] for s in stages if s.get("stage", "").endswith(" gabriel")]
+    assert gabriel_stages == ["running gabriel", "resuming gabriel"]
+    assert get_gabriel_work_dir()._active == {}
+    assert get_gabriel_work_dir()._locks == {}
+
+
+async def test_release_evicts_off_the_event_loop(tmp_path):
+    work_dir = GabrielWorkDir(str(tmp_path), 0)
+    evict = work_dir.evict
+    threads = []
+
+    def recording_evict():
+        threads.append(threading.current_thread())
+        return evict()
+
+    work_dir.evict = recording_evict
+    path, _ = await work_dir.acquire(GabrielRateValidator(), {}, _frame(["a"]))
+    with open(os.path.join(path, "responses.csv"), "w") as f:
+        f.write("done\n")
+
+    await work_dir.release(path)
+
+    assert threads and threads[0] is not threading.main_thread()
+    assert not os.path.exists(path)
+
+
+def test_evicts_least_recently_used_idle_dirs(tmp_path):
+    work_dir = GabrielWorkDir(str(tmp_path), 250)
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        path = tmp_path / name
+        path.mkdir()
+        (path / "responses.csv").write_bytes(b"x" * 100)
+        mtime = 1_000_000 - age * 100
+        os.utime(path, (mtime, mtime))
+    work_dir._active[str(tmp_path / "oldest")] = 1
+
+    evicted = work_dir.evict()
+
+    assert evicted == [str(tmp_path / "middle")]
+    assert sorted(os.listdir(tmp_path)) == ["newest", "oldest"]
+
+
+def test_evict_skips_dirs_acquired_while_it_runs(tmp_path):
+    work_dir = GabrielWorkDir(str(tmp_path), 0)
+    (tmp_path / "busy").mkdir()
+    (tmp_path / "busy" / "responses.csv").write_bytes(b"x" * 100)
+    work_dir._active[str(tmp_path / "busy")] = 1
+
+    assert work_dir.evict() == []
+    assert os.listdir(tmp_path) == ["busy"]
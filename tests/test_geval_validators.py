@@ -1,6 +1,8 @@
 """Tests for GEval (LLM-as-a-judge) validators with mocked LLM calls."""
 
 import asyncio
+import math
+import re
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -64,9 +66,7 @@ AGENT_TRACES = [
 def _patch_geval_init():
     """Suppress real config loading and OpenAI client creation for all tests."""
     with patch("validators.base_geval_validator.load_and_expand_yaml", return_value=_MOCK_LLM_CONFIG), \
-         patch("validators.base_geval_validator.AsyncOpenAI"), \
-         patch("validators.base_geval_validator.httpx.AsyncClient"), \
-         patch("validators.base_geval_validator.httpx.AsyncHTTPTransport"):
+         patch("validators.base_geval_validator.get_llm_client"):
         yield
 
 
@@ -172,6 +172,149 @@ class TestGEvalRelevanceValidator:
         eval_errors = [e for e in errors if e["code"] == "eval_error"]
         assert len(eval_errors) == len(SAMPLE_DATA)
 
+    @pytest.mark.asyncio
+    async def test_adaptive_concurrency_retries_rate_limited_calls(self):
+        """With adaptive_concurrency a 429 is retried instead of becoming eval_error."""
+        from utils.async_utils import ThrottledError
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        llm = AsyncMock(side_effect=[ThrottledError(status=429, retry_after=0)] + ["85"] * len(SAMPLE_DATA))
+        validator = GEvalRelevanceValidator(options={"score_threshold": 70, "adaptive_concurrency": True})
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(SAMPLE_DATA)
+
+        assert result["status"] == "passed"
+        assert llm.await_count == len(SAMPLE_DATA) + 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_pairs_are_evaluated_once(self):
+        """Identical prompts across items share one LLM call; the saving is reported as info."""
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        data = [SAMPLE_DATA[0], SAMPLE_DATA[1], SAMPLE_DATA[0], SAMPLE_DATA[0]]
+        llm = AsyncMock(return_value="30")
+        validator = GEvalRelevanceValidator(options={"score_threshold": 70})
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(data)
+
+        assert llm.await_count == 2
+        # every occurrence still gets its own score
+        assert [e["index"] for e in result["errors"]] == [0, 1, 2, 3]
+        saved = [i for i in result["info"] if i["code"] == "llm_calls_deduplicated"]
+        assert saved[0]["error"] == "Deduplicated identical prompts: 2 of 4 LLM calls saved"
+
+    @pytest.mark.asyncio
+    async def test_early_stopping_skips_pairs_of_clear_items(self):
+        """Consistently high or low dialogs stop after the first wave; borderline ones run to the end."""
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        def dialog(tag: str, n_pairs: int) -> dict:
+            messages = []
+            for i in range(n_pairs):
+                messages += [
+                    {"role": "user", "content": f"{tag} question {i}"},
+                    {"role": "assistant", "content": f"{tag} answer {i}"},
+                ]
+            return {"messages": messages}
+
+        async def llm(prompt, _model):
+            if "good answer" in prompt:
+                return "95"
+            if "bad answer" in prompt:
+                return "10"
+            # borderline: alternates around the threshold
+            return "90" if int(re.search(r"edge answer (\d+)", prompt).group(1)) % 2 else "50"
+
+        data = [dialog("good", 10), dialog("bad", 10), dialog("edge", 6)]
+        validator = GEvalRelevanceValidator(options={"score_threshold": 70, "early_stopping": True})
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(data)
+
+        assert [e["index"] for e in result["errors"]] == [1]
+        info = {i["code"]: i["error"] for i in result["info"]}
+        # good and bad: min_samples (5) pairs each; edge: all 6
+        assert info["early_stopping"] == "Early stopping: evaluated 16 of 26 pairs, skipped 10"
+
+    @pytest.mark.asyncio
+    async def test_identical_scores_near_threshold_do_not_stop_early(self):
+        """Zero sample variance must not collapse the bound: an item at 85 vs threshold 84 keeps sampling."""
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        messages = []
+        for i in range(20):
+            messages += [{"role": "user", "content": f"q{i}"}, {"role": "assistant", "content": f"a{i}"}]
+        llm = AsyncMock(return_value="85")
+        validator = GEvalRelevanceValidator(options={"score_threshold": 84, "early_stopping": True})
+        with patch.object(validator, "call_llm", new=llm):
+            await validator.validate([{"messages": messages}])
+
+        # the 2.9-point variance floor keeps the bound wider than the 1-point margin until late
+        assert llm.await_count > 10
+
+    def test_confidently_decided_needs_min_samples_and_floors_variance(self):
+        from validators.base_geval_validator import confidently_decided
+
+        # identical scores far from the threshold: decided only once min_samples is reached
+        assert not confidently_decided([95.0] * 3, 20, 70, 1.96)
+        assert confidently_decided([95.0] * 5, 20, 70, 1.96)
+        # identical scores one point above the threshold: zero variance alone would stop here
+        assert not confidently_decided([85.0] * 5, 20, 84, 1.96)
+        assert confidently_decided([85.0] * 5, 20, 84, 1.96, resolution=0.0)
+
+    @pytest.mark.asyncio
+    async def test_early_stopping_is_ignored_in_info_mode(self):
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        messages = []
+        for i in range(8):
+            messages += [{"role": "user", "content": f"q{i}"}, {"role": "assistant", "content": f"a{i}"}]
+        llm = AsyncMock(return_value="95")
+        validator = GEvalRelevanceValidator(options={"early_stopping": True, "info_mode": True})
+        with patch.object(validator, "call_llm", new=llm):
+            await validator.validate([{"messages": messages}])
+
+        assert llm.await_count == 8
+
+    @pytest.mark.asyncio
+    async def test_cascade_escalates_only_borderline_items(self):
+        """The fast model scores everything; only items within the band go to the judge model."""
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        fast_scores = {"Python": "95", "recursion": "72", "2+2": "20"}
+        calls = []
+
+        async def llm(prompt, model):
+            calls.append(model)
+            if model == "judge-model":
+                return "40"
+            return next(score for key, score in fast_scores.items() if key in prompt)
+
+        validator = GEvalRelevanceValidator(options={"score_threshold": 70})
+        validator.config = {**_MOCK_LLM_CONFIG["geval"], "model": "judge-model",
+                            "cascade": {"model": "fast-model", "band": 10}}
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(SAMPLE_DATA)
+
+        assert calls.count("fast-model") == 3
+        assert calls.count("judge-model") == 1
+        # item 1 re-scored 40 by the judge; item 2 failed on the fast score alone
+        assert [e["index"] for e in result["errors"]] == [1, 2]
+        cascade = [i["error"] for i in result["info"] if i["code"] == "model_cascade"][0]
+        assert "fast tier (fast-model): 3 items, 3 calls" in cascade
+        assert "judge tier (judge-model): 1 items, 1 calls" in cascade
+
     @pytest.mark.asyncio
     async def test_score_distribution_chart_attached(self):
         """When there are failures and at least one score, a Vega histogram is appended."""
@@ -259,6 +402,102 @@ class TestGEvalRelevanceValidator:
         low_errors = [e for e in result["errors"] if e["code"] == "low_relevance"]
         assert len(low_errors) == 1
 
+    def test_expected_score_from_logprobs(self):
+        from validators.base_geval_validator import expected_score_from_logprobs
+
+        logprobs = {"content": [{"token": " ", "logprob": 0.0, "top_logprobs": []}, {
+            "token": "80", "logprob": math.log(0.5),
+            "top_logprobs": [
+                {"token": "80", "logprob": math.log(0.5)},
+                {"token": "90", "logprob": math.log(0.25)},
+                {"token": "Score", "logprob": math.log(0.15)},  # non-numeric: ignored
+                {"token": " 60", "logprob": math.log(0.1)},
+            ],
+        }]}
+        assert expected_score_from_logprobs(logprobs) == pytest.approx((40 + 22.5 + 6) / 0.85)
+        # no logprobs, no numeric token, or a score split across digit tokens → fallback
+        assert expected_score_from_logprobs(None) is None
+        assert expected_score_from_logprobs({"content": [{"token": "high", "logprob": 0.0}]}) is None
+        split = {"content": [{"token": "8", "logprob": 0.0}, {"token": "5", "logprob": 0.0}]}
+        assert expected_score_from_logprobs(split) is None
+
+    @pytest.mark.asyncio
+    async def test_logprob_scoring_caps_tokens_and_falls_back_to_text(self, monkeypatch):
+        from types import SimpleNamespace
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        monkeypatch.setattr("services.llm_cache.get_llm_cache", lambda: None)
+        requests = []
+
+        async def create(**kwargs):
+            requests.append(kwargs)
+            if "Python" in kwargs["messages"][0]["content"]:
+                top = [SimpleNamespace(token="90", logprob=math.log(0.5)),
+                       SimpleNamespace(token="70", logprob=math.log(0.5))]
+                logprobs = SimpleNamespace(content=[SimpleNamespace(token="90", logprob=0.0, top_logprobs=top)])
+            else:
+                logprobs = None  # backend without logprob support
+            message = SimpleNamespace(content="Score: 55")
+            return SimpleNamespace(choices=[SimpleNamespace(message=message, logprobs=logprobs)])
+
+        validator = GEvalRelevanceValidator(options={"score_threshold": 70, "info_mode": True})
+        validator.config = {**_MOCK_LLM_CONFIG["geval"],
+                            "scoring": {"max_tokens": 3, "logprobs": True, "top_logprobs": 5}}
+        with patch("validators.base_geval_validator.get_llm_client") as get_client:
+            get_client.return_value.chat.completions.create = create
+            result = await validator.validate(SAMPLE_DATA)
+
+        assert all(r["max_tokens"] == 3 and r["logprobs"] and r["top_logprobs"] == 5 for r in requests)
+        scores = [i["error"] for i in result["info"] if i["code"] == "item_score"]
+        assert scores == ["Relevance Score: 80.0", "Relevance Score: 55.0", "Relevance Score: 55.0"]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_packs_pairs_and_retries_unparsed_slots(self):
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        prompts = []
+
+        async def llm(prompt, _model):
+            prompts.append(prompt)
+            if "JSON object" not in prompt:
+                return "30"
+            # the batch of the first two pairs leaves slot 2 out of range
+            return '{"1": 90, "2": 250}'
+
+        validator = GEvalRelevanceValidator(options={"score_threshold": 70, "batch_size": 2})
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(SAMPLE_DATA)
+
+        # one batch of 2, a retry of its bad slot, and the third pair alone
+        assert len(prompts) == 3
+        assert "[1]\nUser:\nWhat is Python?" in prompts[0] and "[2]\nUser:\nExplain recursion" in prompts[0]
+        assert '{"1": <1-100>, "2": <1-100>}' in prompts[0]
+        assert [e["index"] for e in result["errors"]] == [1, 2]
+        batched = [i["error"] for i in result["info"] if i["code"] == "batched_prompts"]
+        assert batched == ["Batched prompts: 2 pairs in 1 calls, 1 slots re-scored individually"]
+
+    @pytest.mark.asyncio
+    async def test_batch_token_budget_limits_batch(self):
+        from validators.gate7_automatic_quality_grading.geval_relevance_validator import (
+            GEvalRelevanceValidator,
+        )
+
+        llm = AsyncMock(return_value="85")
+        validator = GEvalRelevanceValidator(
+            options={"score_threshold": 70, "batch_size": 3, "batch_token_budget": 10},
+        )
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(SAMPLE_DATA)
+
+        # no two pairs fit in 10 tokens, so every pair is scored alone
+        assert llm.await_count == 3
+        assert result["status"] == "passed"
+        assert not [i for i in result.get("info", []) if i["code"] == "batched_prompts"]
+
 
 # ── GEvalRubricValidator ──────────────────────────────────────────────────────
 
@@ -452,6 +691,98 @@ class TestGEvalRubricValidator:
 
         assert result["status"] == "passed"
 
+    @pytest.mark.asyncio
+    async def test_repeated_pairs_are_evaluated_once(self):
+        from validators.gate7_automatic_quality_grading.geval_rubric_validator import (
+            GEvalRubricValidator,
+        )
+
+        rubric = {"helpfulness": "Is it helpful?", "clarity": "Is it clear?"}
+        llm = AsyncMock(return_value="85")
+        validator = GEvalRubricValidator(options={"rubric": rubric, "score_threshold": 70})
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate([SAMPLE_DATA[0]] * 3)
+
+        assert llm.await_count == len(rubric)
+        saved = [i for i in result["info"] if i["code"] == "llm_calls_deduplicated"]
+        assert saved[0]["error"] == "Deduplicated identical prompts: 4 of 6 LLM calls saved"
+
+    @pytest.mark.asyncio
+    async def test_cascade_rescores_borderline_composites(self):
+        from validators.gate7_automatic_quality_grading.geval_rubric_validator import (
+            GEvalRubricValidator,
+        )
+
+        rubric = {"helpfulness": "Is it helpful?", "clarity": "Is it clear?"}
+        models = []
+
+        async def llm(prompt, model):
+            models.append(model)
+            if model == "judge-model":
+                return "90"
+            return "75" if "recursion" in prompt else "95"
+
+        validator = GEvalRubricValidator(options={"rubric": rubric, "score_threshold": 70})
+        validator.config = {**_MOCK_LLM_CONFIG["geval"], "model": "judge-model",
+                            "cascade": {"model": "fast-model", "band": 10}}
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(SAMPLE_DATA)
+
+        assert result["status"] == "passed"
+        assert models.count("fast-model") == len(SAMPLE_DATA) * len(rubric)
+        assert models.count("judge-model") == len(rubric)
+        assert any(i["code"] == "model_cascade" for i in result["info"])
+
+    @pytest.mark.asyncio
+    async def test_single_call_scores_all_criteria_at_once(self):
+        """single_call: one JSON call per pair; composite uses the weighted JSON scores."""
+        from validators.gate7_automatic_quality_grading.geval_rubric_validator import (
+            GEvalRubricValidator,
+        )
+
+        rubric = {
+            "helpfulness": {"description": "helpful?", "weight": 3.0},
+            "clarity":     {"description": "clear?",   "weight": 1.0},
+        }
+        llm = AsyncMock(return_value='```json\n{"helpfulness": 40, "clarity": 100}\n```')
+        validator = GEvalRubricValidator(options={"rubric": rubric, "score_threshold": 70, "single_call": True})
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(SAMPLE_DATA)
+
+        assert llm.await_count == len(SAMPLE_DATA)
+        # composite = 0.75*40 + 0.25*100 = 55
+        errors = [e for e in result["errors"] if e["code"] == "low_rubric_score"]
+        assert len(errors) == len(SAMPLE_DATA)
+        assert "composite=55.00" in errors[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_single_call_falls_back_per_criterion_when_unparseable(self):
+        from validators.gate7_automatic_quality_grading.geval_rubric_validator import (
+            GEvalRubricValidator,
+        )
+
+        rubric = {"helpfulness": "Is it helpful?", "clarity": "Is it clear?"}
+        prompts = []
+
+        async def llm(prompt, _model):
+            prompts.append(prompt)
+            if "JSON object" not in prompt:
+                return "85"
+            # first item answers valid JSON, the others a missing / out-of-range score
+            if "What is Python?" in prompt:
+                return '{"helpfulness": 90, "clarity": 80}'
+            if "Explain recursion" in prompt:
+                return '{"helpfulness": 90}'
+            return '{"helpfulness": 90, "clarity": 0}'
+
+        validator = GEvalRubricValidator(options={"rubric": rubric, "score_threshold": 70, "single_call": True})
+        with patch.object(validator, "call_llm", new=llm):
+            result = await validator.validate(SAMPLE_DATA)
+
+        # 3 JSON calls + 2 unparsed items × 2 criteria
+        assert len(prompts) == 3 + 2 * len(rubric)
+        assert result["status"] == "passed"
+
 
 # ── Info mode ────────────────────────────────────────────────────────────────
 
@@ -0,0 +1,80 @@
+"""Tests for the cached health snapshot behind /health and /ready."""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from services import health
+from services.health import HealthMonitor, get_health_monitor, reset_health_monitor
+from services.llm_breaker import reset_llm_breaker
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch):
+    monkeypatch.setattr(health, "load_and_expand_yaml", lambda _path: {"geval": {"api_base": "http://llm/v1"}})
+    reset_health_monitor()
+    reset_llm_breaker()
+    yield
+    reset_health_monitor()
+    reset_llm_breaker()
+
+
+def _client(status_code: int, seen: list[str]) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(status_code, json={"data": []})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def test_refresh_probes_models_endpoint():
+    seen: list[str] = []
+    monitor = HealthMonitor()
+    assert monitor.age is None
+
+    async with _client(200, seen) as client:
+        await monitor.refresh(client)
+
+    assert seen == ["http://llm/v1/models"]
+    snapshot = monitor.snapshot()
+    assert snapshot["status"] == "ok"
+    assert snapshot["components"] == {"llm_backend": "ok"}
+    assert 0 <= snapshot["age_seconds"] < 1
+    assert monitor.ready()
+
+
+async def test_failed_probe_degrades_and_unreadies():
+    monitor = HealthMonitor()
+    async with _client(503, []) as client:
+        await monitor.refresh(client)
+
+    snapshot = monitor.snapshot()
+    assert snapshot["status"] == "degraded"
+    assert "503" in snapshot["details"]["llm_backend"]
+    assert not monitor.ready()
+
+
+async def test_disabled_without_api_base(monkeypatch):
+    monkeypatch.setattr(health, "load_and_expand_yaml", lambda _path: {"geval": {}})
+    monitor = HealthMonitor()
+    await monitor.refresh()
+
+    assert monitor.snapshot()["components"] == {"llm_backend": "disabled"}
+    assert monitor.ready()
+
+
+async def test_probe_endpoints_answer_from_the_snapshot():
+    from core.app import create_app
+
+    seen: list[str] = []
+    async with _client(200, seen) as client:
+        await get_health_monitor().refresh(client)
+
+    app_client = TestClient(create_app())  # no lifespan → no background refresher
+    for _ in range(5):
+        response = app_client.get("/ready")
+        assert response.status_code == 200
+        assert float(response.headers["X-Health-Age"]) >= 0
+        assert app_client.get("/health").json()["components"] == {"llm_backend": "ok"}
+
+    assert len(seen) == 1  # only the explicit refresh reached the backend
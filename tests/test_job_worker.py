@@ -0,0 +1,151 @@
+"""Tests for the concurrent Redis job worker (services/job_worker.py)."""
+
+import asyncio
+import json
+import types
+
+import pytest
+
+from core.config import settings
+from schemas.jobs import JobRecord, JobStatus
+from services import job_service
+from services.job_worker import worker_loop
+
+
+class FakeRedis:
+    def __init__(self):
+        self.queue: list[str] = []
+
+    def push(self, job_id: str, gate: str) -> None:
+        self.queue.append(json.dumps({"job_id": job_id, "dataset": [], "options": {"gate": gate}}))
+
+    async def blpop(self, key, timeout=0):
+        for _ in range(int(timeout / 0.005) or 1):
+            if self.queue:
+                return key, self.queue.pop(0)
+            await asyncio.sleep(0.005)
+        return None
+
+
+class FakeJobService:
+    jobs: dict[str, JobRecord] = {}
+
+    def __init__(self, redis):
+        pass
+
+    async def get_job(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def update_job(self, job_id, **fields):
+        self.jobs[job_id] = self.jobs[job_id].model_copy(update=fields)
+
+    async def update_progress(self, job_id, gate, current, total):
+        pass
+
+
+class GateValidator:
+    """Finishes when its job's event is set."""
+
+    events: dict[str, asyncio.Event] = {}
+
+    def __init__(self, options, progress_callback=None):
+        self.gate = options["gate"]
+
+    async def validate(self, dataset):
+        await self.events[self.gate].wait()
+        return {"status": "passed"}
+
+
+@pytest.fixture
+def worker_env(monkeypatch):
+    FakeJobService.jobs = {}
+    GateValidator.events = {}
+    monkeypatch.setattr(job_service, "JobService", FakeJobService)
+    monkeypatch.setattr(settings, "worker_concurrency", 2)
+    redis = FakeRedis()
+    app = types.SimpleNamespace(state=types.SimpleNamespace(
+        redis=redis,
+        backend_validators_dict={"gate": GateValidator},
+        running_jobs={},
+    ))
+
+    def submit(job_id: str) -> asyncio.Event:
+        FakeJobService.jobs[job_id] = JobRecord(job_id=job_id, gates=["gate"])
+        GateValidator.events[job_id] = asyncio.Event()
+        redis.push(job_id, job_id)
+        return GateValidator.events[job_id]
+
+    return app, redis, submit
+
+
+async def _until(predicate, timeout=2.0):
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+def _status(job_id):
+    return FakeJobService.jobs[job_id].status
+
+
+async def test_runs_jobs_concurrently_with_backpressure(worker_env):
+    app, redis, submit = worker_env
+    long_job = submit("long")
+    small_job = submit("small")
+    queued_job = submit("queued")
+    worker = asyncio.create_task(worker_loop(app))
+    try:
+        await _until(lambda: set(app.state.running_jobs) == {"long", "small"})
+        # both slots busy: the third job is left in Redis, not popped
+        await asyncio.sleep(0.05)
+        assert len(redis.queue) == 1
+        assert _status("queued") == JobStatus.queued
+
+        # a small job finishes while the long one keeps running
+        small_job.set()
+        await _until(lambda: _status("small") == JobStatus.completed)
+        await _until(lambda: set(app.state.running_jobs) == {"long", "queued"})
+        assert redis.queue == []
+
+        queued_job.set()
+        long_job.set()
+        await _until(lambda: _status("long") == JobStatus.completed and _status("queued") == JobStatus.completed)
+        assert app.state.running_jobs == {}
+    finally:
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+
+async def test_cancelling_one_job_keeps_the_others_running(worker_env):
+    app, _redis, submit = worker_env
+    submit("doomed")
+    survivor = submit("survivor")
+    worker = asyncio.create_task(worker_loop(app))
+    try:
+        await _until(lambda: set(app.state.running_jobs) == {"doomed", "survivor"})
+        app.state.running_jobs["doomed"].cancel()
+
+        await _until(lambda: _status("doomed") == JobStatus.cancelled)
+        assert not worker.done()
+        survivor.set()
+        await _until(lambda: _status("survivor") == JobStatus.completed)
+    finally:
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+
+async def test_shutdown_cancels_in_flight_jobs(worker_env):
+    app, _redis, submit = worker_env
+    submit("a")
+    submit("b")
+    worker = asyncio.create_task(worker_loop(app))
+    await _until(lambda: len(app.state.running_jobs) == 2)
+    tasks = list(app.state.running_jobs.values())
+
+    worker.cancel()
+    await asyncio.gather(worker, return_exceptions=True)
+
+    assert all(t.cancelled() for t in tasks)
+    assert app.state.running_jobs == {}
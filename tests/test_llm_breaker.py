@@ -0,0 +1,173 @@
+"""Tests for the process-wide LLM circuit breaker and the probes it backs."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from services.llm_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_llm_breaker,
+    reset_llm_breaker,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_breaker():
+    reset_llm_breaker()
+    yield
+    reset_llm_breaker()
+
+
+async def _fail(breaker: CircuitBreaker, exc: Exception) -> None:
+    with pytest.raises(type(exc)):
+        async with breaker.guard():
+            raise exc
+
+
+async def test_opens_after_consecutive_failures_and_fails_fast():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        await _fail(breaker, httpx.ConnectError("refused"))
+    assert breaker.state == CLOSED
+
+    await _fail(breaker, httpx.ConnectError("refused"))
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        async with breaker.guard():
+            pytest.fail("call must not reach the backend while open")
+
+
+async def test_client_errors_and_successes_reset_the_count():
+    breaker = CircuitBreaker(failure_threshold=2)
+    await _fail(breaker, httpx.ConnectError("refused"))
+    await _fail(breaker, ValueError("400 bad request"))  # the backend answered
+    await _fail(breaker, httpx.ConnectError("refused"))
+    assert breaker.state == CLOSED
+    assert breaker.consecutive_failures == 1
+
+
+async def _half_open(failure_threshold: int = 1) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=0.05)
+    await _fail(breaker, TimeoutError())
+    await asyncio.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    return breaker
+
+
+async def test_half_open_admits_one_probe_then_closes_on_success():
+    breaker = await _half_open()
+    probe_started = asyncio.Event()
+    release = asyncio.Event()
+    backend_calls = 0
+
+    async def call(probe: bool):
+        nonlocal backend_calls
+        async with breaker.guard():
+            backend_calls += 1
+            if probe:
+                probe_started.set()
+                await release.wait()
+
+    probe = asyncio.create_task(call(True))
+    await probe_started.wait()
+    # concurrent calls wait for the probe instead of failing
+    others = [asyncio.create_task(call(False)) for _ in range(20)]
+    await asyncio.sleep(0.01)
+    assert backend_calls == 1
+    assert not any(t.done() for t in others)
+
+    release.set()
+    await asyncio.gather(probe, *others)
+    assert backend_calls == 21
+    assert breaker.state == CLOSED
+
+
+async def test_calls_waiting_on_a_failed_probe_fail_fast():
+    breaker = await _half_open()
+    probe_started = asyncio.Event()
+
+    async def probe():
+        async with breaker.guard():
+            probe_started.set()
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("still down")
+
+    async def other():
+        async with breaker.guard():
+            pytest.fail("call must not reach the backend after the probe failed")
+
+    probe_task = asyncio.create_task(probe())
+    await probe_started.wait()
+    results = await asyncio.gather(probe_task, *(other() for _ in range(5)), return_exceptions=True)
+
+    assert isinstance(results[0], httpx.ConnectError)
+    assert all(isinstance(r, CircuitOpenError) for r in results[1:])
+    assert breaker.state == OPEN
+
+
+async def test_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    await _fail(breaker, TimeoutError())
+    await asyncio.sleep(0.06)
+    await _fail(breaker, httpx.ConnectError("still down"))
+    assert breaker.state == OPEN
+
+
+async def test_geval_fails_fast_with_llm_unavailable(monkeypatch):
+    from validators.gate7_automatic_quality_grading.geval_relevance_validator import GEvalRelevanceValidator
+
+    monkeypatch.setattr(
+        "services.llm_breaker.load_and_expand_yaml",
+        lambda _path: {"circuit_breaker": {"failure_threshold": 2, "reset_timeout": 60}},
+    )
+    monkeypatch.setattr("services.llm_cache.get_llm_cache", lambda: None)
+    attempts = 0
+
+    async def create(**_kwargs):
+        nonlocal attempts
+        attempts += 1
+        raise httpx.ConnectError("connection refused")
+
+    client = MagicMock()
+    client.chat.completions.create = create
+    config = {"geval": {"model": "m", "api_base": "http://mock", "temperature": 0.0}}
+    data = [
+        {"messages": [{"role": "user", "content": f"Q{i}"}, {"role": "assistant", "content": "A"}]}
+        for i in range(5)
+    ]
+    with patch("validators.base_geval_validator.load_and_expand_yaml", return_value=config), \
+         patch("validators.base_geval_validator.get_llm_client", return_value=client):
+        result = await GEvalRelevanceValidator(options={"max_concurrency": 1}).validate(data)
+        # the circuit opened after two failures; the remaining items never hit the backend
+        assert attempts == 2
+        assert [e["code"] for e in result["errors"]] == ["eval_error"] * 2 + ["llm_unavailable"] * 3
+
+        result = await GEvalRelevanceValidator().validate(data)
+        assert attempts == 2
+        assert [e["code"] for e in result["errors"]] == ["llm_unavailable"]
+
+
+def test_ready_and_health_follow_breaker_state():
+    from core.app import create_app
+
+    client = TestClient(create_app())  # no lifespan: probes must not need the backend
+    assert client.get("/ready").status_code == 200
+
+    breaker = get_llm_breaker()
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(httpx.ConnectError("connection refused"))
+
+    assert client.get("/ready").status_code == 503
+    health = client.get("/health").json()
+    assert health["llm_circuit"]["state"] == OPEN
+    assert health["status"] == "degraded"
+
+    breaker.record_success()
+    assert client.get("/ready").status_code == 200
@@ -0,0 +1,84 @@
+"""Tests for the LLM judge response cache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.config import settings
+from services import llm_cache
+from services.llm_cache import MemoryLLMCache, SQLiteLLMCache, close_llm_cache, llm_cache_key
+
+_CONFIG = {"geval": {"model": "mock-model", "api_key": "k", "api_base": "http://mock", "temperature": 0.0}}
+
+
+def _completion(text: str):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+@pytest.fixture
+async def llm(monkeypatch):
+    """Memory-backed cache plus a mocked pooled client counting real LLM calls."""
+    monkeypatch.setattr(settings, "llm_cache_backend", "memory")
+    await close_llm_cache()
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=_completion(" 85 "))
+    with patch("validators.base_geval_validator.load_and_expand_yaml", return_value=_CONFIG), \
+         patch("validators.base_geval_validator.get_llm_client", return_value=client):
+        yield client.chat.completions.create
+    await close_llm_cache()
+
+
+async def test_repeated_prompt_hits_the_cache(llm):
+    from validators.gate7_automatic_quality_grading.geval_relevance_validator import GEvalRelevanceValidator
+
+    assert await GEvalRelevanceValidator().call_llm("prompt", "mock-model") == "85"
+    assert await GEvalRelevanceValidator().call_llm("prompt", "mock-model") == "85"
+    await GEvalRelevanceValidator().call_llm("prompt", "other-model")
+    assert llm.await_count == 2
+
+
+async def test_sampled_calls_are_not_cached(llm):
+    from validators.gate7_automatic_quality_grading.geval_relevance_validator import GEvalRelevanceValidator
+
+    validator = GEvalRelevanceValidator()
+    validator.config = {**_CONFIG["geval"], "temperature": 0.7}
+    await validator.call_llm("prompt", "mock-model")
+    await validator.call_llm("prompt", "mock-model")
+    assert llm.await_count == 2
+
+
+async def test_memory_backend_ttl_and_lru(monkeypatch):
+    cache = MemoryLLMCache(max_entries=2, ttl=60)
+    for key in ("a", "b", "c"):
+        await cache.set(key, key.upper())
+    assert await cache.get("a") is None
+    assert await cache.get("c") == "C"
+
+    monkeypatch.setattr(llm_cache.time, "time", lambda: 1e12)
+    assert await cache.get("c") is None
+
+
+async def test_sqlite_backend_persists_and_evicts(tmp_path, monkeypatch):
+    path = str(tmp_path / "llm.sqlite3")
+    cache = SQLiteLLMCache(path, max_entries=2, ttl=60)
+    await cache.set("a", "A")
+    await cache.close()
+
+    reopened = SQLiteLLMCache(path, max_entries=2, ttl=60)
+    assert await reopened.get("a") == "A"
+    for key in ("b", "c", "d"):
+        await reopened.set(key, key.upper())
+    reopened._evict(llm_cache.time.time())
+    assert len(reopened) == 2
+    assert await reopened.get("a") is None
+
+    monkeypatch.setattr(llm_cache.time, "time", lambda: 1e12)
+    assert await reopened.get("d") is None
+    await reopened.close()
+
+
+def test_key_covers_model_temperature_and_prompt():
+    base = llm_cache_key("m", 0.0, "p")
+    assert base == llm_cache_key("m", 0, "p")
+    assert len({base, llm_cache_key("m2", 0.0, "p"), llm_cache_key("m", 0.5, "p"), llm_cache_key("m", 0.0, "q")}) == 4
@@ -0,0 +1,58 @@
+"""Tests for the process-wide pooled LLM client."""
+
+import httpx
+import pytest
+
+from services import llm_client
+from services.llm_client import ContextHeaderTransport, close_llm_clients, get_llm_client, request_headers_vars
+
+
+@pytest.fixture(autouse=True)
+async def _clean_clients():
+    await close_llm_clients()
+    yield
+    await close_llm_clients()
+
+
+async def test_one_client_per_base_and_key():
+    a = get_llm_client("http://llm/v1", "k1")
+    assert get_llm_client("http://llm/v1", "k1") is a
+    assert get_llm_client("http://llm/v1", "k2") is not a
+    assert get_llm_client("http://other/v1", "k1") is not a
+
+
+async def test_sdk_retries_are_disabled():
+    # resilient_call (services/llm_retry.py) is the only retry layer
+    assert get_llm_client("http://llm/v1", "k1").max_retries == 0
+
+
+async def test_validator_instances_share_the_client(monkeypatch):
+    from validators.gate7_automatic_quality_grading.geval_relevance_validator import GEvalRelevanceValidator
+
+    config = {"geval": {"model": "m", "api_key": "x", "api_base": "http://mock/v1"}}
+    monkeypatch.setattr("validators.base_geval_validator.load_and_expand_yaml", lambda _path: config)
+    assert GEvalRelevanceValidator().client is GEvalRelevanceValidator().client
+
+
+async def test_close_drops_clients():
+    get_llm_client("http://llm/v1", None)
+    assert llm_client._clients
+    await close_llm_clients()
+    assert not llm_client._clients
+
+
+async def test_context_headers_are_injected_per_request():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("X-Request-ID"))
+        return httpx.Response(200, json={})
+
+    async with httpx.AsyncClient(transport=ContextHeaderTransport(httpx.MockTransport(handler))) as client:
+        token = request_headers_vars.set({"X-Request-ID": "req-1"})
+        await client.get("http://llm/v1/models")
+        request_headers_vars.reset(token)
+        request_headers_vars.set({"X-Request-ID": "req-2"})
+        await client.get("http://llm/v1/models")
+
+    assert seen == ["req-1", "req-2"]
@@ -0,0 +1,159 @@
+"""Tests for the process-wide LLM rate limiter."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from services import llm_limiter
+from services.llm_limiter import LLMRateLimiter, get_llm_limiter, reset_llm_limiter
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiter():
+    reset_llm_limiter()
+    yield
+    reset_llm_limiter()
+
+
+async def test_max_in_flight_is_enforced():
+    limiter = LLMRateLimiter(max_in_flight=3)
+    current = peak = 0
+
+    async def call():
+        nonlocal current, peak
+        async with limiter.slot("p", source="test"):
+            current += 1
+            peak = max(peak, current)
+            await asyncio.sleep(0.01)
+            current -= 1
+
+    await asyncio.gather(*(call() for _ in range(12)))
+    assert peak == 3
+
+
+async def test_requests_per_second_bucket_spaces_calls():
+    limiter = LLMRateLimiter(requests_per_second=50)
+
+    async def call():
+        async with limiter.slot("p", source="test"):
+            pass
+
+    start = time.monotonic()
+    # 50 burst + 10 more at 50/s ≈ 0.2s
+    await asyncio.gather(*(call() for _ in range(60)))
+    assert time.monotonic() - start >= 0.15
+
+
+async def test_tokens_per_minute_bucket_waits_for_large_prompts():
+    limiter = LLMRateLimiter(tokens_per_minute=12000, estimated_output_tokens=0)  # 200 tokens/s
+
+    async def call():
+        async with limiter.slot("x" * 396, source="test"):  # 100 tokens
+            pass
+
+    start = time.monotonic()
+    await asyncio.gather(*(call() for _ in range(121)))
+    # the 12000-token burst covers 120 calls, the last waits ~0.5s of refill
+    assert 0.4 <= time.monotonic() - start < 2
+
+
+async def test_geval_calls_pass_through_the_shared_limiter(monkeypatch):
+    from validators.gate7_automatic_quality_grading.geval_relevance_validator import GEvalRelevanceValidator
+
+    monkeypatch.setattr(
+        llm_limiter, "load_and_expand_yaml", lambda _path: {"rate_limit": {"max_in_flight": 2}},
+    )
+    monkeypatch.setattr("services.llm_cache.get_llm_cache", lambda: None)
+    current = peak = 0
+
+    async def create(**_kwargs):
+        nonlocal current, peak
+        current += 1
+        peak = max(peak, current)
+        await asyncio.sleep(0.01)
+        current -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="85"))])
+
+    client = MagicMock()
+    client.chat.completions.create = create
+    config = {"geval": {"model": "m", "api_base": "http://mock", "temperature": 0.0}}
+    with patch("validators.base_geval_validator.load_and_expand_yaml", return_value=config), \
+         patch("validators.base_geval_validator.get_llm_client", return_value=client):
+        # separate validator instances (as from concurrent requests) share one limiter
+        await asyncio.gather(*(
+            GEvalRelevanceValidator().call_llm(f"prompt {i}", "m") for i in range(10)
+        ))
+
+    assert peak == 2
+    assert get_llm_limiter().max_in_flight == 2
+    assert REGISTRY.get_sample_value("checkr_llm_queue_wait_seconds_count", {"source": "geval"}) >= 10
+
+
+def test_max_in_flight_is_shared_by_event_loops_in_other_threads():
+    import threading
+
+    limiter = LLMRateLimiter(max_in_flight=2)
+    lock = threading.Lock()
+    current = peak = 0
+
+    async def call():
+        nonlocal current, peak
+        async with limiter.slot("p", source="test"):
+            with lock:
+                current += 1
+                peak = max(peak, current)
+            await asyncio.sleep(0.02)
+            with lock:
+                current -= 1
+
+    async def batch():
+        await asyncio.gather(*(call() for _ in range(5)))
+
+    threads = [threading.Thread(target=asyncio.run, args=(batch(),)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+async def test_reload_keeps_in_flight_calls_counted(monkeypatch):
+    monkeypatch.setattr(
+        llm_limiter, "load_and_expand_yaml", lambda _path: {"rate_limit": {"max_in_flight": 2}},
+    )
+    release = asyncio.Event()
+    old = get_llm_limiter()
+
+    async def hold():
+        async with old.slot("p", source="test"):
+            await release.wait()
+
+    holders = [asyncio.create_task(hold()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    reset_llm_limiter()
+    new = get_llm_limiter()
+    assert new is not old
+    assert new.in_flight == 2
+
+    entered = asyncio.Event()
+
+    async def late():
+        async with new.slot("p", source="test"):
+            entered.set()
+
+    late_task = asyncio.create_task(late())
+    await asyncio.sleep(0.02)
+    # the rebuilt limiter still sees the two calls started before the reload
+    assert not entered.is_set()
+
+    release.set()
+    await asyncio.gather(*holders, late_task)
+    assert entered.is_set()
+    assert new.in_flight == 0
@@ -0,0 +1,199 @@
+"""Tests for LLM call timeouts, retries and hedging."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from services.llm_limiter import LLMRateLimiter
+from services.llm_retry import get_latency_tracker, reset_latency_trackers, resilient_call
+from utils.async_utils import ThrottledError
+
+
+@pytest.fixture(autouse=True)
+def _fresh_trackers():
+    reset_latency_trackers()
+    yield
+    reset_latency_trackers()
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+async def test_timeout_is_retried_with_backoff():
+    attempts = 0
+
+    async def call():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(1)
+        return "85"
+
+    before = _sample("checkr_llm_retries_total", source="t-timeout", reason="timeout")
+    result = await resilient_call(call, source="t-timeout", timeout=0.05, max_retries=2, base_delay=0.01)
+
+    assert result == "85"
+    assert attempts == 2
+    assert _sample("checkr_llm_retries_total", source="t-timeout", reason="timeout") == before + 1
+
+
+async def test_retries_are_bounded_and_skip_client_errors():
+    attempts = 0
+
+    async def throttled():
+        nonlocal attempts
+        attempts += 1
+        raise ThrottledError(status=503)
+
+    with pytest.raises(ThrottledError):
+        await resilient_call(throttled, source="t-bounded", max_retries=2, base_delay=0.001)
+    assert attempts == 3
+
+    attempts = 0
+
+    async def bad_request():
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("400 bad request")
+
+    with pytest.raises(ValueError):
+        await resilient_call(bad_request, source="t-bounded", max_retries=2, base_delay=0.001)
+    assert attempts == 1
+
+
+async def test_hedge_answers_from_the_faster_duplicate():
+    tracker = get_latency_tracker("t-hedge:m")
+    for _ in range(20):
+        tracker.record(0.02)
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1 if calls == 1 else 0.01)
+        return f"answer {calls}"
+
+    sent = _sample("checkr_llm_hedges_total", source="t-hedge", outcome="sent")
+    start = time.monotonic()
+    result = await resilient_call(call, source="t-hedge", key="m", hedge=True)
+
+    assert result == "answer 2"
+    assert time.monotonic() - start < 0.5
+    assert _sample("checkr_llm_hedges_total", source="t-hedge", outcome="sent") == sent + 1
+    assert _sample("checkr_llm_hedges_total", source="t-hedge", outcome="won") >= 1
+
+
+async def test_no_hedge_before_enough_latency_samples():
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "85"
+
+    assert await resilient_call(call, source="t-cold", hedge=True) == "85"
+    assert calls == 1
+
+
+async def test_hedges_share_the_global_concurrency_budget():
+    limiter = LLMRateLimiter(max_in_flight=2)
+    tracker = get_latency_tracker("t-budget:m")
+    for _ in range(20):
+        tracker.record(0.01)
+    current = peak = 0
+
+    async def call():
+        nonlocal current, peak
+        async with limiter.slot("p", source="t-budget"):
+            current += 1
+            peak = max(peak, current)
+            await asyncio.sleep(0.05)
+            current -= 1
+        return "85"
+
+    results = await asyncio.gather(*(
+        resilient_call(call, source="t-budget", key="m", hedge=True) for _ in range(4)
+    ))
+    assert results == ["85"] * 4
+    assert peak == 2
+
+
+async def test_queueing_for_a_slot_is_not_part_of_timeout_or_latency():
+    limiter = LLMRateLimiter(max_in_flight=1)
+
+    async def call():
+        await asyncio.sleep(0.05)
+        return "85"
+
+    def slot():
+        return limiter.slot("p", source="t-queue")
+
+    before = _sample("checkr_llm_retries_total", source="t-queue", reason="timeout")
+    # run one after another: the last one queues ~0.15 s, well past its 0.1 s timeout
+    results = await asyncio.gather(*(
+        resilient_call(call, source="t-queue", key="m", timeout=0.1, max_retries=0, slot=slot) for _ in range(4)
+    ))
+
+    assert results == ["85"] * 4
+    assert _sample("checkr_llm_retries_total", source="t-queue", reason="timeout") == before
+    assert get_latency_tracker("t-queue:m").quantile(1.0, min_samples=4) < 0.1
+
+
+async def test_no_hedge_while_the_original_is_still_queued():
+    limiter = LLMRateLimiter(max_in_flight=1)
+    tracker = get_latency_tracker("t-queued-hedge:m")
+    for _ in range(20):
+        tracker.record(0.02)
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.015)
+        return "85"
+
+    def slot():
+        return limiter.slot("p", source="t-queued-hedge")
+
+    before = _sample("checkr_llm_hedges_total", source="t-queued-hedge", outcome="sent")
+    results = await asyncio.gather(*(
+        resilient_call(call, source="t-queued-hedge", key="m", hedge=True, slot=slot) for _ in range(5)
+    ))
+
+    assert results == ["85"] * 5
+    assert calls == 5
+    assert _sample("checkr_llm_hedges_total", source="t-queued-hedge", outcome="sent") == before
+
+
+async def test_geval_pair_survives_a_transient_failure(monkeypatch):
+    from validators.gate7_automatic_quality_grading.geval_relevance_validator import GEvalRelevanceValidator
+
+    monkeypatch.setattr("services.llm_cache.get_llm_cache", lambda: None)
+    attempts = 0
+
+    async def create(**_kwargs):
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise httpx.ConnectError("connection reset")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="85"))])
+
+    client = MagicMock()
+    client.chat.completions.create = create
+    config = {"geval": {"model": "m", "api_base": "http://mock", "temperature": 0.0,
+                        "retry": {"max_retries": 1, "base_delay": 0.001}}}
+    with patch("validators.base_geval_validator.load_and_expand_yaml", return_value=config), \
+         patch("validators.base_geval_validator.get_llm_client", return_value=client):
+        result = await GEvalRelevanceValidator().validate(
+            [{"messages": [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]}]
+        )
+
+    assert attempts == 2
+    assert result["status"] == "passed"
@@ -0,0 +1,62 @@
+"""Tests for process-pool execution of CPU-bound validators."""
+
+import pytest
+
+from core.config import settings
+from services import process_pool
+from services.result_cache import reset_result_cache
+from validators.gate1_structural_validation.chat_struct_validator import ChatStructureValidator
+
+GOOD = {"messages": [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]}
+BAD = {"messages": [{"role": "assistant", "content": "Hello"}, {"role": "user", "content": "Hi"}]}
+
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    monkeypatch.setattr(settings, "process_pool_workers", 2)
+    monkeypatch.setattr(settings, "process_pool_min_chunk", 3)
+    # the second run must really execute, not replay cached results
+    monkeypatch.setattr(settings, "result_cache_size", 0)
+    reset_result_cache()
+    yield
+    process_pool.shutdown()
+    reset_result_cache()
+
+
+def test_split_chunks_covers_all_items():
+    ranges = process_pool.split_chunks(103, n_workers=2, min_chunk=10)
+    assert ranges[0] == (0, 13)
+    assert ranges[-1][1] == 103
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert process_pool.split_chunks(0, 4, 10) == []
+
+
+async def test_process_mode_matches_thread_mode_with_global_indexes(small_pool, monkeypatch):
+    data = [GOOD] * 20
+    for i in (2, 9, 17):
+        data[i] = BAD
+
+    thread_result = await ChatStructureValidator().validate(data)
+
+    monkeypatch.setattr(ChatStructureValidator, "execution", "process")
+    progress = []
+    validator = ChatStructureValidator(progress_callback=progress.append)
+    process_result = await validator.validate(data)
+
+    assert process_result == thread_result
+    assert [e["index"] for e in process_result["errors"]] == [2, 9, 17]
+    assert progress[-2] == {"validator": "ChatStructureValidator", "current": 20, "total": 20}
+
+
+async def test_dataset_scoped_validators_ignore_process_mode(monkeypatch):
+    from validators.gate2_deduplication_and_decontamination.deduplication_validator import (
+        DeduplicationValidator,
+    )
+
+    async def _fail(*_args, **_kwargs):
+        raise AssertionError("dataset-scoped validator must not be chunked")
+
+    monkeypatch.setattr(DeduplicationValidator, "execution", "process")
+    monkeypatch.setattr(process_pool, "run_in_process_pool", _fail)
+    result = await DeduplicationValidator().validate([GOOD, GOOD])
+    assert result["errors"][0]["code"] == "duplicate_sample"
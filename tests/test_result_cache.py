@@ -0,0 +1,118 @@
+"""Tests for the content-addressed per-item result cache."""
+
+import pytest
+
+from services.result_cache import ResultCache, gate_fingerprint, item_hash, options_hash
+from validators.base_validator import BaseValidator, MessagesItem, ParsedDataset, ValidationDetail
+from validators.gate1_structural_validation.chat_struct_validator import ChatStructureValidator
+from validators.gate2_deduplication_and_decontamination.deduplication_validator import DeduplicationValidator
+
+GOOD = {"messages": [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]}
+BAD = {"messages": [{"role": "assistant", "content": "Hello"}, {"role": "user", "content": "Hi"}]}
+
+
+class CountingValidator(BaseValidator):
+    """Flags items whose first message is not from the user; records what it saw."""
+
+    seen: list[int] = []
+
+    async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
+        CountingValidator.seen.append(len(data))
+        return [
+            ValidationDetail(index=i, error="bad start", code="bad_start")
+            for i, item in enumerate(data)
+            if item.messages[0].role != "user"
+        ]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResultCache(max_entries=100)
+    monkeypatch.setattr("services.result_cache.get_result_cache", lambda: cache)
+    CountingValidator.seen = []
+    return cache
+
+
+async def test_only_misses_reach_validate(cache):
+    first = await CountingValidator().validate(ParsedDataset.parse([GOOD, BAD, GOOD]))
+    second = await CountingValidator().validate(ParsedDataset.parse([BAD, GOOD, BAD, {"messages": [
+        {"role": "user", "content": "new"}, {"role": "assistant", "content": "item"},
+    ]}]))
+
+    assert [e["index"] for e in first["errors"]] == [1]
+    # Only the one unseen item is validated on the second run
+    assert CountingValidator.seen == [3, 1]
+    assert [e["index"] for e in second["errors"]] == [0, 2]
+
+
+async def test_options_change_the_key(cache):
+    await CountingValidator({"a": 1}).validate(ParsedDataset.parse([GOOD]))
+    await CountingValidator({"a": 2}).validate(ParsedDataset.parse([GOOD]))
+    await CountingValidator({"a": 1}).validate(ParsedDataset.parse([GOOD]))
+    assert CountingValidator.seen == [1, 1]
+
+
+async def test_cached_run_matches_uncached(cache):
+    data = [GOOD, BAD, GOOD, BAD]
+    cold = await ChatStructureValidator().validate(data)
+    warm = await ChatStructureValidator().validate(data)
+    assert warm == cold
+
+
+async def test_dataset_scoped_validators_bypass_cache(cache):
+    await DeduplicationValidator().validate([GOOD, GOOD])
+    assert len(cache) == 0
+
+
+def test_lru_eviction_and_fingerprint_is_stable():
+    cache = ResultCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache._remember(key, [])
+    assert list(cache._lru) == ["b", "c"]
+    assert gate_fingerprint(ChatStructureValidator) == gate_fingerprint(ChatStructureValidator)
+    assert gate_fingerprint(ChatStructureValidator) != gate_fingerprint(DeduplicationValidator)
+
+
+class FlakyValidator(BaseValidator):
+    """Fails to evaluate items on the first call, like a model that could not load."""
+
+    calls = 0
+
+    async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
+        FlakyValidator.calls += 1
+        if FlakyValidator.calls == 1:
+            return [ValidationDetail(index=i, error="model load failed", code="bertscore_error") for i in range(len(data))]
+        return []
+
+
+async def test_evaluation_failures_are_not_replayed(cache):
+    FlakyValidator.calls = 0
+    first = await FlakyValidator().validate(ParsedDataset.parse([GOOD]))
+    second = await FlakyValidator().validate(ParsedDataset.parse([GOOD]))
+
+    assert first["status"] == "failed"
+    assert second["status"] == "passed"
+    assert FlakyValidator.calls == 2
+
+
+class SummaryValidator(CountingValidator):
+    """Per-item errors plus a dataset-level count that depends on the whole dataset."""
+
+    async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
+        details = await super()._validate(data)
+        return details + [ValidationDetail(error=f"{len(data)} items checked", code="summary", severity="info")]
+
+
+async def test_dataset_level_details_use_the_whole_dataset(cache):
+    # GOOD already cached for this gate, e.g. by another process sharing the Redis tier
+    good_key = f"{gate_fingerprint(SummaryValidator)[:32]}:{options_hash({})[:32]}:{item_hash(MessagesItem(**GOOD))}"
+    await cache.set_many({good_key: []})
+
+    partial = await SummaryValidator().validate(ParsedDataset.parse([GOOD, BAD]))
+    full_hit = await SummaryValidator().validate(ParsedDataset.parse([GOOD, BAD]))
+
+    for result in (partial, full_hit):
+        assert [e["index"] for e in result["errors"]] == [1]
+        assert [i["error"] for i in result["info"]] == ["2 items checked"]
+    # the misses-only run is discarded and the gate bypasses the cache from then on
+    assert CountingValidator.seen == [1, 2, 2]
@@ -0,0 +1,123 @@
+"""Tests for the streaming NDJSON endpoint POST /api/v0/stream/validate."""
+
+import gzip
+import json
+from types import SimpleNamespace
+
+from api.validators import _validate_stream
+from utils.ndjson import iter_ndjson_lines
+from validators.base_validator import BaseValidator, ValidationDetail
+
+_STRUCT_GATE = "backend/gate1_structural_validation/chat_struct_validator.py"
+_DEDUP_GATE = "backend/gate2_deduplication_and_decontamination/deduplication_validator.py"
+
+GOOD = {"messages": [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}]}
+BAD_ORDER = {"messages": [{"role": "assistant", "content": "Hello"}, {"role": "user", "content": "Hi"}]}
+
+
+def _ndjson(items) -> bytes:
+    return "\n".join(json.dumps(i) for i in items).encode() + b"\n"
+
+
+def test_indexes_are_global_across_chunks(client):
+    body = _ndjson([GOOD, GOOD, GOOD, BAD_ORDER, GOOD, BAD_ORDER])
+    response = client.post(
+        "/api/v0/stream/validate",
+        params={"gates": _STRUCT_GATE, "chunk_size": 2},
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "failed"
+    assert data["items"] == 6
+    assert sorted(e["index"] for e in data["errors"]) == [3, 5]
+
+
+def test_gzip_body_and_invalid_lines(client):
+    raw = _ndjson([GOOD]) + b"{not json\n\n" + _ndjson([{"foo": 1}, BAD_ORDER])
+    response = client.post(
+        "/api/v0/stream/validate",
+        params={"gates": _STRUCT_GATE},
+        content=gzip.compress(raw),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    errors = {e["index"]: e["code"] for e in response.json()["errors"]}
+    # Line 2 is blank and skipped, but still counts towards line numbers
+    assert errors == {1: "invalid_json", 3: "schema_validation", 4: "schema_validation"}
+
+
+def test_errors_beyond_max_errors_are_only_counted(client):
+    body = _ndjson([BAD_ORDER] * 50 + [GOOD]) + b"{not json\n"
+    response = client.post(
+        "/api/v0/stream/validate",
+        params={"gates": _STRUCT_GATE, "chunk_size": 7, "max_errors": 5},
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "failed"
+    assert data["items"] == 52
+    # retention is capped at max_errors however many chunks fail
+    assert [e["index"] for e in data["errors"]] == [0, 1, 2, 3, 4]
+    assert data["truncated"] is True
+    assert data["error_count"] == sum(data["error_counts"].values())
+    assert data["error_counts"]["invalid_json"] == 1
+    assert data["error_count"] >= 51
+
+
+class CrashingValidator(BaseValidator):
+    async def _validate(self, data):
+        raise RuntimeError("boom")
+
+
+class SummaryValidator(BaseValidator):
+    async def _validate(self, data):
+        return [ValidationDetail(index=None, code="summary", error=f"{len(data)} items", severity="info")]
+
+
+async def _stream(validators: dict, n_lines: int, chunk_size: int) -> dict:
+    async def lines():
+        for i in range(n_lines):
+            yield i, json.dumps(GOOD).encode()
+
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(backend_validators_dict=validators)))
+    return await _validate_stream(list(validators), lines(), {}, chunk_size, request)
+
+
+async def test_gate_exception_is_one_error_per_chunk_not_per_character():
+    data = await _stream({"crash": CrashingValidator}, n_lines=6, chunk_size=3)
+
+    assert data["status"] == "failed"
+    assert data["error_counts"] == {"gate_exception": 2}
+    assert data["errors"][0] == {"index": None, "error": "boom", "code": "gate_exception"}
+
+
+async def test_dataset_level_info_is_kept_once_per_gate():
+    data = await _stream({"a": SummaryValidator, "b": SummaryValidator}, n_lines=6, chunk_size=2)
+
+    assert data["status"] == "ok"
+    assert [i["error"] for i in data["info"]] == ["2 items", "2 items"]
+
+
+def test_dataset_scoped_gates_are_rejected(client):
+    response = client.post(
+        "/api/v0/stream/validate",
+        params={"gates": _DEDUP_GATE},
+        content=_ndjson([GOOD]),
+    )
+    assert response.status_code == 400
+    assert "cannot be streamed" in response.json()["detail"]
+
+
+async def test_iter_ndjson_lines_handles_split_chunks():
+    payload = gzip.compress(b'{"a": 1}\n{"b":\n 2}\n\n{"c": 3}')
+
+    async def _chunks():
+        for i in range(0, len(payload), 3):
+            yield payload[i:i + 3]
+
+    lines = [(n, line) async for n, line in iter_ndjson_lines(_chunks())]
+    assert lines == [(0, b'{"a": 1}'), (1, b'{"b":'), (2, b" 2}"), (4, b'{"c": 3}')]
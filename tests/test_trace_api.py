@@ -52,9 +52,7 @@ def _mock_llm(score: str = "85", *, call_llm_fn=None):
     llm_mock = call_llm_fn if call_llm_fn is not None else AsyncMock(return_value=score)
     with ExitStack() as stack:
         stack.enter_context(patch("validators.base_geval_validator.load_and_expand_yaml", return_value=_LLM_CONFIG))
-        stack.enter_context(patch("validators.base_geval_validator.AsyncOpenAI"))
-        stack.enter_context(patch("validators.base_geval_validator.httpx.AsyncClient"))
-        stack.enter_context(patch("validators.base_geval_validator.httpx.AsyncHTTPTransport"))
+        stack.enter_context(patch("validators.base_geval_validator.get_llm_client"))
         stack.enter_context(patch.object(BaseGEvalValidator, "call_llm", new=llm_mock))
         yield
 
@@ -274,6 +272,27 @@ class TestGEvalWithTraces:
 
         assert response.status_code == 200
 
+    @pytest.mark.parametrize("options, answers, code", [
+        ({}, ["4", "4", "4"], "llm_calls_deduplicated"),
+        ({"batch_size": 4}, ["4", "four", "2+2=4"], "batched_prompts"),
+    ])
+    def test_info_details_do_not_fail_a_clean_dataset(self, client, options, answers, code):
+        """Info-only details (dedup, batching) must not turn a passing dataset into a failure."""
+        payload = {
+            "dataset": [
+                [{"role": "user", "content": "What is 2+2?"}, {"role": "assistant", "content": answer}]
+                for answer in answers
+            ],
+            "options": {"prompt": "Rate this:\n{content}", "score_threshold": 70, **options},
+        }
+        with _mock_llm("80"):
+            response = client.post("/api/v0/g-eval", json=payload)
+
+        body = response.json()
+        assert body["status"] == "passed"
+        assert body["errors"] == []
+        assert code in [i["code"] for i in body["info"]]
+
 
 # ── async job queue (Airflow sensor pattern) ──────────────────────────────────
 
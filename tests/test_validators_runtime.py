@@ -35,3 +35,42 @@ async def test_validators_against_unified_json(unified_test_case):
             f"❌ {validator_name} in {file_name} expected {expected_status}, got {result['status']}.\nFull result: {result}"
         )
         print(f"✅ {validator_name} passed on {file_name}")
+
+
+@pytest.mark.asyncio
+async def test_parsed_dataset_is_shared_without_reparsing(monkeypatch):
+    from pydantic import BaseModel
+    from validators.base_validator import MessagesItem, ParsedDataset
+    from validators.gate6_quantity_check.quantity_size_validator import QuantitySizeValidator
+
+    dataset = ParsedDataset.parse([
+        {"messages": [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]},
+    ])
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("ParsedDataset must not be re-parsed by validate()")
+
+    monkeypatch.setattr(MessagesItem, "model_validate", _fail)
+    result = await QuantitySizeValidator({"min_samples": 1}).validate(dataset)
+    assert result["status"] == "passed"
+
+    # Items are frozen so gates cannot mutate the shared view
+    with pytest.raises(Exception):
+        dataset[0].item_type = "trace"
+    assert isinstance(dataset[0], BaseModel)
+
+
+def test_parsed_dataset_from_models_matches_parse():
+    from schemas.validators import DataItem
+    from validators.base_validator import ParsedDataset
+
+    raw = [
+        {"messages": [{"role": "user", "content": "a"}, {"role": "assistant", "content": "b"}]},
+        {"messages": [{"role": "system", "content": "s"}, {"role": "user", "content": "u"}], "item_type": "trace"},
+    ]
+    from_models = ParsedDataset.from_models(DataItem.model_validate(r) for r in raw)
+    parsed = ParsedDataset.parse(raw)
+
+    assert len(from_models) == len(parsed) == 2
+    assert [i.model_dump() for i in from_models] == [i.model_dump() for i in parsed]
+    assert isinstance(from_models[0:1], ParsedDataset)
@@ -0,0 +1,120 @@
+"""Tests for the cached, mtime-aware YAML config loader in utils/yaml.py."""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core.config import settings
+from utils import yaml as yaml_utils
+from utils.yaml import load_and_expand_yaml, reload_yaml_cache
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    reload_yaml_cache()
+    yield
+    reload_yaml_cache()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "llm.yaml"
+    path.write_text("geval:\n  model: a\n  api_key: \"${CHECKR_TEST_KEY}\"\n  tags: [x, y]\n")
+    return path
+
+
+def _counting_reads(monkeypatch) -> list[str]:
+    reads: list[str] = []
+    real = yaml_utils.read_and_expand_yaml
+
+    def counting(path):
+        reads.append(path)
+        return real(path)
+
+    monkeypatch.setattr(yaml_utils, "read_and_expand_yaml", counting)
+    return reads
+
+
+def test_parses_once_and_expands_env(config_file, monkeypatch):
+    monkeypatch.setenv("CHECKR_TEST_KEY", "secret")
+    reads = _counting_reads(monkeypatch)
+
+    first = load_and_expand_yaml(str(config_file))
+    second = load_and_expand_yaml(str(config_file))
+
+    assert first is second
+    assert len(reads) == 1
+    assert first["geval"]["api_key"] == "secret"
+    assert first["geval"]["tags"] == ("x", "y")
+
+
+def test_result_is_immutable(config_file):
+    config = load_and_expand_yaml(str(config_file))
+    with pytest.raises(TypeError):
+        config["geval"]["model"] = "b"
+    # a copy is a plain, editable dict
+    edited = {**config["geval"], "model": "b"}
+    assert edited["model"] == "b"
+    assert load_and_expand_yaml(str(config_file))["geval"]["model"] == "a"
+
+
+def test_file_change_invalidates(config_file, monkeypatch):
+    reads = _counting_reads(monkeypatch)
+    assert load_and_expand_yaml(str(config_file))["geval"]["model"] == "a"
+
+    config_file.write_text("geval:\n  model: b\n")
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_and_expand_yaml(str(config_file))["geval"]["model"] == "b"
+    assert len(reads) == 2
+
+
+def test_reload_endpoint_drops_cache(config_file, monkeypatch):
+    from core.app import create_app
+
+    monkeypatch.setattr(settings, "admin_token", "s3cret")
+    monkeypatch.setenv("CHECKR_TEST_KEY", "old")
+    assert load_and_expand_yaml(str(config_file))["geval"]["api_key"] == "old"
+    monkeypatch.setenv("CHECKR_TEST_KEY", "new")
+    assert load_and_expand_yaml(str(config_file))["geval"]["api_key"] == "old"
+
+    response = TestClient(create_app()).post("/config/reload", headers={"X-Admin-Token": "s3cret"})
+
+    assert response.status_code == 200
+    assert response.json()["reloaded"] >= 1
+    assert load_and_expand_yaml(str(config_file))["geval"]["api_key"] == "new"
+
+
+def test_reload_endpoint_rebuilds_config_derived_singletons(monkeypatch):
+    from core.app import create_app
+    from services import llm_breaker, llm_limiter
+
+    monkeypatch.setattr(settings, "admin_token", "s3cret")
+    breaker = llm_breaker.get_llm_breaker()
+    limiter = llm_limiter.get_llm_limiter()
+
+    response = TestClient(create_app()).post("/config/reload", headers={"X-Admin-Token": "s3cret"})
+
+    assert response.status_code == 200
+    assert llm_breaker.get_llm_breaker() is not breaker
+    assert llm_limiter.get_llm_limiter() is not limiter
+
+
+@pytest.mark.parametrize("token, headers", [
+    (None, {"X-Admin-Token": "anything"}),
+    ("s3cret", {}),
+    ("s3cret", {"X-Admin-Token": "wrong"}),
+])
+def test_reload_endpoint_needs_the_admin_token(monkeypatch, token, headers):
+    from core.app import create_app
+
+    monkeypatch.setattr(settings, "admin_token", token)
+    reloads = []
+    monkeypatch.setattr(yaml_utils, "reload_yaml_cache", lambda: reloads.append(1) or 0)
+
+    response = TestClient(create_app()).post("/config/reload", headers=headers)
+
+    assert response.status_code == 403
+    assert reloads == []
@@ -1,5 +1,7 @@
 import asyncio
-from typing import Any, Coroutine
+import random
+import time
+from typing import Any, Awaitable, Callable, Coroutine
 
 
 async def gather_with_semaphore(
@@ -18,3 +20,206 @@ async def gather_with_semaphore(
         *(_wrap(c) for c in coros),
         return_exceptions=return_exceptions,
     )
+
+
+# ── Adaptive (AIMD) concurrency ──────────────────────────────────────────────
+
+THROTTLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class ThrottledError(Exception):
+    """Raised by a call to signal backend backpressure; the limiter backs off and retries it.
+
+    `response` is kept so callers can still report the last response once retries run out.
+    """
+
+    def __init__(self, message: str = "", *, status: int | None = None, retry_after: float | None = None,
+                 response: Any = None):
+        super().__init__(message or f"throttled (HTTP {status})")
+        self.status = status
+        self.retry_after = retry_after
+        self.response = response
+
+
+def _status_of(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None) or getattr(exc, "status", None)
+    if status is None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None) or getattr(response, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """True for ThrottledError or any error (or cause) carrying a 408/429/5xx status."""
+    seen = 0
+    while exc is not None and seen < 5:
+        if isinstance(exc, ThrottledError):
+            return True
+        if _status_of(exc) in THROTTLE_STATUS_CODES:
+            return True
+        exc, seen = exc.__cause__ or exc.__context__, seen + 1
+    return False
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    if isinstance(exc, ThrottledError):
+        return exc.retry_after
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    try:
+        return float(headers.get("retry-after")) if headers else None
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease concurrency limit.
+
+    Every successful call grows the limit by `increase / limit` (about +increase
+    per full window of calls) as long as smoothed latency stays within
+    `latency_tolerance` × the best latency seen. Throttle errors (429/5xx) or a
+    latency rise cut the limit by `decrease`, at most once per window: only a
+    call started after the last cut can cut again, so a burst of failures from
+    calls already in flight counts once (also before any latency is known).
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(min(max(initial, min_limit), self.max_limit))
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+        self._latency: float | None = None       # EWMA of call latency
+        self._best_latency: float | None = None  # slowly-decaying minimum
+        self._started = 0       # calls started so far; a call's sequence number
+        self._window_start = 0  # first sequence number started after the last cut
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def _acquire(self) -> int:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+            self._started += 1
+            return self._started - 1
+
+    async def _release(self) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def _back_off(self, seq: int) -> None:
+        if seq < self._window_start:
+            return
+        self._window_start = self._started
+        self._limit = max(float(self.min_limit), self._limit * self.decrease)
+
+    def _on_success(self, seq: int, latency: float) -> None:
+        self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+        if self._best_latency is None or latency < self._best_latency:
+            self._best_latency = latency
+        else:
+            # let the baseline drift up slowly so a permanently slower backend is accepted
+            self._best_latency *= 1.01
+        if self._latency > self._best_latency * self.latency_tolerance:
+            self._back_off(seq)
+        else:
+            self._limit = min(float(self.max_limit), self._limit + self.increase / max(self._limit, 1.0))
+
+    def _on_throttle(self, seq: int) -> None:
+        self._back_off(seq)
+
+    async def call(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ) -> Any:
+        """Run factory() under the limit, retrying throttle errors with full-jitter backoff."""
+        attempt = 0
+        while True:
+            seq = await self._acquire()
+            start = time.monotonic()
+            try:
+                result = await factory()
+            except Exception as e:
+                if not is_throttle_error(e):
+                    raise
+                self._on_throttle(seq)
+                if attempt >= max_retries:
+                    raise
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+                attempt += 1
+            else:
+                self._on_success(seq, time.monotonic() - start)
+                return result
+            finally:
+                await self._release()
+            await asyncio.sleep(delay)
+
+
+async def gather_with_limiter(
+    factories: list[Callable[[], Awaitable[Any]]],
+    limiter: AdaptiveLimiter,
+    return_exceptions: bool = True,
+    **retry_kwargs: Any,
+) -> list[Any]:
+    """Like gather_with_semaphore, but each call is a zero-arg factory run through `limiter`
+    (factories, not coroutines, so throttled calls can be retried)."""
+    return await asyncio.gather(
+        *(limiter.call(f, **retry_kwargs) for f in factories),
+        return_exceptions=return_exceptions,
+    )
+
+
+async def gather_calls(
+    factories: list[Callable[[], Awaitable[Any]]],
+    max_concurrency: int = 10,
+    adaptive: bool = False,
+    max_limit: int = 100,
+    return_exceptions: bool = True,
+) -> list[Any]:
+    """Entry point for validators: fixed semaphore by default, AIMD when `adaptive`.
+
+    With `adaptive`, max_concurrency is the starting limit and max_limit the ceiling.
+    """
+    if not adaptive:
+        return await gather_with_semaphore(
+            [f() for f in factories], max_concurrency=max_concurrency, return_exceptions=return_exceptions,
+        )
+    limiter = AdaptiveLimiter(initial=max_concurrency, max_limit=max(max_limit, max_concurrency))
+    return await gather_with_limiter(factories, limiter, return_exceptions=return_exceptions)
+
+
+async def gather_unique(
+    keys: list[Any],
+    make_call: Callable[[Any], Awaitable[Any]],
+    **gather_kwargs: Any,
+) -> tuple[list[Any], int]:
+    """Run make_call(key) once per distinct key and fan each result out to every occurrence.
+
+    Returns (results aligned with `keys`, number of calls saved). Extra kwargs go to gather_calls.
+    """
+    unique = list(dict.fromkeys(keys))
+    results = await gather_calls([lambda key=key: make_call(key) for key in unique], **gather_kwargs)
+    by_key = dict(zip(unique, results))
+    return [by_key[key] for key in keys], len(keys) - len(unique)
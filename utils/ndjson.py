@@ -0,0 +1,58 @@
+import zlib
+from typing import AsyncIterator, Iterator
+
+GZIP_MAGIC = b"\x1f\x8b"
+# Upper bound on bytes inflated from one network chunk at a time; keeps highly
+# compressible (or malicious) uploads from expanding into one huge buffer.
+MAX_INFLATE_BYTES = 1024 * 1024
+
+
+def _inflate(decompressor, chunk: bytes) -> Iterator[bytes]:
+    data = decompressor.decompress(chunk, MAX_INFLATE_BYTES)
+    while True:
+        yield data
+        if not decompressor.unconsumed_tail:
+            break
+        data = decompressor.decompress(decompressor.unconsumed_tail, MAX_INFLATE_BYTES)
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    gzip: bool | None = None,
+) -> AsyncIterator[tuple[int, bytes]]:
+    """Yield (line_no, line) for every non-empty line of an NDJSON byte stream.
+
+    line_no is 0-based and counts blank lines too, so it always matches the
+    line position in the uploaded file. With gzip=None the stream is sniffed
+    for the gzip magic bytes; decompression is incremental and bounded, so
+    only a slice of the body plus one partial line is held in memory.
+    """
+    decompressor = None
+    buffer = b""
+    line_no = 0
+    sniffed = gzip is not None
+    if gzip:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        if not sniffed:
+            sniffed = True
+            if chunk[:2] == GZIP_MAGIC:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        pieces = _inflate(decompressor, chunk) if decompressor is not None else (chunk,)
+        for piece in pieces:
+            buffer += piece
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line_no, line
+                line_no += 1
+
+    if decompressor is not None:
+        buffer += decompressor.flush()
+    for line in buffer.split(b"\n"):
+        if line.strip():
+            yield line_no, line
+        line_no += 1
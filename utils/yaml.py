@@ -1,8 +1,16 @@
 import os
 import re
+from types import MappingProxyType
+from typing import Any
+
 import yaml
 
-def load_and_expand_yaml(path: str) -> dict:
+# abspath → ((st_mtime_ns, st_size), frozen parsed content)
+_cache: dict[str, tuple[tuple[int, int], Any]] = {}
+
+
+def read_and_expand_yaml(path: str) -> dict:
+    """Read `path`, replace ${VAR} with environment values and parse it (no caching, mutable result)."""
     with open(path) as f:
         raw = f.read()
 
@@ -10,3 +18,37 @@ def load_and_expand_yaml(path: str) -> dict:
     expanded = re.sub(r"\${(\w+)}", lambda m: os.environ.get(m.group(1), ""), raw)
 
     return yaml.safe_load(expanded)
+
+
+def freeze(value: Any) -> Any:
+    """Read-only view of parsed YAML: mappings become MappingProxyType, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def load_and_expand_yaml(path: str) -> Any:
+    """Cached read_and_expand_yaml: parsed once per file version, as an immutable view.
+
+    The file is re-read when its mtime or size changes, or after reload_yaml_cache()
+    (also needed to pick up changed ${VAR} environment values). Callers that need
+    to modify the result should copy it first, e.g. {**config}.
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    value = freeze(read_and_expand_yaml(key))
+    _cache[key] = (version, value)
+    return value
+
+
+def reload_yaml_cache() -> int:
+    """Forget every cached file; returns how many were dropped."""
+    dropped = len(_cache)
+    _cache.clear()
+    return dropped
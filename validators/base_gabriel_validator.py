@@ -8,16 +8,23 @@ tags: [abstract, gabriel, quality, semantic]
 """
 
 import asyncio
-import os
+import functools
 import shutil
 import tempfile
+import time
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
+import structlog
 
 from core.config import settings
+from services.gabriel_workdir import get_gabriel_work_dir
+from services.llm_breaker import CircuitOpenError, get_llm_breaker, is_circuit_open_error
+from services.llm_client import get_llm_client
+from services.llm_limiter import get_llm_limiter
 from utils.yaml import load_and_expand_yaml
-from validators.base_validator import BaseValidator, MessagesItem, ValidationDetail
+from validators.base_validator import BaseValidator, MessagesItem, ParsedDataset, ValidationDetail
 
 _gabriel_import_error: str | None = None
 try:
@@ -26,14 +33,100 @@ except Exception as _e:
     gabriel = None
     _gabriel_import_error = str(_e)
 
+logger = structlog.get_logger().bind(module=__name__)
+
+# get_response arguments that only steer GABRIEL's own client-side behaviour
+_CLIENT_SIDE_ARGS = frozenset({
+    "base_url", "verbose", "logging_level", "request_phase_callback", "background_poll_interval",
+})
+
+async def pooled_get_response(
+    prompt,
+    *,
+    api_base: str | None = None,
+    api_key: str | None = None,
+    model: str = "gpt-4o-mini",
+    n: int = 1,
+    json_mode: bool = False,
+    timeout: float | None = None,
+    temperature: float | None = None,
+    max_output_tokens: int | None = None,
+    expected_schema: dict | None = None,
+    reasoning_effort: str | None = None,
+    service_tier: str | None = None,
+    use_dummy: bool = False,
+    return_raw: bool = False,
+    **unsupported,
+):
+    """GABRIEL `response_fn` on the process-wide pooled client for (api_base, api_key).
+
+    GABRIEL's own get_response takes its key and base URL from OPENAI_API_KEY /
+    OPENAI_BASE_URL, so concurrent runs against different configs would race on
+    os.environ. This takes them as arguments instead (bind them with
+    BaseGabrielValidator.response_fn) and, like G-Eval, goes through the shared
+    circuit breaker and rate limiter. Returns (responses, duration[, raw]).
+
+    GABRIEL's Responses-API arguments map onto chat.completions: max_output_tokens
+    → max_tokens, json_mode + expected_schema → a strict json_schema
+    response_format, reasoning_effort and service_tier as is. Anything else that
+    would change the request (tools, web_search, images, ...) is not supported
+    here and is logged when set.
+    """
+    ignored = sorted(k for k, v in unsupported.items() if v and k not in _CLIENT_SIDE_ARGS)
+    if ignored:
+        logger.warning("Ignoring unsupported GABRIEL response arguments", args=ignored, model=model)
+
+    if use_dummy:
+        responses = [f"DUMMY {prompt}" for _ in range(max(n, 1))]
+        return (responses, 0.0, []) if return_raw else (responses, 0.0)
+
+    params: dict = {}
+    if json_mode and expected_schema:
+        params["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": "gabriel_structured_response", "strict": True, "schema": expected_schema},
+        }
+    elif json_mode:
+        params["response_format"] = {"type": "json_object"}
+    if max_output_tokens is not None:
+        params["max_tokens"] = max_output_tokens
+    if reasoning_effort is not None:
+        params["reasoning_effort"] = reasoning_effort
+    if service_tier is not None:
+        params["service_tier"] = service_tier
+    if temperature is not None:
+        params["temperature"] = temperature
+    if timeout is not None:
+        params["timeout"] = timeout
+
+    start = time.monotonic()
+    # the circuit breaker is shared with G-Eval: a dead backend fails fast for both
+    async with get_llm_breaker().guard():
+        async with get_llm_limiter().slot(str(prompt), source="gabriel"):
+            get_llm_breaker().check()
+            response = await get_llm_client(api_base, api_key).chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": str(prompt)}],
+                n=n,
+                **params,
+            )
+    responses = [choice.message.content or "" for choice in response.choices]
+    duration = time.monotonic() - start
+    return (responses, duration, [response]) if return_raw else (responses, duration)
 
 class BaseGabrielValidator(BaseValidator, ABC):
     """Base class for all GABRIEL-powered validators.
 
-    Handles data conversion, LLM config, environment setup,
-    temp directory management, and the abstract interface.
+    Handles data conversion, per-call LLM client config (no os.environ),
+    save_dir management (temp or persistent, see services/gabriel_workdir.py),
+    and the abstract interface.
     """
 
+    cacheable = False
+    # Passed to gabriel.* as reset_files; False when running in a persistent
+    # work dir so GABRIEL resumes from the responses it saved there.
+    reset_files = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -41,6 +134,15 @@ class BaseGabrielValidator(BaseValidator, ABC):
         full_config = load_and_expand_yaml(config_path)
         self.config = full_config.get("gabriel", full_config.get("geval", {}))
 
+    @property
+    def response_fn(self):
+        """pooled_get_response bound to this validator's api_base/api_key, for gabriel.* calls."""
+        return functools.partial(
+            pooled_get_response,
+            api_base=self.config.get("api_base") or None,
+            api_key=self.config.get("api_key") or None,
+        )
+
     @staticmethod
     def messages_to_dataframe(data: list[MessagesItem]) -> pd.DataFrame:
         """Convert list[MessagesItem] to a pandas DataFrame.
@@ -51,27 +153,34 @@ class BaseGabrielValidator(BaseValidator, ABC):
         - full_dialog: all messages with role prefixes
         - item_index: original index in the dataset
         """
-        rows = []
-        for idx, item in enumerate(data):
-            assistant_parts = []
-            user_parts = []
-            dialog_parts = []
-
-            for msg in item.messages:
-                dialog_parts.append(f"{msg.role}: {msg.content}")
-                if msg.role == "assistant":
-                    assistant_parts.append(msg.content)
-                elif msg.role == "user":
-                    user_parts.append(msg.content)
-
-            rows.append({
-                "item_index": idx,
-                "text": "\n\n".join(assistant_parts),
-                "user_text": "\n\n".join(user_parts),
-                "full_dialog": "\n".join(dialog_parts),
-            })
-
-        return pd.DataFrame(rows)
+        texts = []
+        user_texts = []
+        dialogs = []
+        for item in data:
+            messages = item.messages
+            texts.append("\n\n".join([m.content for m in messages if m.role == "assistant"]))
+            user_texts.append("\n\n".join([m.content for m in messages if m.role == "user"]))
+            dialogs.append("\n".join([f"{m.role}: {m.content}" for m in messages]))
+
+        # Built column by column: no per-row dicts for pandas to re-align
+        return pd.DataFrame({
+            "item_index": np.arange(len(texts)),
+            "text": texts,
+            "user_text": user_texts,
+            "full_dialog": dialogs,
+        })
+
+    @classmethod
+    def shared_dataframe(cls, data: list[MessagesItem]) -> pd.DataFrame:
+        """messages_to_dataframe, built once per request and shared by all GABRIEL gates.
+
+        Memoized on the request's ParsedDataset. Each gate gets its own deep copy,
+        so in-place edits by one gate (or by gabriel) never reach the others, with
+        or without pandas copy-on-write (off by default before pandas 3).
+        """
+        if isinstance(data, ParsedDataset):
+            return data.memoized("gabriel_dataframe", cls.messages_to_dataframe).copy()
+        return cls.messages_to_dataframe(data)
 
     @abstractmethod
     async def _run_gabriel(
@@ -101,23 +210,23 @@ class BaseGabrielValidator(BaseValidator, ABC):
         if not data:
             return []
 
-        input_df = self.messages_to_dataframe(data)
-
-        # Set up environment for gabriel
-        original_api_key = os.environ.get("OPENAI_API_KEY")
-        original_base_url = os.environ.get("OPENAI_BASE_URL")
-        save_dir = tempfile.mkdtemp(prefix="checkr_gabriel_")
-
         try:
-            api_key = self.config.get("api_key", "")
-            api_base = self.config.get("api_base", "")
+            get_llm_breaker().check()
+        except CircuitOpenError as e:
+            return [ValidationDetail(error=str(e), code="llm_unavailable")]
 
-            if api_key:
-                os.environ["OPENAI_API_KEY"] = api_key
-            if api_base:
-                os.environ["OPENAI_BASE_URL"] = api_base
+        input_df = self.shared_dataframe(data)
 
-            self.report_stage("running gabriel")
+        work_dir = get_gabriel_work_dir()
+        if work_dir is not None:
+            run_options = {**self.options, "_model": self.config.get("model")}
+            save_dir, resumed = await work_dir.acquire(self, run_options, input_df)
+            self.reset_files = False
+        else:
+            save_dir, resumed = tempfile.mkdtemp(prefix="checkr_gabriel_"), False
+
+        try:
+            self.report_stage("resuming gabriel" if resumed else "running gabriel")
             result_df = await self._run_gabriel(input_df, "text", save_dir)
 
             # Re-join by positional index if gabriel didn't preserve item_index
@@ -133,20 +242,12 @@ class BaseGabrielValidator(BaseValidator, ABC):
             return [
                 ValidationDetail(
                     error=f"GABRIEL evaluation failed: {e}",
-                    code="gabriel_error",
+                    code="llm_unavailable" if is_circuit_open_error(e) else "gabriel_error",
                 )
             ]
         finally:
-            # Restore original environment
-            if original_api_key is not None:
-                os.environ["OPENAI_API_KEY"] = original_api_key
-            elif "OPENAI_API_KEY" in os.environ and api_key:
-                del os.environ["OPENAI_API_KEY"]
-
-            if original_base_url is not None:
-                os.environ["OPENAI_BASE_URL"] = original_base_url
-            elif "OPENAI_BASE_URL" in os.environ and api_base:
-                del os.environ["OPENAI_BASE_URL"]
-
-            # Clean up temp directory
-            shutil.rmtree(save_dir, ignore_errors=True)
+            if work_dir is not None:
+                # Kept for resume / reruns; evicted LRU by size
+                await work_dir.release(save_dir)
+            else:
+                shutil.rmtree(save_dir, ignore_errors=True)
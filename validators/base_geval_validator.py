@@ -10,34 +10,167 @@ tags: [abstract, geval, score_based, semantic]
 from abc import ABC
 from collections import defaultdict
 from validators.base_validator import BaseValidator, ValidationDetail, MessagesItem, _resolve_item_type
-from utils.async_utils import gather_with_semaphore
+from utils.async_utils import gather_calls, gather_unique
 from utils.vega_charts import vega_histogram
+import asyncio
 import html
+import json
+import math
 import re
+import time
+from typing import Any
 from openai import AsyncOpenAI
 from core.config import settings
+from middlewares.metrics_middleware import LLM_JUDGE_CALLS, LLM_JUDGE_DURATION
+from services.llm_breaker import CircuitOpenError, get_llm_breaker, is_circuit_open_error
+from services.llm_cache import cached_completion
+from services.llm_client import ContextHeaderTransport, get_llm_client, request_headers_vars  # noqa: F401
+from services.llm_limiter import estimate_tokens, get_llm_limiter
+from services.llm_retry import resilient_call
 from utils.yaml import load_and_expand_yaml
-import httpx
-import contextvars
-
-# Shared context var (to pass headers into the transportlayer
-request_headers_vars = contextvars.ContextVar("request_headers", default={})
 
 
 def _format_trace(messages) -> str:
     """Render a full message list as a human-readable transcript for holistic LLM evaluation."""
     return "\n\n".join(f"[{m.role.upper()}]: {m.content}" for m in messages)
 
-class ContextHeaderTransport(httpx.AsyncBaseTransport):
-    def __init__(self, inner):
-        self.inner = inner
-    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
-        custom_headers = request_headers_vars.get()
-        for key, value in custom_headers.items():
-            request.headers[key] = value
-        return await self.inner.handle_async_request(request)
+def confidently_decided(
+    scores: list[float],
+    total: int,
+    threshold: float,
+    z: float,
+    min_samples: int = 5,
+    resolution: float = 10.0,
+) -> bool:
+    """True when the running mean of `scores` is clearly on one side of `threshold`.
+
+    Uses a normal-approximation bound with finite-population correction: the item's
+    final score is the mean of all `total` pairs, so the bound shrinks to zero as the
+    evaluated sample approaches the whole dialog. No decision is taken before
+    `min_samples` scores, and the sample variance is floored at the quantization
+    noise of a judge scoring in `resolution`-point steps (resolution² / 12), so a
+    few identical scores never yield a zero-width bound.
+    """
+    n = len(scores)
+    if n >= total:
+        return True
+    if n < max(min_samples, 2):
+        return False
+    mean = sum(scores) / n
+    variance = sum((s - mean) ** 2 for s in scores) / (n - 1)
+    variance = max(variance, resolution ** 2 / 12)
+    half_width = z * math.sqrt(variance / n) * math.sqrt((total - n) / (total - 1))
+    return mean - half_width > threshold or mean + half_width < threshold
+
+def llm_calls_saved_detail(saved: int, total: int) -> ValidationDetail:
+    """Info entry reporting LLM calls avoided by per-run prompt deduplication."""
+    return ValidationDetail(
+        index=None,
+        code="llm_calls_deduplicated",
+        error=f"Deduplicated identical prompts: {saved} of {total} LLM calls saved",
+        severity="info",
+    )
+
+def llm_unavailable_detail(error: BaseException, index: int | None = None) -> ValidationDetail:
+    """Error entry for calls refused by the open LLM circuit breaker."""
+    return ValidationDetail(index=index, error=str(error), code="llm_unavailable")
+
+def borderline_items(
+    item_scores: dict[int, float], failed_items, threshold: float, band: float,
+) -> set[int]:
+    """Items to escalate to the judge tier: cheap score within ±band of threshold, or cheap tier failed."""
+    return set(failed_items) | {idx for idx, score in item_scores.items() if abs(score - threshold) <= band}
+
+def cascade_detail(tiers: dict[str, dict]) -> ValidationDetail:
+    """Info entry with per-tier item/call counts and mean call latency."""
+    parts = []
+    for tier, stats in tiers.items():
+        avg = stats["seconds"] / stats["calls"] if stats["calls"] else 0.0
+        parts.append(
+            f"{tier} tier ({stats['model']}): {stats['items']} items, {stats['calls']} calls, avg {avg:.2f}s/call"
+        )
+    return ValidationDetail(
+        index=None,
+        code="model_cascade",
+        error="Model cascade: " + "; ".join(parts),
+        severity="info",
+    )
+
+_BATCH_PROMPT_SUFFIX = (
+    "\n\nThe content above holds {count} numbered items. Score each item independently.\n"
+    "Instead of a single number, respond with a JSON object of this exact shape, no other text:\n"
+    "{shape}"
+)
+
+def parse_slot_scores(raw_output: str, count: int) -> dict[int, float]:
+    """Scores by 1-based slot from a batched answer `{"1": 85, "2": 40, ...}`.
+
+    Slots that are missing or not a number in 1..100 are left out, so the caller
+    can re-score just those.
+    """
+    start, end = raw_output.find("{"), raw_output.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        parsed = json.loads(raw_output[start:end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+
+    scores: dict[int, float] = {}
+    for slot in range(1, count + 1):
+        try:
+            score = float(parsed[str(slot)])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 1 <= score <= 100:
+            scores[slot] = score
+    return scores
+
+def batching_detail(stats: dict) -> ValidationDetail:
+    """Info entry with how many pairs went out in multi-item prompts."""
+    return ValidationDetail(
+        index=None,
+        code="batched_prompts",
+        error=(
+            f"Batched prompts: {stats['pairs']} pairs in {stats['calls']} calls, "
+            f"{stats['retried']} slots re-scored individually"
+        ),
+        severity="info",
+    )
+
+_SCORE_TOKEN = re.compile(r"^\s*(100|[1-9][0-9]?)\s*$")
+
+def _field(obj, name: str):
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+def expected_score_from_logprobs(logprobs) -> float | None:
+    """Probability-weighted score from the top_logprobs of the first numeric answer token.
+
+    Returns None (caller falls back to regex parsing) when the backend sent no
+    logprobs, no token is a 1-100 number, or the number spans several tokens.
+    """
+    positions = _field(logprobs, "content") or []
+    for i, position in enumerate(positions):
+        if not _SCORE_TOKEN.match(_field(position, "token") or ""):
+            continue
+        following = _field(positions[i + 1], "token") if i + 1 < len(positions) else ""
+        if (following or "")[:1].isdigit():
+            return None  # digit-by-digit tokenizer: first token is not the whole score
+        candidates = _field(position, "top_logprobs") or [position]
+        weight = total = 0.0
+        for candidate in candidates:
+            match = _SCORE_TOKEN.match(_field(candidate, "token") or "")
+            if match:
+                p = math.exp(_field(candidate, "logprob"))
+                weight += p
+                total += p * float(match.group(1))
+        return total / weight if weight else None
+    return None
 
 class BaseGEvalValidator(BaseValidator, ABC):
+    cacheable = False
     prompt_template: str = ""
     score_title: str = "Score"
     score_code: str = "low_score"
@@ -49,14 +182,104 @@ class BaseGEvalValidator(BaseValidator, ABC):
         config_path = settings.llm_config_path
         self.config = load_and_expand_yaml(config_path)['geval']
 
-        transport = ContextHeaderTransport(httpx.AsyncHTTPTransport())
-        httpx_client = httpx.AsyncClient(transport=transport)
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Process-wide pooled client for this config's api_base/api_key."""
+        return get_llm_client(self.config.get("api_base", None), self.config.get("api_key", None))
 
-        self.client = AsyncOpenAI(
-            api_key=self.config.get("api_key", None),
-            base_url=self.config.get("api_base", None),
-            http_client=httpx_client
-        )
+    @property
+    def cascade(self) -> dict | None:
+        """`cascade` section of the geval config ({model, band}) when a cheap first-tier model is set."""
+        cascade = self.config.get("cascade") or {}
+        return cascade if cascade.get("model") else None
+
+    def _tier_llm(self, tier: str, model: str, tiers: dict[str, dict], method=None):
+        """call_llm (or `method`, e.g. score_llm) bound to one cascade tier, recording call count and latency."""
+        stats = tiers.setdefault(tier, {"model": model, "items": 0, "calls": 0, "seconds": 0.0})
+        method = method or self.call_llm
+
+        async def _call(prompt: str):
+            start = time.perf_counter()
+            try:
+                return await method(prompt, model)
+            finally:
+                elapsed = time.perf_counter() - start
+                stats["calls"] += 1
+                stats["seconds"] += elapsed
+                LLM_JUDGE_CALLS.labels(gate=self.validator_name, tier=tier, model=model).inc()
+                LLM_JUDGE_DURATION.labels(gate=self.validator_name, tier=tier).observe(elapsed)
+
+        return _call
+
+    async def _score_in_waves(
+        self,
+        calls: list[tuple[int, str]],
+        score_fn,
+        threshold: float,
+        early_stopping: bool,
+        batch_fn=None,
+        **gather_kwargs,
+    ) -> tuple[dict[int, list[float]], dict[int, Exception], int, int]:
+        """Score (item_idx, prompt) calls; returns (scores_by_item, error_by_item, evaluated, calls_saved).
+
+        Without early stopping everything goes out in a single wave. `batch_fn`,
+        when given, scores each wave's fresh prompts instead of score_fn one by one.
+        """
+        prompts_by_item: dict[int, list[str]] = defaultdict(list)
+        for item_idx, prompt in calls:
+            prompts_by_item[item_idx].append(prompt)
+
+        wave_size = len(calls) or 1
+        if early_stopping:
+            wave_size = self.options.get("early_stopping_min_pairs", 3)
+        z = self.options.get("early_stopping_z", 1.96)
+        min_samples = self.options.get("early_stopping_min_samples", 5)
+        resolution = self.options.get("early_stopping_score_resolution", 10.0)
+
+        scores_by_item: dict[int, list[float]] = defaultdict(list)
+        error_by_item: dict[int, Exception] = {}
+        known: dict[str, Any] = {}  # prompt → score or exception, reused across waves
+        next_pair = {item_idx: 0 for item_idx in prompts_by_item}
+        calls_saved = evaluated = 0
+
+        while next_pair:
+            wave = [
+                (item_idx, prompt)
+                for item_idx, start in next_pair.items()
+                for prompt in prompts_by_item[item_idx][start:start + wave_size]
+            ]
+            fresh = [prompt for _, prompt in wave if prompt not in known]
+            # identical prompts (repeated pairs across items) are sent once and fanned out
+            if batch_fn is not None:
+                fresh_results, saved = await batch_fn(fresh)
+            else:
+                fresh_results, saved = await gather_unique(fresh, score_fn, **gather_kwargs)
+            known.update(zip(fresh, fresh_results))
+            calls_saved += saved + len(wave) - len(fresh)
+            evaluated += len(wave)
+
+            # regroup scores by item_idx; retire finished or decided items
+            for item_idx, prompt in wave:
+                result = known[prompt]
+                if isinstance(result, BaseException):
+                    error_by_item.setdefault(item_idx, result)
+                else:
+                    scores_by_item[item_idx].append(result)
+            for item_idx in list(next_pair):
+                next_pair[item_idx] += wave_size
+                total = len(prompts_by_item[item_idx])
+                if (
+                    next_pair[item_idx] >= total
+                    or item_idx in error_by_item
+                    or confidently_decided(
+                        scores_by_item[item_idx], total, threshold, z, min_samples, resolution
+                    )
+                ):
+                    del next_pair[item_idx]
+            if early_stopping:
+                wave_size = self.options.get("early_stopping_wave", 2)
+
+        return scores_by_item, error_by_item, evaluated, calls_saved
 
     def _build_prompt(self, content: str) -> str:
         """Fill the single {content} slot in prompt_template.
@@ -68,6 +291,73 @@ class BaseGEvalValidator(BaseValidator, ABC):
             raise NotImplementedError("Subclasses must define prompt_template or override _build_prompt()")
         return self.prompt_template.format(content=content)
 
+    def _build_batch_prompt(self, contents: list[str]) -> str:
+        """Pack several contents into numbered slots of one prompt asking for a JSON score per slot."""
+        numbered = "\n\n".join(f"[{slot}]\n{content}" for slot, content in enumerate(contents, 1))
+        shape = "{" + ", ".join(f'"{slot}": <1-100>' for slot in range(1, len(contents) + 1)) + "}"
+        return self._build_prompt(numbered) + _BATCH_PROMPT_SUFFIX.format(count=len(contents), shape=shape)
+
+    def _pack_batches(self, prompts: list[str], content_of: dict[str, str], batch_size: int,
+                      token_budget: int) -> list[list[str]]:
+        """Group prompts into batches of at most batch_size slots within token_budget.
+
+        Prompts without batchable content (traces) and contents too large to share
+        a prompt end up in batches of one.
+        """
+        batches: list[list[str]] = []
+        current: list[str] = []
+        for prompt in prompts:
+            if prompt not in content_of:
+                batches.append([prompt])
+                continue
+            candidate = current + [prompt]
+            fits = estimate_tokens(self._build_batch_prompt([content_of[p] for p in candidate])) <= token_budget
+            if current and (len(candidate) > batch_size or not fits):
+                batches.append(current)
+                candidate = [prompt]
+            current = candidate
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _score_batched(
+        self,
+        prompts: list[str],
+        content_of: dict[str, str],
+        llm,
+        score_fn,
+        stats: dict,
+        **gather_kwargs,
+    ) -> tuple[list, int]:
+        """Score prompts K per call; returns (results aligned with prompts, calls saved by deduplication).
+
+        Slots whose score can't be parsed from the batched answer are re-scored
+        one by one with score_fn. A failed batch call fails all of its slots.
+        """
+        batch_size = self.options.get("batch_size", 1)
+        token_budget = self.options.get("batch_token_budget", 2000)
+        unique = list(dict.fromkeys(prompts))
+        batches = self._pack_batches(unique, content_of, batch_size, token_budget)
+
+        async def _run(batch: list[str]) -> list:
+            if len(batch) == 1:
+                return [await score_fn(batch[0])]
+            raw = await llm(self._build_batch_prompt([content_of[p] for p in batch]))
+            scores = parse_slot_scores(raw, len(batch))
+            stats["pairs"] += len(batch)
+            stats["calls"] += 1
+            retry = [p for slot, p in enumerate(batch, 1) if slot not in scores]
+            stats["retried"] += len(retry)
+            retried = dict(zip(retry, await asyncio.gather(*(score_fn(p) for p in retry), return_exceptions=True)))
+            return [scores[slot] if slot in scores else retried[p] for slot, p in enumerate(batch, 1)]
+
+        batch_results = await gather_calls([lambda batch=batch: _run(batch) for batch in batches], **gather_kwargs)
+        by_prompt: dict[str, Any] = {}
+        for batch, result in zip(batches, batch_results):
+            for slot, prompt in enumerate(batch):
+                by_prompt[prompt] = result if isinstance(result, BaseException) else result[slot]
+        return [by_prompt[p] for p in prompts], len(prompts) - len(unique)
+
     def _extract_score_from_output(self, raw_output: str) -> float:
         """
         Default implementation: extract score as integer between 1 and 100.
@@ -83,11 +373,14 @@ class BaseGEvalValidator(BaseValidator, ABC):
         threshold = self.options.get("score_threshold", 70)
         preview_limit = self.options.get("preview_limit", 3)
         max_concurrency = self.options.get("max_concurrency", 10)
+        adaptive = self.options.get("adaptive_concurrency", False)
+        max_limit = self.options.get("adaptive_max_concurrency", 100)
         info_mode = self.options.get("info_mode", False)
         all_avg_scores = []
 
         # ── Phase 1: collect (item_idx, prompt) — one per pair (dialog) or per item (trace) ──
         calls: list[tuple[int, str]] = []
+        content_of: dict[str, str] = {}  # dialog prompt → its pair content, for batching
         # item_idx → ("dialog", pairs) | ("trace", trace_str)
         preview_map: dict[int, tuple[str, Any]] = {}
 
@@ -111,25 +404,67 @@ class BaseGEvalValidator(BaseValidator, ABC):
                     continue
                 preview_map[idx] = ("dialog", pairs)
                 for u, a in pairs:
-                    calls.append((idx, self._build_prompt(f"User:\n{u}\n\nAssistant:\n{a}")))
-
-        # ── Phase 2: fire all LLM calls concurrently ─────────────────────────
-        async def _call(prompt: str) -> float:
-            raw = await self.call_llm(prompt, model)
-            return self._extract_score_from_output(raw)
+                    content = f"User:\n{u}\n\nAssistant:\n{a}"
+                    prompt = self._build_prompt(content)
+                    content_of[prompt] = content
+                    calls.append((idx, prompt))
 
-        coros = [_call(prompt) for _, prompt in calls]
-        raw_results = await gather_with_semaphore(coros, max_concurrency=max_concurrency)
-
-        # ── Phase 3: regroup scores by item_idx ──────────────────────────────
-        scores_by_item: dict[int, list[float]] = defaultdict(list)
-        error_by_item: dict[int, Exception] = {}
+        # Backend known to be down: fail the gate at once instead of per-item timeouts
+        try:
+            if calls:
+                get_llm_breaker().check()
+        except CircuitOpenError as e:
+            return errors + [llm_unavailable_detail(e)]
+
+        # ── Phase 2: fire LLM calls concurrently, in waves when early stopping ──
+        # Scores are only estimates when an item stops early, so info_mode always scores every pair.
+        early_stopping = self.options.get("early_stopping", False) and not info_mode
+        gather_kwargs = {"max_concurrency": max_concurrency, "adaptive": adaptive, "max_limit": max_limit}
+        cascade = self.cascade
+        tiers: dict[str, dict] = {}
+
+        # batch_size > 1 packs several dialog pairs into one prompt (traces are always scored alone)
+        batching = self.options.get("batch_size", 1) > 1
+        batch_stats = {"pairs": 0, "calls": 0, "retried": 0}
+
+        def _scorer(tier: str, tier_model: str):
+            return self._tier_llm(tier, tier_model, tiers, self.score_llm)
+
+        def _batcher(tier: str, tier_model: str):
+            if not batching:
+                return None
+            llm = self._tier_llm(tier, tier_model, tiers)
+            score_fn = _scorer(tier, tier_model)
+            return lambda prompts: self._score_batched(
+                prompts, content_of, llm, score_fn, batch_stats, **gather_kwargs,
+            )
 
-        for (item_idx, _), result in zip(calls, raw_results):
-            if isinstance(result, BaseException):
-                error_by_item.setdefault(item_idx, result)
-            else:
-                scores_by_item[item_idx].append(result)
+        first_tier, first_model = ("fast", cascade["model"]) if cascade else ("judge", model)
+        scores_by_item, error_by_item, evaluated, calls_saved = await self._score_in_waves(
+            calls, _scorer(first_tier, first_model), threshold, early_stopping,
+            batch_fn=_batcher(first_tier, first_model), **gather_kwargs,
+        )
+        tiers[first_tier]["items"] = len({idx for idx, _ in calls})
+        pairs_total = len(calls)
+
+        # ── Phase 3: cascade — re-score borderline items with the judge model ──
+        if cascade and calls:
+            item_avgs = {idx: sum(s) / len(s) for idx, s in scores_by_item.items() if s and idx not in error_by_item}
+            escalate = borderline_items(item_avgs, error_by_item, threshold, cascade.get("band", 10))
+            judge_calls = [(idx, prompt) for idx, prompt in calls if idx in escalate]
+            judge_scores, judge_errors, judge_evaluated, judge_saved = await self._score_in_waves(
+                judge_calls, _scorer("judge", model), threshold, early_stopping,
+                batch_fn=_batcher("judge", model), **gather_kwargs,
+            )
+            tiers["judge"]["items"] = len(escalate)
+            for idx in escalate:
+                scores_by_item[idx] = judge_scores.get(idx, [])
+                error_by_item.pop(idx, None)
+                if idx in judge_errors:
+                    error_by_item[idx] = judge_errors[idx]
+            pairs_total += len(judge_calls)
+            evaluated += judge_evaluated
+            calls_saved += judge_saved
 
         # ── Phase 4: average scores, apply threshold ──────────────────────────
         for idx in range(len(data)):
@@ -137,7 +472,8 @@ class BaseGEvalValidator(BaseValidator, ABC):
                 continue
             if idx in error_by_item:
                 errors.append(ValidationDetail(
-                    index=idx, error=f"Evaluation failed: {error_by_item[idx]}", code="eval_error",
+                    index=idx, error=f"Evaluation failed: {error_by_item[idx]}",
+                    code="llm_unavailable" if is_circuit_open_error(error_by_item[idx]) else "eval_error",
                 ))
             elif idx in scores_by_item:
                 scores = scores_by_item[idx]
@@ -179,22 +515,97 @@ class BaseGEvalValidator(BaseValidator, ABC):
                 chart=vega_histogram(all_avg_scores, title=f"{self.score_title} Distribution", threshold=threshold),
             ))
 
+        if cascade and calls:
+            errors.append(cascade_detail(tiers))
+        if early_stopping and calls:
+            errors.append(ValidationDetail(
+                index=None,
+                code="early_stopping",
+                error=(
+                    f"Early stopping: evaluated {evaluated} of {pairs_total} pairs, "
+                    f"skipped {pairs_total - evaluated}"
+                ),
+                severity="info",
+            ))
+        if calls_saved:
+            errors.append(llm_calls_saved_detail(calls_saved, evaluated))
+        if batch_stats["calls"]:
+            errors.append(batching_detail(batch_stats))
+
         return errors
 
-    async def call_llm(self, prompt: str, model: str) -> str:
-        try:
-            response = await self.client.chat.completions.create(
+    async def _create_completion(self, prompt: str, model: str, **params):
+        breaker = get_llm_breaker()
+
+        async def _request():
+            breaker.check()  # the circuit may have opened while this call was queued
+            return await self.client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=self.config.get("temperature", 0.0),
+                **params,
+            )
+
+        def _slot():
+            # each attempt and hedge holds its own slot of the global limiter
+            return get_llm_limiter().slot(prompt, source="geval")
+
+        # timeout / retries / hedging from the `retry` subsection, see services/llm_retry.py;
+        # only a call that failed after its retries counts towards opening the circuit
+        async with breaker.guard():
+            response = await resilient_call(
+                _request, source="geval", key=model, slot=_slot, **(self.config.get("retry") or {}),
             )
-            if not response or not response.choices:
-                raise ValueError("No choices returned from LLM response.")
+        if not response or not response.choices:
+            raise ValueError("No choices returned from LLM response.")
+        return response.choices[0]
+
+    async def call_llm(self, prompt: str, model: str) -> str:
+        temperature = self.config.get("temperature", 0.0)
+
+        async def _complete() -> str:
+            choice = await self._create_completion(prompt, model)
+            return choice.message.content.strip()
+
+        try:
+            # Deterministic (temperature 0) answers are served from services/llm_cache.py
+            return await cached_completion(model, temperature, prompt, _complete)
 
-            return response.choices[0].message.content.strip()
+        except Exception as e:
+            # chained so adaptive concurrency can see the 429/5xx status of the cause
+            raise RuntimeError(f"G-Eval LLM call failed: {e}") from e
+
+    async def score_llm(self, prompt: str, model: str) -> float:
+        """Score one prompt (1-100).
+
+        With a `scoring` section in the geval config the answer is capped at
+        `max_tokens` and, when `logprobs` is set, the score is the expected value
+        over the score token's top_logprobs. Backends that return no logprobs fall
+        back to _extract_score_from_output on the (short) text answer.
+        """
+        scoring = self.config.get("scoring") or {}
+        if not scoring:
+            return self._extract_score_from_output(await self.call_llm(prompt, model))
+
+        temperature = self.config.get("temperature", 0.0)
+        params = {"max_tokens": scoring.get("max_tokens", 5)}
+        if scoring.get("logprobs", False):
+            params.update(logprobs=True, top_logprobs=scoring.get("top_logprobs", 10))
+
+        async def _complete() -> str:
+            choice = await self._create_completion(prompt, model, **params)
+            score = expected_score_from_logprobs(getattr(choice, "logprobs", None)) if "logprobs" in params else None
+            if score is None:
+                score = self._extract_score_from_output(choice.message.content or "")
+            return f"{score:.4f}"
+
+        try:
+            # cached apart from full-text answers: the value is the computed score, not the reply
+            cache_model = f"{model}|score:{params['max_tokens']}:{params.get('top_logprobs', 0)}"
+            return float(await cached_completion(cache_model, temperature, prompt, _complete))
 
         except Exception as e:
-            raise RuntimeError(f"G-Eval LLM call failed: {e}")
+            raise RuntimeError(f"G-Eval LLM call failed: {e}") from e
 
 """
     Reads all key attributes (prompt_template, score_regex, score_title, score_code, etc.) from options
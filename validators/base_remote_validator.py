@@ -51,6 +51,7 @@ except ImportError:
 
 
 class BaseRemoteValidator(BaseValidator, ABC):
+    cacheable = False
     endpoint: str | None = None
 
     def __init__(self, *args, **kwargs):
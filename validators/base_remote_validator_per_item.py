@@ -9,7 +9,7 @@ tags: [abstract, remote]
 
 from abc import ABC
 from validators.base_validator import BaseValidator, ValidationDetail, MessagesItem
-from utils.async_utils import gather_with_semaphore
+from utils.async_utils import THROTTLE_STATUS_CODES, AdaptiveLimiter, ThrottledError, gather_with_semaphore
 import json
 import asyncio
 
@@ -29,6 +29,7 @@ except ImportError:
     pyfetch = None
 
 class BaseRemoteValidatorPerItem(BaseValidator, ABC):
+    cacheable = False
     endpoint: str | None = None
     
     def __init__(self, *args, **kwargs):
@@ -45,15 +46,34 @@ class BaseRemoteValidatorPerItem(BaseValidator, ABC):
 
         total = len(data)
         max_concurrency = self.options.get("max_concurrency", 10)
+        limiter = None
+        if self.options.get("adaptive_concurrency", False):
+            limiter = AdaptiveLimiter(
+                initial=max_concurrency,
+                max_limit=max(self.options.get("adaptive_max_concurrency", 100), max_concurrency),
+            )
         self.report_stage(f"validating {total} items remotely")
 
         completed = 0
 
+        async def fetch_item(idx: int, item: MessagesItem):
+            resp = await fetch_func(self.endpoint, {"dataset": [item.model_dump()], "index": idx, "options": self.options})
+            if limiter is not None and resp.status in THROTTLE_STATUS_CODES:
+                raise ThrottledError(status=resp.status, response=resp)
+            return resp
+
         async def validate_item(idx: int, item: MessagesItem) -> list[ValidationDetail]:
             nonlocal completed
             item_errors: list[ValidationDetail] = []
 
-            resp = await fetch_func(self.endpoint, {"dataset": [item.model_dump()], "index": idx, "options": self.options})
+            if limiter is None:
+                resp = await fetch_item(idx, item)
+            else:
+                try:
+                    resp = await limiter.call(lambda: fetch_item(idx, item))
+                except ThrottledError as e:
+                    # retries exhausted: report the last response like any other HTTP error
+                    resp = e.response
 
             if resp.status != 200:
                 try:
@@ -90,7 +110,11 @@ class BaseRemoteValidatorPerItem(BaseValidator, ABC):
             return item_errors
 
         coros = [validate_item(idx, item) for idx, item in enumerate(data)]
-        results = await gather_with_semaphore(coros, max_concurrency=max_concurrency)
+        if limiter is None:
+            results = await gather_with_semaphore(coros, max_concurrency=max_concurrency)
+        else:
+            # the limiter bounds the in-flight fetches
+            results = await asyncio.gather(*coros, return_exceptions=True)
 
         errors: list[ValidationDetail] = []
         for result in results:
@@ -9,8 +9,9 @@ tags: [abstract]
 
 import asyncio
 from abc import ABC
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import Any, Literal
-from pydantic import BaseModel, field_validator, model_validator, ValidationError
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator, ValidationError
 import time
 
 try:
@@ -19,6 +20,8 @@ except ImportError:
     JsProxy = None  # We're not in Pyodide
 
 class Message(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     role: str
     content: str
 
@@ -39,6 +42,8 @@ def _resolve_item_type(item) -> Literal["dialog", "trace"]:
 
 
 class MessagesItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     messages: list[Message]
     item_type: Literal["dialog", "trace"] | None = None
 
@@ -65,6 +70,59 @@ class MessagesItem(BaseModel):
                 raise ValueError("Each message must be a dict with 'role' and 'content'")
         return value
 
+class ParsedDataset(Sequence):
+    """Immutable, already-validated dataset shared by every gate of a request.
+
+    Built once at ingress and passed as-is to each validator's validate(),
+    which then skips re-parsing. Items are frozen MessagesItem instances.
+    Views derived from the whole dataset (e.g. GABRIEL's DataFrame) can be
+    memoized on it with memoized(), so gates of one request build them once.
+    """
+    __slots__ = ("_items", "_memo")
+
+    def __init__(self, items: Iterable[MessagesItem] = ()):
+        self._items: tuple[MessagesItem, ...] = tuple(items)
+        self._memo: dict[str, Any] = {}
+
+    @classmethod
+    def parse(cls, raw_items: Iterable[Any]) -> "ParsedDataset":
+        """Validate raw dicts/lists into MessagesItem. Raises pydantic.ValidationError."""
+        return cls(MessagesItem.model_validate(item) for item in raw_items)
+
+    @classmethod
+    def from_models(cls, items: Iterable[Any]) -> "ParsedDataset":
+        """Wrap already-validated models (e.g. schemas.validators.DataItem) without re-parsing."""
+        return cls(
+            MessagesItem.model_construct(
+                messages=[Message.model_construct(role=m.role, content=m.content) for m in item.messages],
+                item_type=getattr(item, "item_type", None),
+            )
+            for item in items
+        )
+
+    def memoized(self, key: str, build: Callable[["ParsedDataset"], Any]) -> Any:
+        """Return build(self), computed on the first call for `key` and shared afterwards.
+
+        The value is shared by every gate of the request: treat it as read-only.
+        """
+        if key not in self._memo:
+            self._memo[key] = build(self)
+        return self._memo[key]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ParsedDataset(self._items[index])
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[MessagesItem]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"ParsedDataset(n={len(self._items)})"
+
 class ValidationDetail(BaseModel):
     error: str
     index: int | None = None  # None for general errors not tied to an item
@@ -77,15 +135,26 @@ class ValidationDetail(BaseModel):
 ValidationErrorDetail = ValidationDetail
 
 class BaseValidator(ABC):
+    # True when results depend on the dataset as a whole (dedup, balance, ranking...).
+    # Such validators cannot be fed the dataset in independent chunks.
+    dataset_scoped: bool = False
+    # "thread" (default) or "process"; set from the `execution` frontmatter key.
+    # Process mode chunks the dataset across worker processes (ignored when dataset_scoped).
+    execution: str = "thread"
+    # Per-item results may be replayed from the result cache. Set False for
+    # gates whose output depends on external state (LLMs, network, remote).
+    # Dataset-scoped validators never use the cache.
+    cacheable: bool = True
 
     def __init__(self, options: dict[str, Any] = None, progress_callback=None):
         self.options = options or {}
         self.progress_callback = progress_callback
         self.validator_name = self.__class__.__name__
 
-    async def validate(self, js_data: "JsProxy | list[Any]") -> dict[str, Any]:
+    async def validate(self, js_data: "JsProxy | ParsedDataset | list[Any]") -> dict[str, Any]:
         """
-        Entry point for Pyodide: receives JsProxy or Python list
+        Entry point for Pyodide: receives JsProxy or Python list.
+        Backend callers pass a ParsedDataset to skip per-gate parsing.
         """
         if hasattr(js_data, "to_py"):
             raw_data = js_data.to_py()
@@ -95,19 +164,20 @@ class BaseValidator(ABC):
             start = time.time()
             self.report_stage("starting")
 
-            dataset = []
-            for item in raw_data:
+            if isinstance(raw_data, ParsedDataset):
+                # Parsed once at ingress and shared across gates
+                dataset = raw_data
+            else:
                 try:
-                    validated = MessagesItem.model_validate(item)
+                    dataset = ParsedDataset.parse(raw_data)
                 except ValidationError as e:
                     return {
                         "status": "failed",
                         "errors": str(e),
                         "validator": self.validator_name
                     }
-                dataset.append(validated)
 
-            results = await self._validate(dataset)
+            results = await self._validate_cached(dataset)
             self.report_stage(f"complete ({time.time() - start:.2f}s)")
 
             errors = [r for r in results if r.severity == "error"]
@@ -129,6 +199,15 @@ class BaseValidator(ABC):
                     "validator": self.__class__.__name__
                 }
 
+    async def _validate_cached(self, data: ParsedDataset) -> list[ValidationDetail]:
+        """Run _validate only on items missing from the per-item result cache."""
+        if JsProxy is None and self.cacheable and not self.dataset_scoped and len(data):
+            from services.result_cache import get_result_cache
+            cache = get_result_cache()
+            if cache is not None:
+                return await cache.validate_with_cache(self, data)
+        return await self._validate(data)
+
     def report_stage(self, stage_name: str):
         if self.progress_callback:
             try:
@@ -153,7 +232,7 @@ class BaseValidator(ABC):
                 pass
 
     def _validate_sync(self, data: list[MessagesItem]) -> list[ValidationDetail]:
-        """Override for CPU-bound validators. Called in a thread pool."""
+        """Override for CPU-bound validators. Called in a thread pool (or process pool, see execution)."""
         raise NotImplementedError("Override _validate_sync (CPU-bound) or _validate (IO-bound)")
 
     async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
@@ -163,4 +242,7 @@ class BaseValidator(ABC):
         """
         if JsProxy is not None:  # Pyodide — no threading
             return self._validate_sync(data)
+        if self.execution == "process" and not self.dataset_scoped:
+            from services.process_pool import run_in_process_pool
+            return await run_in_process_pool(self, data)
         return await asyncio.to_thread(self._validate_sync, data)
@@ -3,6 +3,7 @@
 title: Chat Structure Validator
 description: Checks message roles and order in a chat-style dataset.
 tags: [structure, pydantic, schema, gate1]
+execution: process
 ---
 """
 
@@ -10,6 +10,8 @@ from validators.base_validator import BaseValidator, ValidationDetail, MessagesI
 import json
 
 class DeduplicationValidator(BaseValidator):
+    dataset_scoped = True
+
     def _validate_sync(self, data: list[MessagesItem]) -> list[ValidationDetail]:
         seen = {}
         errors: list[ValidationDetail] = []
@@ -25,6 +25,8 @@ except ImportError:
     JsException = Exception
 
 class LinkAvailabilityValidator(BaseValidator):
+    cacheable = False  # link status changes over time
+
     async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
         max_concurrency = self.options.get("max_concurrency", 10)
 
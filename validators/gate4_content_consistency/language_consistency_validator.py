@@ -3,6 +3,7 @@
 title: Language & Encoding Consistency Validator
 description: Checks that request and response messages are in the same, valid language.
 tags: [language, encoding, gate4]
+execution: process
 options:
   expected_lang: en
   length_threshold: 20
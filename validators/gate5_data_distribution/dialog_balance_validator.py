@@ -21,6 +21,8 @@ from utils.vega_charts import vega_histogram
 import pandas as pd
 
 class DialogBalanceValidator(BaseValidator):
+    dataset_scoped = True
+
     async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
         errors: list[ValidationDetail] = []
 
@@ -15,6 +15,8 @@ doc:
 from validators.base_validator import BaseValidator, ValidationDetail, MessagesItem
 
 class QuantitySizeValidator(BaseValidator):
+    dataset_scoped = True
+
     async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
         errors: list[ValidationDetail] = []
         # Minimum number of dialogs required for training; default is 50.
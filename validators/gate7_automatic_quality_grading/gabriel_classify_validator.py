@@ -53,7 +53,8 @@ class GabrielClassifyValidator(BaseGabrielValidator):
             n_runs=n_runs,
             min_frequency=min_frequency,
             use_dummy=use_dummy,
-            reset_files=True,
+            reset_files=self.reset_files,
+            response_fn=self.response_fn,
         )
         return result_df
 
@@ -30,6 +30,8 @@ from validators.base_validator import MessagesItem, ValidationDetail
 class GabrielDiscoverValidator(BaseGabrielValidator):
     """Auto-discover quality patterns in assistant responses using GABRIEL codify."""
 
+    dataset_scoped = True
+
     async def _run_gabriel(
         self, df: pd.DataFrame, text_column: str, save_dir: str
     ) -> pd.DataFrame:
@@ -52,7 +54,8 @@ class GabrielDiscoverValidator(BaseGabrielValidator):
             use_dummy=use_dummy,
             max_words_per_call=max_words_per_call,
             additional_instructions=instructions,
-            reset_files=True,
+            reset_files=self.reset_files,
+            response_fn=self.response_fn,
         )
         return result_df
 
@@ -12,6 +12,10 @@ options:
   min_group_size: 3
   outlier_std_threshold: 1.5
   fail_on_outliers: true
+  group_concurrency: 4
+  adaptive_rounds: false
+  stability_threshold: 0.98
+  max_llm_calls: 0
   use_dummy: false
 doc:
   attributes: "Quality dimensions to rank on. Each key is an attribute name, value is its description for the LLM."
@@ -20,6 +24,10 @@ doc:
   min_group_size: "Minimum items per prompt group in grouped mode. Groups smaller than this are skipped."
   outlier_std_threshold: "Standard deviations below the leave-one-out mean to flag as outlier. Lower = more sensitive (1.5 = moderate, 3.0 = strict, 5.0 = extreme only)."
   fail_on_outliers: "When true, items ranked significantly below their group are reported as validation errors. When false, only ranking reports are emitted."
+  group_concurrency: "Maximum prompt groups ranked at the same time in grouped mode."
+  adaptive_rounds: "When true, rounds are run one at a time (up to n_rounds) and ranking stops once the order stops changing. The report then shows the rounds used and each item's remaining uncertainty (±standard error)."
+  stability_threshold: "Adaptive mode: stop when the Spearman correlation between the rankings of two consecutive rounds reaches this value (1.0 = identical order)."
+  max_llm_calls: "Adaptive mode: hard budget of estimated LLM calls per ranking (initial rating pass + pairwise comparisons). No round starts that would exceed it, and a ranking whose first round alone would is reported as an error without any LLM call; 0 = no budget beyond n_rounds."
   use_dummy: "When true, uses synthetic scores instead of real LLM calls. For testing only."
 ---
 """
@@ -42,6 +50,14 @@ Always outputs a ranking report per group (or whole dataset):
   - outlier_std_threshold: 1.5 — "flag if noticeably worse than the rest" (catches moderate outliers)
   - outlier_std_threshold: 3.0 — "flag only if clearly bad" (stricter, fewer flags)
   - outlier_std_threshold: 5.0 — "flag only extreme cases"
+
+  With adaptive_rounds: true, rounds are issued one at a time and stop once two
+  consecutive rankings agree (stability_threshold) or max_llm_calls would be
+  exceeded; the report header shows the rounds used and each line the item's
+  standard error, rescaled from the raw Bradley–Terry scale to the z-score
+  units of the score (SE / std of {attr}_raw):
+    Ranking (adaptive: 3/5 rounds, rank stability 0.991, ~420 LLM calls)
+      #1 item[12] score=1.31 ±0.12 (overall_quality=1.31)
 """
 
 import os
@@ -49,9 +65,23 @@ import os
 import numpy as np
 import pandas as pd
 
+from utils.async_utils import gather_with_semaphore
 from validators.base_gabriel_validator import BaseGabrielValidator, gabriel
 from validators.base_validator import MessagesItem, ValidationDetail
 
+# Pairings per item and round in adaptive mode (GABRIEL's rank() default),
+# used to estimate the LLM calls a round costs.
+_MATCHES_PER_ROUND = 3
+
+
+def rank_stability(previous: pd.Series, current: pd.Series) -> float:
+    """Spearman correlation between two score Series over the same index (1.0 = same order)."""
+    a = previous.reindex(current.index).rank().to_numpy(dtype=float)
+    b = current.rank().to_numpy(dtype=float)
+    if a.std() == 0 or b.std() == 0:
+        return 1.0 if np.array_equal(a, b) else 0.0
+    return float(np.corrcoef(a, b)[0, 1])
+
 
 class GabrielRankValidator(BaseGabrielValidator):
     """Compare assistant responses via GABRIEL pairwise ranking.
@@ -64,9 +94,17 @@ class GabrielRankValidator(BaseGabrielValidator):
     and ranks within each group independently.
     """
 
+    dataset_scoped = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # adaptive_rounds: group label (None in flat mode) → rounds used, stability, LLM calls
+        self._round_stats: dict[str | None, dict] = {}
+
     async def _run_gabriel(
         self, df: pd.DataFrame, text_column: str, save_dir: str
     ) -> pd.DataFrame:
+        self._round_stats = {}
         min_items = self.options.get("min_items", 5)
         min_group_size = self.options.get("min_group_size", 3)
         attributes = self.options.get("attributes", {
@@ -96,16 +134,74 @@ class GabrielRankValidator(BaseGabrielValidator):
         # so extra rounds just re-compare the same matchups.
         effective_rounds = min(n_rounds, max(1, len(df) - 1))
 
-        result_df = await gabriel.rank(
+        return await self._rank(df, text_column, save_dir, attributes, effective_rounds, model, use_dummy)
+
+    async def _rank(
+        self,
+        df: pd.DataFrame,
+        text_column: str,
+        save_dir: str,
+        attributes: dict,
+        n_rounds: int,
+        model: str,
+        use_dummy: bool,
+        label: str | None = None,
+    ) -> pd.DataFrame:
+        """gabriel.rank with n_rounds, or round by round until the order settles (adaptive_rounds)."""
+        rank_kwargs = dict(
             df=df,
             column_name=text_column,
             attributes=attributes,
             save_dir=save_dir,
             model=model,
-            n_rounds=effective_rounds,
             use_dummy=use_dummy,
-            reset_files=True,
+            response_fn=self.response_fn,
         )
+        if not self.options.get("adaptive_rounds", False):
+            return await gabriel.rank(n_rounds=n_rounds, reset_files=self.reset_files, **rank_kwargs)
+
+        stability_threshold = self.options.get("stability_threshold", 0.98)
+        max_llm_calls = self.options.get("max_llm_calls", 0)
+        calls_per_round = -(-len(df) * _MATCHES_PER_ROUND // 2)
+        attr_names = list(attributes)
+
+        calls = len(df)  # initial rating pass
+        rounds = 0
+        stability = None
+        previous = None
+        result_df = None
+        if max_llm_calls and calls + calls_per_round > max_llm_calls:
+            raise ValueError(
+                f"max_llm_calls={max_llm_calls} is below the ~{calls + calls_per_round} LLM calls "
+                f"of a single ranking round over {len(df)} items "
+                f"({calls} rating + {calls_per_round} comparisons); nothing was ranked"
+            )
+        while rounds < n_rounds:
+            if max_llm_calls and calls + calls_per_round > max_llm_calls:
+                break
+            rounds += 1
+            # Same save_dir with a higher n_rounds: GABRIEL picks up after the rounds it saved
+            result_df = await gabriel.rank(
+                n_rounds=rounds,
+                matches_per_round=_MATCHES_PER_ROUND,
+                return_raw_scores=True,
+                reset_files=self.reset_files and rounds == 1,
+                **rank_kwargs,
+            )
+            calls += calls_per_round
+            scores = result_df.set_index("item_index")[attr_names].mean(axis=1)
+            if previous is not None:
+                stability = rank_stability(previous, scores)
+                if stability >= stability_threshold:
+                    break
+            previous = scores
+
+        self._round_stats[label] = {
+            "rounds": rounds,
+            "max_rounds": n_rounds,
+            "stability": stability,
+            "llm_calls": calls,
+        }
         return result_df
 
     async def _run_grouped(
@@ -120,15 +216,12 @@ class GabrielRankValidator(BaseGabrielValidator):
         use_dummy: bool,
         min_group_size: int,
     ) -> pd.DataFrame:
-        """Rank within each prompt group, then reassemble."""
-        all_results = []
-
-        for group_idx, prompt in enumerate(group_prompts):
-            group_df = df[df["user_text"] == prompt].copy()
-
-            if len(group_df) < min_group_size:
-                continue
+        """Rank prompt groups concurrently (up to group_concurrency at once), then reassemble in group order."""
+        group_concurrency = self.options.get("group_concurrency", 4)
+        finished = 0
 
+        async def _rank_group(group_idx: int, prompt: str, group_df: pd.DataFrame) -> pd.DataFrame:
+            nonlocal finished
             group_save_dir = os.path.join(save_dir, f"group_{group_idx}")
             os.makedirs(group_save_dir, exist_ok=True)
 
@@ -136,23 +229,30 @@ class GabrielRankValidator(BaseGabrielValidator):
             # the same pairs when the group is small.
             effective_rounds = min(n_rounds, max(1, len(group_df) - 1))
 
-            group_result = await gabriel.rank(
-                df=group_df.reset_index(drop=True),
-                column_name=text_column,
-                attributes=attributes,
-                save_dir=group_save_dir,
-                model=model,
-                n_rounds=effective_rounds,
-                use_dummy=use_dummy,
-                reset_files=True,
+            group_result = await self._rank(
+                group_df.reset_index(drop=True), text_column, group_save_dir,
+                attributes, effective_rounds, model, use_dummy, label=prompt,
             )
 
             # Restore original item_index
             group_result["item_index"] = group_df["item_index"].values[:len(group_result)]
             group_result["_rank_group"] = prompt
-            all_results.append(group_result)
 
-            self.report_progress(group_idx + 1, len(group_prompts))
+            finished += 1
+            self.report_progress(finished, len(coros))
+            return group_result
+
+        coros = []
+        for group_idx, prompt in enumerate(group_prompts):
+            group_df = df[df["user_text"] == prompt].copy()
+            if len(group_df) < min_group_size:
+                continue
+            coros.append(_rank_group(group_idx, prompt, group_df))
+
+        all_results = await gather_with_semaphore(coros, max_concurrency=group_concurrency)
+        for result in all_results:
+            if isinstance(result, BaseException):
+                raise result
 
         if not all_results:
             raise ValueError(
@@ -202,21 +302,42 @@ class GabrielRankValidator(BaseGabrielValidator):
         group_label: str | None = None,
     ) -> str:
         """Build a human-readable ranking table for a set of items."""
-        df = df.copy()
-        df["_avg_score"] = df[available_attrs].mean(axis=1)
-        ranked = df.sort_values("_avg_score", ascending=False)
+        avg_scores = df[available_attrs].mean(axis=1).reset_index(drop=True)
+        order = avg_scores.sort_values(ascending=False).index.to_numpy()
+        item_indices = df["item_index"].to_numpy()[order].astype(int)
+        attr_values = df[available_attrs].to_numpy(dtype=float)[order]
+        # Bradley–Terry standard errors (adaptive mode asks GABRIEL for them) are on
+        # the raw scale; {attr} is z-scored with the std of {attr}_raw, so divide by it
+        se_z = []
+        for a in available_attrs:
+            if f"{a}_se" in df.columns and f"{a}_raw" in df.columns:
+                raw_std = df[f"{a}_raw"].astype(float).std(ddof=0)
+                if raw_std > 0:
+                    se_z.append(df[f"{a}_se"].astype(float) / raw_std)
+        if se_z:
+            uncertainty = pd.concat(se_z, axis=1).mean(axis=1).to_numpy(dtype=float)[order]
+        else:
+            uncertainty = np.full(len(order), np.nan)
 
         header = "Ranking"
         if group_label:
             snippet = group_label[:80]
             header = f"Ranking for \"{snippet}\""
+        stats = self._round_stats.get(group_label)
+        if stats:
+            stability = "n/a" if stats["stability"] is None else f"{stats['stability']:.3f}"
+            header += (
+                f" (adaptive: {stats['rounds']}/{stats['max_rounds']} rounds, "
+                f"rank stability {stability}, ~{stats['llm_calls']} LLM calls)"
+            )
 
         lines = [header]
-        for rank_pos, (_, row) in enumerate(ranked.iterrows(), 1):
-            idx = int(row["item_index"])
-            score = row["_avg_score"]
-            detail = ", ".join(f"{a}={float(row[a]):.2f}" for a in available_attrs)
-            lines.append(f"  #{rank_pos} item[{idx}] score={score:.2f} ({detail})")
+        for rank_pos, (idx, score, se, values) in enumerate(
+            zip(item_indices, avg_scores.to_numpy()[order], uncertainty, attr_values), 1
+        ):
+            detail = ", ".join(f"{a}={v:.2f}" for a, v in zip(available_attrs, values))
+            spread = "" if np.isnan(se) else f" ±{se:.2f}"
+            lines.append(f"  #{rank_pos} item[{idx}] score={score:.2f}{spread} ({detail})")
 
         return "\n".join(lines)
 
@@ -235,10 +356,12 @@ class GabrielRankValidator(BaseGabrielValidator):
         This is robust to small groups where a single outlier would
         otherwise inflate the overall std and mask itself.
 
+        The leave-one-out statistics come from the group's sum and sum of
+        squares minus the item's own share, so the whole pass is O(n).
+
         Returns list of (item_index, score, loo_mean, loo_std, score_detail).
         """
-        scores = df[available_attrs].mean(axis=1)
-        score_values = scores.values
+        score_values = df[available_attrs].mean(axis=1).to_numpy(dtype=float)
         n = len(score_values)
 
         if n < 3:
@@ -247,26 +370,28 @@ class GabrielRankValidator(BaseGabrielValidator):
         # Minimum absolute gap to consider meaningful (z-scores are ~[-3, 3])
         min_gap = 0.1
 
-        outliers = []
-        for i, (row_idx, row) in enumerate(df.iterrows()):
-            item_score = float(score_values[i])
-            others = np.concatenate([score_values[:i], score_values[i + 1:]])
-            loo_mean = others.mean()
-            loo_std = others.std()
-
-            gap = loo_mean - item_score
-            if gap <= min_gap:
-                continue
-
-            if loo_std == 0 or np.isnan(loo_std):
-                # All other items have identical scores — any meaningful gap is an outlier
-                detail = ", ".join(f"{a}={float(row[a]):.2f}" for a in available_attrs)
-                outliers.append((int(row["item_index"]), item_score, loo_mean, 0.0, detail))
-                continue
+        # Center first so the sum-of-squares subtraction doesn't lose precision
+        centered = score_values - score_values.mean()
+        loo_sum = centered.sum() - centered
+        loo_sq_sum = (centered ** 2).sum() - centered ** 2
+        loo_centered_mean = loo_sum / (n - 1)
+        loo_std = np.sqrt(np.maximum(loo_sq_sum / (n - 1) - loo_centered_mean ** 2, 0.0))
+        loo_mean = loo_centered_mean + score_values.mean()
+
+        gap = loo_mean - score_values
+        # loo_std == 0: all other items have identical scores — any meaningful gap is an outlier
+        flagged = (gap > min_gap) & (
+            (loo_std == 0) | (score_values < loo_mean - threshold * loo_std)
+        )
 
-            if item_score < loo_mean - threshold * loo_std:
-                detail = ", ".join(f"{a}={float(row[a]):.2f}" for a in available_attrs)
-                outliers.append((int(row["item_index"]), item_score, loo_mean, loo_std, detail))
+        item_indices = df["item_index"].to_numpy()
+        attr_values = df[available_attrs].to_numpy(dtype=float)
+        outliers = []
+        for i in np.flatnonzero(flagged):
+            detail = ", ".join(f"{a}={v:.2f}" for a, v in zip(available_attrs, attr_values[i]))
+            outliers.append((
+                int(item_indices[i]), float(score_values[i]), float(loo_mean[i]), float(loo_std[i]), detail,
+            ))
 
         return outliers
 
@@ -20,6 +20,7 @@ doc:
 ---
 """
 
+import numpy as np
 import pandas as pd
 
 from utils.vega_charts import vega_histogram
@@ -50,7 +51,8 @@ class GabrielRateValidator(BaseGabrielValidator):
             model=model,
             n_runs=n_runs,
             use_dummy=use_dummy,
-            reset_files=True,
+            reset_files=self.reset_files,
+            response_fn=self.response_fn,
         )
         return result_df
 
@@ -77,28 +79,28 @@ class GabrielRateValidator(BaseGabrielValidator):
                 )
             ]
 
-        all_avg_scores = []
+        if "item_index" in result_df.columns:
+            item_indices = result_df["item_index"].to_numpy()
+        else:
+            item_indices = result_df.index.to_numpy()
+        attr_values = result_df[available_attrs].to_numpy(dtype=float)
+        all_avg_scores = attr_values.mean(axis=1)
 
-        for row_idx, row in result_df.iterrows():
-            item_index = int(row.get("item_index", row_idx))
-            scores = {attr: float(row[attr]) for attr in available_attrs}
-            avg_score = sum(scores.values()) / len(scores)
-            all_avg_scores.append(avg_score)
-
-            if avg_score < threshold:
-                breakdown = ", ".join(f"{a}={scores[a]:.1f}" for a in available_attrs)
-                errors.append(
-                    ValidationDetail(
-                        index=item_index,
-                        error=f"Quality score too low (avg={avg_score:.1f} < {threshold}). Breakdown: {breakdown}",
-                        code="low_gabriel_score",
-                    )
+        for i in np.flatnonzero(all_avg_scores < threshold):
+            avg_score = all_avg_scores[i]
+            breakdown = ", ".join(f"{a}={v:.1f}" for a, v in zip(available_attrs, attr_values[i]))
+            errors.append(
+                ValidationDetail(
+                    index=int(item_indices[i]),
+                    error=f"Quality score too low (avg={avg_score:.1f} < {threshold}). Breakdown: {breakdown}",
+                    code="low_gabriel_score",
                 )
+            )
 
-            self.report_progress(int(row_idx) + 1, len(result_df))
+        self.report_progress(len(result_df), len(result_df))
 
         # Attach histogram on failures
-        if errors and all_avg_scores:
+        if errors and len(all_avg_scores):
             errors.append(
                 ValidationDetail(
                     index=None,
@@ -106,7 +108,7 @@ class GabrielRateValidator(BaseGabrielValidator):
                     error=f"GABRIEL Quality Score Distribution (n={len(all_avg_scores)})",
                     severity="info",
                     chart=vega_histogram(
-                        all_avg_scores,
+                        all_avg_scores.tolist(),
                         title="GABRIEL Quality Score Distribution",
                         threshold=threshold,
                     ),
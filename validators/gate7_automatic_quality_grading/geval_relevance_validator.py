@@ -6,9 +6,29 @@ tags: [semantic, relevance, geval, gate7]
 options:
   score_threshold: 70
   preview_limit: 3
+  max_concurrency: 10
+  adaptive_concurrency: false
+  adaptive_max_concurrency: 100
+  early_stopping: false
+  early_stopping_min_pairs: 3
+  early_stopping_wave: 2
+  early_stopping_min_samples: 5
+  early_stopping_score_resolution: 10
+  batch_size: 1
+  batch_token_budget: 2000
 doc:
   score_threshold: "Minimum relevance score (0-100). Items scoring below this are flagged as irrelevant."
   preview_limit: "Number of low-scoring items to include in the error preview for quick inspection."
+  max_concurrency: "Maximum number of concurrent LLM calls."
+  adaptive_concurrency: "Adjust concurrency at runtime (AIMD): start at max_concurrency, grow while LLM latency is stable, back off and retry on 429/5xx or rising latency."
+  adaptive_max_concurrency: "Upper bound on concurrent LLM calls when adaptive_concurrency is on."
+  early_stopping: "Score dialog pairs in waves and stop an item once a 95% confidence bound on its running average is clearly above or below score_threshold. Reported averages are then estimates; ignored in info_mode."
+  early_stopping_min_pairs: "Pairs scored per item in the first wave, before any stopping decision."
+  early_stopping_wave: "Additional pairs scored per undecided item in each following wave."
+  early_stopping_min_samples: "Scored pairs an item needs before it may stop early."
+  early_stopping_score_resolution: "Step size the judge's scores effectively move in; floors the score variance at step²/12 so identical scores still give a non-zero confidence bound."
+  batch_size: "Dialog pairs packed into one judge prompt as numbered slots scored in a single JSON answer (1 = one call per pair). Slots that fail to parse are re-scored individually."
+  batch_token_budget: "Upper bound on the estimated tokens of a batched prompt; batches are cut short to stay within it."
 ---
 """
 
@@ -18,20 +18,36 @@ options:
   score_threshold: 70
   preview_limit: 3
   max_concurrency: 10
+  single_call: false
+  adaptive_concurrency: false
+  adaptive_max_concurrency: 100
 doc:
   rubric: "Scoring rubric as a dict. Each key is a criterion name, value is an object with 'description' (what to evaluate) and 'weight' (relative importance). Weights are automatically normalized to sum to 1."
   score_threshold: "Minimum weighted composite score (0–100). Items scoring below this are flagged."
   preview_limit: "Number of low-scoring dialog turns to include in the error preview."
   max_concurrency: "Maximum number of concurrent LLM calls."
+  adaptive_concurrency: "Adjust concurrency at runtime (AIMD): start at max_concurrency, grow while LLM latency is stable, back off and retry on 429/5xx or rising latency."
+  adaptive_max_concurrency: "Upper bound on concurrent LLM calls when adaptive_concurrency is on."
+  single_call: "Score all criteria in one LLM call per pair (or trace) returning a JSON object of scores. Falls back to one call per criterion when the answer cannot be parsed."
 ---
 """
 
 import html
+import json
 from collections import defaultdict
+from typing import Any
 
-from utils.async_utils import gather_with_semaphore
+from services.llm_breaker import CircuitOpenError, get_llm_breaker, is_circuit_open_error
+from utils.async_utils import gather_unique
 from utils.vega_charts import vega_histogram
-from validators.base_geval_validator import BaseGEvalValidator, _format_trace
+from validators.base_geval_validator import (
+    BaseGEvalValidator,
+    _format_trace,
+    borderline_items,
+    cascade_detail,
+    llm_calls_saved_detail,
+    llm_unavailable_detail,
+)
 from validators.base_validator import MessagesItem, ValidationDetail, _resolve_item_type
 
 _CRITERION_PROMPT = (
@@ -44,6 +60,51 @@ _CRITERION_PROMPT = (
     "Only respond with a number from 1 to 100."
 )
 
+_MULTI_CRITERION_PROMPT = (
+    "You are an objective evaluator.\n\n"
+    "Evaluate the following on each of these criteria:\n"
+    "{criteria}\n\n"
+    "Score each criterion from 1 (very poor) to 100 (excellent).\n\n"
+    "{content}\n\n"
+    "Only respond with a JSON object of this exact shape, no other text:\n"
+    "{shape}"
+)
+
+
+def _build_multi_criterion_prompt(criteria: dict[str, dict], content: str) -> str:
+    listing = "\n".join(f"- {name}: {crit['description']}" for name, crit in criteria.items())
+    shape = "{" + ", ".join(f"{json.dumps(name)}: <1-100>" for name in criteria) + "}"
+    return _MULTI_CRITERION_PROMPT.format(criteria=listing, content=content, shape=shape)
+
+
+def _parse_criterion_scores(raw_output: str, criteria: dict[str, dict]) -> dict[str, float] | None:
+    """
+    Parse a JSON object of {criterion: score} from a multi-criterion answer.
+
+    Tolerates surrounding prose or code fences. Returns None unless every
+    criterion has a numeric score in 1..100.
+    """
+    start, end = raw_output.find("{"), raw_output.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        parsed = json.loads(raw_output[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+
+    scores: dict[str, float] = {}
+    for name in criteria:
+        try:
+            score = float(parsed[name])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not 1 <= score <= 100:
+            return None
+        scores[name] = score
+    return scores
+
 
 def _normalize_rubric(raw: dict) -> dict[str, dict]:
     """
@@ -82,6 +143,10 @@ class GEvalRubricValidator(BaseGEvalValidator):
       - "trace" items (contain system/tool/function messages): one LLM call per criterion over the full trace.
 
     Both paths feed the same weighted composite scoring and threshold check.
+
+    With `single_call: true` all criteria are scored in one call per pair (or trace)
+    that returns a JSON object; contents whose answer cannot be parsed are re-scored
+    with the per-criterion prompts.
     """
 
     async def _validate(self, data: list[MessagesItem]) -> list[ValidationDetail]:
@@ -105,14 +170,16 @@ class GEvalRubricValidator(BaseGEvalValidator):
         threshold = self.options.get("score_threshold", 70)
         preview_limit = self.options.get("preview_limit", 3)
         max_concurrency = self.options.get("max_concurrency", 10)
+        adaptive = self.options.get("adaptive_concurrency", False)
+        max_limit = self.options.get("adaptive_max_concurrency", 100)
         info_mode = self.options.get("info_mode", False)
+        single_call = self.options.get("single_call", False)
         model = self.config.get("model", "gpt-4")
 
         criteria = _normalize_rubric(raw_rubric)
 
-        # ── Phase 1: collect (item_idx, crit_name, prompt) ───────────────────
-        # dialog: one call per (criterion × pair); trace: one call per criterion.
-        calls: list[tuple[int, str, str]] = []
+        # ── Phase 1: collect (item_idx, content) — one per pair (dialog) or per item (trace) ──
+        contents: list[tuple[int, str]] = []
         # item_idx → ("dialog", pairs) | ("trace", trace_str)
         item_meta: dict[int, tuple[str, Any]] = {}
 
@@ -122,12 +189,7 @@ class GEvalRubricValidator(BaseGEvalValidator):
             if itype == "trace":
                 trace_str = _format_trace(item.messages)
                 item_meta[idx] = ("trace", trace_str)
-                content = f"Trace:\n{trace_str}"
-                for crit_name, crit in criteria.items():
-                    prompt = _CRITERION_PROMPT.format(
-                        criterion=crit_name, description=crit["description"], content=content,
-                    )
-                    calls.append((idx, crit_name, prompt))
+                contents.append((idx, f"Trace:\n{trace_str}"))
             else:
                 pairs = [
                     (item.messages[i - 1].content, item.messages[i].content)
@@ -141,30 +203,103 @@ class GEvalRubricValidator(BaseGEvalValidator):
                     continue
                 item_meta[idx] = ("dialog", pairs)
                 for u, a in pairs:
-                    content = f"User:\n{u}\n\nAssistant:\n{a}"
-                    for crit_name, crit in criteria.items():
-                        prompt = _CRITERION_PROMPT.format(
-                            criterion=crit_name, description=crit["description"], content=content,
-                        )
-                        calls.append((idx, crit_name, prompt))
-
-        # ── Phase 2: fire all LLM calls concurrently ─────────────────────────
-        async def _call(prompt: str) -> float:
-            raw = await self.call_llm(prompt, model)
-            return self._extract_score_from_output(raw)
-
-        coros = [_call(prompt) for _, _, prompt in calls]
-        raw_results = await gather_with_semaphore(coros, max_concurrency=max_concurrency)
-
-        # ── Phase 3: regroup scores by item → criterion (as list for averaging) ─
-        scores_by_item: dict[int, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
-        error_by_item: dict[int, Exception] = {}
-
-        for (item_idx, crit_name, _), result in zip(calls, raw_results):
-            if isinstance(result, BaseException):
-                error_by_item.setdefault(item_idx, result)
-            else:
-                scores_by_item[item_idx][crit_name].append(result)
+                    contents.append((idx, f"User:\n{u}\n\nAssistant:\n{a}"))
+
+        # Backend known to be down: fail the gate at once instead of per-item timeouts
+        try:
+            if contents:
+                get_llm_breaker().check()
+        except CircuitOpenError as e:
+            return errors + [llm_unavailable_detail(e)]
+
+        gather_kwargs = {"max_concurrency": max_concurrency, "adaptive": adaptive, "max_limit": max_limit}
+        # identical prompts (repeated pairs across items) are sent once and fanned out
+        calls_total = calls_saved = 0
+
+        async def _score(
+            contents: list[tuple[int, str]], tier: str, tier_model: str,
+        ) -> tuple[dict[int, dict[str, list[float]]], dict[int, Exception]]:
+            nonlocal calls_total, calls_saved
+            llm = self._tier_llm(tier, tier_model, tiers)
+            score_fn = self._tier_llm(tier, tier_model, tiers, self.score_llm)
+            scores_by_item: dict[int, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+            error_by_item: dict[int, Exception] = {}
+
+            # ── Phase 2 (single_call): one call per content, JSON object of all criteria ─
+            if single_call:
+                async def _call_all(content: str) -> dict[str, float] | None:
+                    raw = await llm(_build_multi_criterion_prompt(criteria, content))
+                    return _parse_criterion_scores(raw, criteria)
+
+                raw_results, saved = await gather_unique(
+                    [content for _, content in contents], _call_all, **gather_kwargs,
+                )
+                calls_total += len(contents)
+                calls_saved += saved
+
+                unparsed: list[tuple[int, str]] = []
+                for (item_idx, content), result in zip(contents, raw_results):
+                    if isinstance(result, BaseException):
+                        error_by_item.setdefault(item_idx, result)
+                    elif result is None:
+                        unparsed.append((item_idx, content))
+                    else:
+                        for crit_name, score in result.items():
+                            scores_by_item[item_idx][crit_name].append(score)
+                # Fall back to per-criterion scoring where the JSON answer was unusable
+                contents = unparsed
+
+            # ── Phase 3: per-criterion calls — dialog: criterion × pair; trace: criterion ─
+            calls: list[tuple[int, str, str]] = [
+                (item_idx, crit_name, _CRITERION_PROMPT.format(
+                    criterion=crit_name, description=crit["description"], content=content,
+                ))
+                for item_idx, content in contents
+                for crit_name, crit in criteria.items()
+            ]
+
+            raw_results, saved = await gather_unique([prompt for _, _, prompt in calls], score_fn, **gather_kwargs)
+            calls_total += len(calls)
+            calls_saved += saved
+
+            # regroup scores by item → criterion (as list for averaging)
+            for (item_idx, crit_name, _), result in zip(calls, raw_results):
+                if isinstance(result, BaseException):
+                    error_by_item.setdefault(item_idx, result)
+                else:
+                    scores_by_item[item_idx][crit_name].append(result)
+            return scores_by_item, error_by_item
+
+        def _composite(crit_scores: dict[str, list[float]]) -> tuple[float, dict[str, float]]:
+            per_crit_avg = {
+                name: (sum(crit_scores[name]) / len(crit_scores[name]) if crit_scores.get(name) else 0.0)
+                for name in criteria
+            }
+            return sum(per_crit_avg[name] * criteria[name]["weight"] for name in criteria), per_crit_avg
+
+        cascade = self.cascade
+        tiers: dict[str, dict] = {}
+        first_tier, first_model = ("fast", cascade["model"]) if cascade else ("judge", model)
+        scores_by_item, error_by_item = await _score(contents, first_tier, first_model)
+        tiers[first_tier]["items"] = len(item_meta)
+
+        # ── Cascade: re-score items whose cheap composite is borderline with the judge model ─
+        if cascade and contents:
+            composites = {
+                idx: _composite(crit_scores)[0]
+                for idx, crit_scores in scores_by_item.items()
+                if crit_scores and idx not in error_by_item
+            }
+            escalate = borderline_items(composites, error_by_item, threshold, cascade.get("band", 10))
+            judge_scores, judge_errors = await _score(
+                [(idx, content) for idx, content in contents if idx in escalate], "judge", model,
+            )
+            tiers["judge"]["items"] = len(escalate)
+            for idx in escalate:
+                scores_by_item[idx] = judge_scores.get(idx, {})
+                error_by_item.pop(idx, None)
+                if idx in judge_errors:
+                    error_by_item[idx] = judge_errors[idx]
 
         # ── Phase 4: weighted composite + threshold ───────────────────────────
         all_composite_scores: list[float] = []
@@ -175,7 +310,8 @@ class GEvalRubricValidator(BaseGEvalValidator):
 
             if idx in error_by_item:
                 errors.append(ValidationDetail(
-                    index=idx, error=f"Evaluation failed: {error_by_item[idx]}", code="eval_error",
+                    index=idx, error=f"Evaluation failed: {error_by_item[idx]}",
+                    code="llm_unavailable" if is_circuit_open_error(error_by_item[idx]) else "eval_error",
                 ))
                 continue
 
@@ -183,11 +319,7 @@ class GEvalRubricValidator(BaseGEvalValidator):
             if not crit_scores:
                 continue
 
-            per_crit_avg: dict[str, float] = {
-                name: (sum(crit_scores[name]) / len(crit_scores[name]) if crit_scores.get(name) else 0.0)
-                for name in criteria
-            }
-            composite = sum(per_crit_avg[name] * criteria[name]["weight"] for name in criteria)
+            composite, per_crit_avg = _composite(crit_scores)
             all_composite_scores.append(composite)
 
             breakdown = ", ".join(
@@ -234,6 +366,11 @@ class GEvalRubricValidator(BaseGEvalValidator):
                 ),
             ))
 
+        if cascade and contents:
+            errors.append(cascade_detail(tiers))
+        if calls_saved:
+            errors.append(llm_calls_saved_detail(calls_saved, calls_total))
+
         return errors
 
 
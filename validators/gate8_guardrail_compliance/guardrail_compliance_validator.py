@@ -3,6 +3,7 @@
 title: Guardrail Compliance Validator
 description: Checks dialogs for toxic/offensive content and potential PII using better-profanity and scrubadub.
 tags: [guardrails, toxicity, pii, safety, gate8]
+execution: process
 ---
 """
 